@@ -96,9 +96,8 @@ def main():
                 if not peers:
                     print("No known peers yet. Wait for announces or send one with 'a'")
                 else:
-                    for addr_hex, identity in peers.items():
-                        dest_addr = bytes.fromhex(addr_hex)
-                        print(f"Sending to {addr_hex[:16]}...")
+                    for dest_addr, identity in peers.items():
+                        print(f"Sending to {dest_addr.hex()[:16]}...")
                         node.send_data(dest_addr, message.encode('utf-8'))
             else:
                 print("Unknown command")
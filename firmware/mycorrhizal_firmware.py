@@ -600,13 +600,12 @@ def handle_command(cmd, node, lora, ble, colony_callback=None):
             return
 
         count = 0
-        for addr_hex in peers:
+        for dest_addr in peers:
             try:
-                dest_addr = bytes.fromhex(addr_hex)
                 node.send_data(dest_addr, message.encode('utf-8'))
                 count += 1
             except Exception as e:
-                send_to_clients(f"ERROR:Failed to send to {addr_hex[:8]}: {e}", ble)
+                send_to_clients(f"ERROR:Failed to send to {dest_addr.hex()[:8]}: {e}", ble)
 
         send_to_clients(f"BROADCAST:{count} peers", ble)
 
@@ -617,8 +616,8 @@ def handle_command(cmd, node, lora, ble, colony_callback=None):
             send_to_clients("PEERS:0", ble)
         else:
             send_to_clients(f"PEERS:{len(peers)}", ble)
-            for addr_hex in peers:
-                send_to_clients(f"PEER:{addr_hex}", ble)
+            for addr in peers:
+                send_to_clients(f"PEER:{addr.hex()}", ble)
 
     # GROUP CHAT COMMANDS
 
@@ -10,6 +10,13 @@ from ..crypto.identity import PublicIdentity
 from ..platform.detection import get_profile
 
 
+def _address_key(address):
+    """Normalize an address (bytes or hex string) to a bytes cache key"""
+    if isinstance(address, str):
+        return bytes.fromhex(address)
+    return bytes(address)
+
+
 class IdentityCache:
     """
     Cache of discovered public identities.
@@ -25,7 +32,7 @@ class IdentityCache:
         """Initialize identity cache"""
         self.profile = get_profile()
 
-        # Cache: address -> (PublicIdentity, timestamp, interface)
+        # Cache: address bytes -> (PublicIdentity, timestamp, interface)
         self.identities = {}
 
         # Max entries based on platform capability
@@ -40,7 +47,7 @@ class IdentityCache:
             public_identity: PublicIdentity object
             receiving_interface: Phycore that received the announce (for return path)
         """
-        address_key = address.hex()
+        address_key = bytes(address)
 
         # If cache is full, remove oldest entry
         if len(self.identities) >= self.max_entries and address_key not in self.identities:
@@ -63,10 +70,7 @@ class IdentityCache:
         Returns:
             PublicIdentity or None if not found
         """
-        if isinstance(address, bytes):
-            address_key = address.hex()
-        else:
-            address_key = address
+        address_key = _address_key(address)
 
         entry = self.identities.get(address_key)
         if entry:
@@ -84,10 +88,7 @@ class IdentityCache:
         Returns:
             Phycore or None
         """
-        if isinstance(address, bytes):
-            address_key = address.hex()
-        else:
-            address_key = address
+        address_key = _address_key(address)
 
         entry = self.identities.get(address_key)
         if entry:
@@ -96,10 +97,7 @@ class IdentityCache:
 
     def has(self, address):
         """Check if we have an identity for this address"""
-        if isinstance(address, bytes):
-            address_key = address.hex()
-        else:
-            address_key = address
+        address_key = _address_key(address)
         return address_key in self.identities
 
     def _evict_oldest(self):
@@ -112,7 +110,12 @@ class IdentityCache:
         del self.identities[oldest_key]
 
     def get_all(self):
-        """Get all cached identities"""
+        """
+        Get all cached identities.
+
+        Returns:
+            dict: 16-byte address -> PublicIdentity
+        """
         return {k: v['identity'] for k, v in self.identities.items()}
 
     def size(self):
@@ -9,8 +9,9 @@ It manages:
 - Message callbacks
 """
 
+import time
 from ..crypto.identity import Identity, PublicIdentity
-from ..transport.packet import Packet, PacketType
+from ..transport.packet import Packet, PacketType, parse_announce_batch
 from ..platform.detection import get_profile, is_micropython
 from .identity_cache import IdentityCache
 from ..routing.route_table import RouteTable
@@ -18,6 +19,17 @@ from ..storage.identity_storage import IdentityStorage
 from ..transport.fragments import TransferManager, Fragmenter
 
 
+# Evaluated once at import - checked on per-packet/per-tick paths
+_IS_MPY = is_micropython()
+
+# Per-packet [SEND]/[NODE] trace output (off in production: print + hex
+# formatting per packet is expensive, especially over UART on MicroPython)
+_DEBUG_PACKETS = False
+
+# Minimum seconds between RX error summaries
+_RX_ERROR_LOG_INTERVAL = 5
+
+
 class Node:
     """
     A Mycorrhizal network node.
@@ -65,6 +77,10 @@ class Node:
         # Identity cache for discovered nodes
         self.identity_cache = IdentityCache()
 
+        # Most-recently-verified signers per phycore (tried first on verify)
+        self._mru_signers = {}  # phycore -> [address, ...]
+        self.max_mru_signers = 8
+
         # Route table for multi-hop routing
         max_routes = self.profile.max_cache_entries
         self.route_table = RouteTable(max_routes=max_routes, route_timeout=1800)
@@ -85,6 +101,11 @@ class Node:
         self.seen_packets = set()
         self.max_seen_packets = min(1000, self.profile.max_cache_entries)
 
+        # RX error accounting (summarized periodically, not logged per packet)
+        self.rx_error_count = 0
+        self._rx_errors_since_log = 0
+        self._last_rx_error_log = 0
+
         # Announce settings
         self.announce_interval = 300  # seconds (5 minutes default)
         self.announce_timer = None
@@ -164,30 +185,121 @@ class Node:
             flags=flags
         )
 
-        # Sign if requested
+        # Sign if requested (single pass over the serialization buffer)
         if sign:
-            packet.sign(self.identity)
+            serialized = packet.serialize_and_sign(self.identity)
+        else:
+            serialized = packet.to_bytes()
 
         # Check if we have a route to destination
         route = self.route_table.get_route(destination_address)
         if route:
             # Send via specific route
-            print(f"[SEND] Using route to {destination_address.hex()[:16]}...")
-            serialized = packet.to_bytes()
-            print(f"[SEND] Packet serialized to {len(serialized)} bytes")
+            if _DEBUG_PACKETS:
+                print(f"[SEND] Using route to {destination_address.hex()[:16]}...")
+                print(f"[SEND] Packet serialized to {len(serialized)} bytes")
             if route.interface.online:
                 result = route.interface.send(serialized)
-                print(f"[SEND] Route send result: {result}")
+                if _DEBUG_PACKETS:
+                    print(f"[SEND] Route send result: {result}")
                 return result
-            print(f"[SEND] Route interface offline!")
+            if _DEBUG_PACKETS:
+                print(f"[SEND] Route interface offline!")
             return False
         else:
             # No route - broadcast on all interfaces (fallback)
-            print(f"[SEND] No route to {destination_address.hex()[:16]}..., broadcasting")
-            result = self._send_packet(packet)
-            print(f"[SEND] Broadcast result: {result}")
+            if _DEBUG_PACKETS:
+                print(f"[SEND] No route to {destination_address.hex()[:16]}..., broadcasting")
+            result = self._send_serialized(serialized)
+            if _DEBUG_PACKETS:
+                print(f"[SEND] Broadcast result: {result}")
             return result
         
+    def send_data_batch(self, items, sign=True, flags=0):
+        """
+        Send several data packets, batched per phycore.
+
+        Packets are routed like send_data(), then each phycore gets all of
+        its packets in one send_batch() call (a LoRa radio transmits them
+        back to back without returning to RX in between).
+
+        Args:
+            items: list of (destination_address, payload) tuples
+            sign: whether to sign the packets (default True)
+            flags: Packet flags applied to every packet (default 0)
+
+        Returns:
+            int: Number of packets sent on at least one phycore
+        """
+        batches = {}  # phycore -> ([serialized, ...], [item index, ...])
+        sent = [False] * len(items)
+
+        for index, (destination_address, payload) in enumerate(items):
+            packet = Packet(
+                packet_type=PacketType.DATA,
+                destination=destination_address,
+                payload=payload,
+                flags=flags
+            )
+
+            if sign:
+                serialized = packet.serialize_and_sign(self.identity)
+            else:
+                serialized = packet.to_bytes()
+
+            # Specific route if known, otherwise broadcast on all phycores
+            route = self.route_table.get_route(destination_address)
+            targets = (route.interface,) if route else self.phycores
+
+            for phycore in targets:
+                if phycore.online:
+                    batch = batches.get(phycore)
+                    if batch is None:
+                        batch = batches[phycore] = ([], [])
+                    batch[0].append(serialized)
+                    batch[1].append(index)
+
+        for phycore, (packets, indices) in batches.items():
+            for index, result in zip(indices, phycore.send_batch(packets)):
+                if result:
+                    sent[index] = True
+
+        return sum(sent)
+
+    def broadcast_data(self, group_address, payload, sign=True, flags=0):
+        """
+        Send one data packet to a group address on all phycores.
+
+        Receivers that know the group (e.g. a colony ID for a joined
+        colony) accept it as addressed to them, so a group message costs
+        one frame on a shared medium instead of one per member.
+
+        Args:
+            group_address: 16-byte group address (e.g. colony ID)
+            payload: bytes to send
+            sign: whether to sign the packet (default True)
+            flags: Packet flags (default 0)
+
+        Returns:
+            bool: True if at least one phycore sent it
+        """
+        packet = Packet(
+            packet_type=PacketType.DATA,
+            destination=group_address,
+            payload=payload,
+            flags=flags
+        )
+
+        if sign:
+            serialized = packet.serialize_and_sign(self.identity)
+        else:
+            serialized = packet.to_bytes()
+
+        # Don't process our own frame if a phycore echoes it back
+        self._mark_seen(hash(bytes(serialized)))
+
+        return self._send_serialized(serialized)
+
     def announce(self, verbose=True):
         """
         Announce presence on the network.
@@ -213,12 +325,12 @@ class Node:
         )
 
         # Always sign announces
-        packet.sign(self.identity)
+        serialized = packet.serialize_and_sign(self.identity)
 
         if verbose:
             print(f"\n📣 Announcing {self.name} ({self.identity.address_hex()[:16]}...)")
 
-        return self._send_packet(packet)
+        return self._send_serialized(serialized)
 
     def start_announcing(self, interval=None, announce_now=True):
         """
@@ -237,10 +349,9 @@ class Node:
         if announce_now:
             self.announce(verbose=False)
 
-        if is_micropython():
+        if _IS_MPY:
             # MicroPython: No threading, manual announce checking in main loop
             # Store last announce time for manual checking
-            import time
             self.last_announce_time = time.ticks_ms()
             print(f"  📣 Auto-announce enabled (every {self.announce_interval}s) - manual mode")
         else:
@@ -273,10 +384,9 @@ class Node:
         Check if it's time to send an auto-announce (MicroPython manual mode).
         Call this regularly from your main loop on MicroPython.
         """
-        if not is_micropython() or not self.auto_announce:
+        if not _IS_MPY or not self.auto_announce:
             return
 
-        import time
         now = time.ticks_ms()
         interval_ms = self.announce_interval * 1000
 
@@ -294,7 +404,18 @@ class Node:
         Returns:
             bool: True if at least one phycore succeeded
         """
-        serialized = packet.to_bytes()
+        return self._send_serialized(packet.to_bytes())
+
+    def _send_serialized(self, serialized):
+        """
+        Internal: Send an already-serialized packet via all phycores.
+
+        Args:
+            serialized: Packet bytes (from to_bytes() or serialize_and_sign())
+
+        Returns:
+            bool: True if at least one phycore succeeded
+        """
         success_count = 0
 
         for phycore in self.phycores:
@@ -312,20 +433,26 @@ class Node:
             phycore: PhycoreBase that received the packet
         """
         try:
-            # Deserialize packet
-            packet = Packet.from_bytes(data)
-
-            # Deduplicate based on packet hash
+            # Deduplicate based on packet hash, before parsing: duplicates
+            # are the common case under flooding, and from_bytes() hashes
+            # the payload (SHA-256) to check it
             packet_hash = hash(data)
             if packet_hash in self.seen_packets:
                 return  # Already processed this packet
 
-            # Add to seen packets (LRU: remove oldest if full)
-            self.seen_packets.add(packet_hash)
-            if len(self.seen_packets) > self.max_seen_packets:
-                # Simple approach: clear half when full
-                # (More sophisticated LRU could be implemented)
-                self.seen_packets = set(list(self.seen_packets)[self.max_seen_packets // 2:])
+            # Deserialize packet (corrupt frames raise and aren't marked seen)
+            packet = Packet.from_bytes(data)
+
+            self._mark_seen(packet_hash)
+
+            # Unpack announce batches and process each announce on its own
+            # (own signature, dedup and forwarding). Only plain announces are
+            # accepted inside a batch - no nesting.
+            if packet.packet_type == PacketType.ANNOUNCE_BATCH:
+                for announce_bytes in parse_announce_batch(packet.payload):
+                    if len(announce_bytes) > 3 and announce_bytes[3] == PacketType.ANNOUNCE:
+                        self._on_packet_received(announce_bytes, phycore)
+                return
 
             # Handle announces first - they're broadcast to everyone
             if packet.packet_type == PacketType.ANNOUNCE:
@@ -335,15 +462,23 @@ class Node:
                     self._forward_announce(packet, phycore)
                 return
 
+            # Data addressed to a colony we belong to (see broadcast_data)
+            if (self.colonies and packet.packet_type == PacketType.DATA and
+                    packet.destination.hex() in self.colonies):
+                self._handle_data_packet(packet, phycore)
+                return
+
             # Check if packet is for us (non-announce packets)
             if packet.destination != self.address:
                 # Not for us - forward if enabled
-                print(f"[NODE] Packet not for us. Dest: {packet.destination.hex()[:16]}..., My addr: {self.address.hex()[:16]}...")
+                if _DEBUG_PACKETS:
+                    print(f"[NODE] Packet not for us. Dest: {packet.destination.hex()[:16]}..., My addr: {self.address.hex()[:16]}...")
                 if self.enable_forwarding and packet.hop_count < self.max_hops:
                     self._forward_packet(packet, phycore)
                 return
 
-            print(f"[NODE] Packet IS for us! Type: {packet.packet_type}, payload size: {len(packet.payload)}")
+            if _DEBUG_PACKETS:
+                print(f"[NODE] Packet IS for us! Type: {packet.packet_type}, payload size: {len(packet.payload)}")
 
             # Handle other packet types
             if packet.packet_type == PacketType.DATA:
@@ -351,10 +486,46 @@ class Node:
             # Add more packet type handlers here
 
         except Exception as e:
-            print(f"Error processing packet: {e}")
+            self._log_rx_error(e)
+
+    def _mark_seen(self, packet_hash):
+        """
+        Record a packet hash for deduplication, bounded by max_seen_packets.
+
+        Args:
+            packet_hash: hash() of the serialized packet
+        """
+        # Add to seen packets (LRU: remove oldest if full)
+        self.seen_packets.add(packet_hash)
+        if len(self.seen_packets) > self.max_seen_packets:
+            # Simple approach: clear half when full
+            # (More sophisticated LRU could be implemented)
+            self.seen_packets = set(list(self.seen_packets)[self.max_seen_packets // 2:])
+
+    def _log_rx_error(self, error):
+        """
+        Count a receive-path error and print a rate-limited summary.
+
+        Garbled frames can arrive in bursts; printing (and on MicroPython,
+        formatting a traceback) for each one would stall the receive path.
+
+        Args:
+            error: Exception raised while processing the packet
+        """
+        self.rx_error_count += 1
+        self._rx_errors_since_log += 1
+
+        if _DEBUG_PACKETS:
             import traceback
             traceback.print_exc()
 
+        now = time.time()
+        if now - self._last_rx_error_log >= _RX_ERROR_LOG_INTERVAL:
+            print(f"Error processing packet: {self._rx_errors_since_log} rx error(s), "
+                  f"last={type(error).__name__}: {error}")
+            self._rx_errors_since_log = 0
+            self._last_rx_error_log = now
+
     def _handle_data_packet(self, packet, phycore):
         """Handle incoming data packet"""
         source_address = None
@@ -362,12 +533,7 @@ class Node:
 
         # If packet is signed, try to verify and identify sender
         if packet.is_signed():
-            # Try all cached identities to find the sender
-            for addr_hex, identity in self.identity_cache.get_all().items():
-                if packet.verify(identity):
-                    source_address = bytes.fromhex(addr_hex)
-                    source_identity = identity
-                    break
+            source_address, source_identity = self._find_signer(packet, phycore)
 
         # Check if fragmented (packet has FRAGMENTED flag)
         if packet.is_fragmented():
@@ -377,22 +543,66 @@ class Node:
 
         # Check if this is a colony message (first 16 bytes = colony_id)
         if len(packet.payload) >= 16:
-            potential_colony_id = packet.payload[:16]
-            print(f"[NODE] Checking if colony message: {potential_colony_id.hex()[:16]}...")
-            print(f"[NODE] Known colonies: {list(self.colonies.keys())}")
-            if potential_colony_id.hex() in self.colonies:
+            colony_id_hex = packet.payload[:16].hex()
+            if _DEBUG_PACKETS:
+                print(f"[NODE] Checking if colony message: {colony_id_hex[:16]}...")
+                print(f"[NODE] Known colonies: {list(self.colonies.keys())}")
+            colony = self.colonies.get(colony_id_hex)
+            if colony is not None:
                 # Route to colony
-                print(f"[NODE] Routing to colony {potential_colony_id.hex()[:16]}...")
-                colony = self.colonies[potential_colony_id.hex()]
+                if _DEBUG_PACKETS:
+                    print(f"[NODE] Routing to colony {colony_id_hex[:16]}...")
                 colony.handle_message(packet.payload, source_address)
                 return
-            else:
+            elif _DEBUG_PACKETS:
                 print(f"[NODE] Not a known colony message")
 
         # Regular data callback
         if self.data_callback:
             self.data_callback(packet.payload, source_address, packet)
 
+    def _find_signer(self, packet, phycore):
+        """
+        Find the cached identity that signed a packet.
+
+        Senders recently verified on this phycore are tried first (the next
+        packet is usually from the same sender), then the rest of the cache.
+
+        Args:
+            packet: Signed packet
+            phycore: Phycore that received the packet
+
+        Returns:
+            tuple: (address, PublicIdentity) or (None, None) if no match
+        """
+        mru = self._mru_signers.get(phycore)
+        if mru is None:
+            mru = self._mru_signers[phycore] = []
+
+        match = None
+        for addr in mru:
+            identity = self.identity_cache.get(addr)
+            if identity is not None and packet.verify(identity):
+                match = (addr, identity)
+                mru.remove(addr)
+                break
+
+        if match is None:
+            for addr, identity in self.identity_cache.get_all().items():
+                if addr not in mru and packet.verify(identity):
+                    match = (addr, identity)
+                    break
+
+        if match is None:
+            return None, None
+
+        # Move to front, bounded
+        mru.insert(0, match[0])
+        if len(mru) > self.max_mru_signers:
+            mru.pop()
+
+        return match
+
     def _handle_announce_packet(self, packet, phycore):
         """
         Handle incoming announce packet.
@@ -407,12 +617,8 @@ class Node:
                 print(f"⚠️  Invalid announce: payload too short ({len(packet.payload)} bytes)")
                 return
 
-            # Extract public keys from payload
-            signing_public_key = packet.payload[0:32]
-            encryption_public_key = packet.payload[32:64]
-
-            # Create PublicIdentity
-            public_identity = PublicIdentity(signing_public_key, encryption_public_key)
+            # Create PublicIdentity from the public keys in the payload
+            public_identity = PublicIdentity.from_announce_payload(packet.payload)
 
             # Verify the announce signature (only for direct announces, not forwarded ones)
             # Forwarded announces have hop_count > 0 and signature was already verified by previous hop
@@ -594,12 +800,10 @@ class Node:
                 payload=frag,
                 flags=PacketFlags.FRAGMENTED
             )
-            packet.sign(self.identity)
-            self._send_packet(packet)
+            self._send_serialized(packet.serialize_and_sign(self.identity))
 
             # Small delay between fragments on MicroPython
-            if is_micropython() and i % 5 == 0:
-                import time
+            if _IS_MPY and i % 5 == 0:
                 time.sleep_ms(50)
 
         return transfer_id
@@ -653,5 +857,20 @@ class Node:
 
         return stats
 
+    def tx_rx_totals(self):
+        """
+        Get packet/byte counters summed over all phycores.
+
+        Returns:
+            tuple: (tx_packets, tx_bytes, rx_packets, rx_bytes)
+        """
+        tx_packets = tx_bytes = rx_packets = rx_bytes = 0
+        for phycore in self.phycores:
+            tx_packets += phycore.tx_count
+            tx_bytes += phycore.tx_bytes
+            rx_packets += phycore.rx_count
+            rx_bytes += phycore.rx_bytes
+        return tx_packets, tx_bytes, rx_packets, rx_bytes
+
     def __repr__(self):
         return f"Node(name='{self.name}', address={self.identity.address_hex()[:16]}...)"
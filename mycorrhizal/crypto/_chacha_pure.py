@@ -0,0 +1,275 @@
+"""
+Pure Python ChaCha20-Poly1305 Implementation
+
+ChaCha20-Poly1305 AEAD (RFC 8439) for platforms without a native
+implementation (MicroPython ports without ucryptolib ChaCha, or CPython
+without cryptography/PyNaCl).
+
+- The message is processed in 4 KiB tiles: per tile the keystream is
+  generated into a reused buffer, XORed with the data in a single bigint
+  operation, and the ciphertext is fed to Poly1305 while it is still hot.
+  One pass over the data, bounded scratch memory
+- Poly1305 uses native arbitrary-precision ints (p = 2^130 - 5)
+
+Only used when no C implementation is available - see
+CryptoBackend.encrypt_chacha20poly1305.
+"""
+
+import struct
+
+
+_MASK32 = 0xFFFFFFFF
+
+# "expand 32-byte k"
+_SIGMA = (0x61707865, 0x3320646e, 0x79622d32, 0x6b206574)
+
+_P1305 = (1 << 130) - 5
+
+_MASK128 = (1 << 128) - 1
+_R_CLAMP = 0x0ffffffc0ffffffc0ffffffc0fffffff
+
+TAG_SIZE = 16
+
+# Bytes per encrypt+authenticate tile (multiple of 64 and 16)
+_TILE = 4096
+
+
+def _quarter_round(x, a, b, c, d):
+    """ChaCha quarter round on state list x (in place)"""
+    mask = _MASK32
+    xa = x[a]
+    xb = x[b]
+    xc = x[c]
+    xd = x[d]
+
+    xa = (xa + xb) & mask
+    xd ^= xa
+    xd = ((xd << 16) | (xd >> 16)) & mask
+    xc = (xc + xd) & mask
+    xb ^= xc
+    xb = ((xb << 12) | (xb >> 20)) & mask
+    xa = (xa + xb) & mask
+    xd ^= xa
+    xd = ((xd << 8) | (xd >> 24)) & mask
+    xc = (xc + xd) & mask
+    xb ^= xc
+    xb = ((xb << 7) | (xb >> 25)) & mask
+
+    x[a] = xa
+    x[b] = xb
+    x[c] = xc
+    x[d] = xd
+
+
+def _block_into(state, out, offset):
+    """
+    Run the ChaCha20 block function and write 64 keystream bytes.
+
+    Args:
+        state: list of 16 input words (not modified)
+        out: bytearray to write into
+        offset: byte offset in out
+    """
+    x = list(state)
+    for _ in range(10):
+        # Column rounds
+        _quarter_round(x, 0, 4, 8, 12)
+        _quarter_round(x, 1, 5, 9, 13)
+        _quarter_round(x, 2, 6, 10, 14)
+        _quarter_round(x, 3, 7, 11, 15)
+        # Diagonal rounds
+        _quarter_round(x, 0, 5, 10, 15)
+        _quarter_round(x, 1, 6, 11, 12)
+        _quarter_round(x, 2, 7, 8, 13)
+        _quarter_round(x, 3, 4, 9, 14)
+
+    mask = _MASK32
+    for i in range(16):
+        x[i] = (x[i] + state[i]) & mask
+
+    struct.pack_into('<16I', out, offset, *x)
+
+
+def _initial_state(key, counter, nonce):
+    """Build the 16-word ChaCha20 input state"""
+    state = list(_SIGMA)
+    state.extend(struct.unpack('<8I', key))
+    state.append(counter)
+    state.extend(struct.unpack('<3I', nonce))
+    return state
+
+
+def chacha20_xor(key, counter, nonce, data):
+    """
+    Encrypt/decrypt data with the ChaCha20 stream cipher.
+
+    Args:
+        key: 32-byte key
+        counter: initial block counter
+        nonce: 12-byte nonce
+        data: bytes to encrypt/decrypt
+
+    Returns:
+        bytes: data XOR keystream
+    """
+    length = len(data)
+    if length == 0:
+        return b""
+
+    state = _initial_state(key, counter, nonce)
+    blocks = (length + 63) // 64
+    keystream = bytearray(blocks * 64)
+
+    for i in range(blocks):
+        _block_into(state, keystream, i * 64)
+        state[12] = (state[12] + 1) & _MASK32
+
+    # XOR the whole message at once as one integer
+    result = int.from_bytes(data, 'little') ^ int.from_bytes(keystream[:length], 'little')
+    return result.to_bytes(length, 'little')
+
+
+def _poly_blocks(acc, r, data):
+    """
+    Absorb data into a Poly1305 accumulator as AEAD input.
+
+    Zero-pads a trailing partial block to 16 bytes, as RFC 8439 does for
+    the AAD and ciphertext, so tiles can be fed one after another.
+
+    Args:
+        acc: current accumulator
+        r: clamped r
+        data: bytes-like to absorb
+
+    Returns:
+        int: new accumulator
+    """
+    p = _P1305
+    hibit = 1 << 128
+    for offset in range(0, len(data), 16):
+        # Zero padding doesn't change the little-endian value
+        acc = (acc + (int.from_bytes(data[offset:offset + 16], 'little') | hibit)) * r % p
+    return acc
+
+
+def _aead_into(key, nonce, data, associated_data, out, decrypting):
+    """
+    Encrypt/decrypt data into out and compute the tag in one tiled pass.
+
+    Args:
+        key: 32-byte key
+        nonce: 12-byte nonce
+        data: plaintext (encrypting) or ciphertext body (decrypting)
+        associated_data: additional authenticated data
+        out: writable buffer of len(data) bytes
+        decrypting: True if data is ciphertext
+
+    Returns:
+        bytes: 16-byte tag over the ciphertext
+    """
+    one_time_key = chacha20_xor(key, 0, nonce, bytes(32))
+    r = int.from_bytes(one_time_key[:16], 'little') & _R_CLAMP
+    s = int.from_bytes(one_time_key[16:32], 'little')
+
+    acc = _poly_blocks(0, r, associated_data)
+
+    state = _initial_state(key, 1, nonce)
+    keystream = bytearray(_TILE)
+    keystream_mv = memoryview(keystream)
+    data_mv = memoryview(data)
+    length = len(data)
+
+    for start in range(0, length, _TILE):
+        chunk = data_mv[start:start + _TILE]
+        n = len(chunk)
+
+        for offset in range(0, n, 64):
+            _block_into(state, keystream, offset)
+            state[12] = (state[12] + 1) & _MASK32
+
+        result = (int.from_bytes(chunk, 'little') ^
+                  int.from_bytes(keystream_mv[:n], 'little')).to_bytes(n, 'little')
+        out[start:start + n] = result
+
+        # Authenticate the ciphertext side of this tile
+        acc = _poly_blocks(acc, r, chunk if decrypting else result)
+
+    acc = _poly_blocks(acc, r, struct.pack('<QQ', len(associated_data), length))
+    return ((acc + s) & _MASK128).to_bytes(16, 'little')
+
+
+def _constant_time_equal(a, b):
+    """Compare two byte strings without an early exit"""
+    if len(a) != len(b):
+        return False
+    diff = 0
+    for x, y in zip(a, b):
+        diff |= x ^ y
+    return diff == 0
+
+
+def encrypt_into(key, nonce, plaintext, out, associated_data=b""):
+    """
+    ChaCha20-Poly1305 AEAD encryption into a caller-provided buffer.
+
+    Args:
+        key: 32-byte key
+        nonce: 12-byte nonce
+        plaintext: bytes to encrypt
+        out: writable buffer of len(plaintext) + 16 bytes
+        associated_data: additional authenticated data
+    """
+    length = len(plaintext)
+    if len(out) != length + TAG_SIZE:
+        raise ValueError("Output buffer must be len(plaintext) + 16 bytes")
+
+    out[length:] = _aead_into(key, nonce, plaintext, associated_data, out, False)
+
+
+def encrypt(key, nonce, plaintext, associated_data=b""):
+    """
+    ChaCha20-Poly1305 AEAD encryption.
+
+    Args:
+        key: 32-byte key
+        nonce: 12-byte nonce
+        plaintext: bytes to encrypt
+        associated_data: additional authenticated data
+
+    Returns:
+        bytes: ciphertext + 16-byte tag
+    """
+    out = bytearray(len(plaintext) + TAG_SIZE)
+    encrypt_into(key, nonce, plaintext, out, associated_data)
+    return bytes(out)
+
+
+def decrypt(key, nonce, ciphertext, associated_data=b""):
+    """
+    ChaCha20-Poly1305 AEAD decryption.
+
+    Args:
+        key: 32-byte key
+        nonce: 12-byte nonce
+        ciphertext: ciphertext + 16-byte tag
+        associated_data: additional authenticated data
+
+    Returns:
+        bytes: decrypted plaintext
+
+    Raises:
+        ValueError: If the data is too short or authentication fails
+    """
+    if len(ciphertext) < TAG_SIZE:
+        raise ValueError("Ciphertext too short")
+
+    ciphertext = memoryview(ciphertext)
+    length = len(ciphertext) - TAG_SIZE
+    plaintext = bytearray(length)
+
+    # Plaintext is only released once the tag checks out
+    expected = _aead_into(key, nonce, ciphertext[:length], associated_data, plaintext, True)
+    if not _constant_time_equal(expected, ciphertext[length:]):
+        raise ValueError("Authentication failed")
+
+    return bytes(plaintext)
@@ -0,0 +1,311 @@
+"""
+Curve25519 Field, Edwards Point and Montgomery Ladder Arithmetic
+
+Shared arithmetic for the pure Python Ed25519/X25519 fallbacks.
+
+- Field elements are plain ints mod p = 2^255 - 19 (MicroPython and CPython
+  both have native arbitrary-precision ints)
+- Edwards points use extended coordinates (X, Y, Z, T) with x = X/Z,
+  y = Y/Z, x*y = T/Z, so point addition/doubling need no field inversion;
+  the single inversion happens when a point is encoded
+"""
+
+
+# Field prime
+P = 2**255 - 19
+
+# Twisted Edwards curve constant d = -121665/121666 (curve: -x² + y² = 1 + dx²y²)
+D = -121665 * pow(121666, P - 2, P) % P
+D2 = 2 * D % P
+
+# sqrt(-1) mod p, used for square root recovery in point decoding
+SQRT_M1 = pow(2, (P - 1) // 4, P)
+
+# Montgomery curve constant (A - 2) / 4 for the X25519 ladder (A = 486662)
+A24 = 121665
+
+
+# ===== Field Operations =====
+
+def fe_add(a, b):
+    """a + b mod p"""
+    return (a + b) % P
+
+
+def fe_sub(a, b):
+    """a - b mod p"""
+    return (a - b) % P
+
+
+def fe_mul(a, b):
+    """a * b mod p"""
+    return a * b % P
+
+
+def _fe_sqn(a, n):
+    """a^(2^n) mod p (n squarings)"""
+    p = P
+    for _ in range(n):
+        a = a * a % p
+    return a
+
+
+def fe_inv(a):
+    """
+    a^-1 mod p (Fermat: a^(p-2)).
+
+    Uses the ref10/RFC 7748 addition chain: 254 squarings + 11
+    multiplications, against ~500 modular multiplications for a generic
+    square-and-multiply pow().
+    """
+    p = P
+    z2 = a * a % p                                  # 2
+    z9 = _fe_sqn(z2, 2) * a % p                     # 9
+    z11 = z9 * z2 % p                               # 11
+    z_5_0 = z11 * z11 % p * z9 % p                  # 2^5 - 1
+    z_10_0 = _fe_sqn(z_5_0, 5) * z_5_0 % p          # 2^10 - 1
+    z_20_0 = _fe_sqn(z_10_0, 10) * z_10_0 % p       # 2^20 - 1
+    z_40_0 = _fe_sqn(z_20_0, 20) * z_20_0 % p       # 2^40 - 1
+    z_50_0 = _fe_sqn(z_40_0, 10) * z_10_0 % p       # 2^50 - 1
+    z_100_0 = _fe_sqn(z_50_0, 50) * z_50_0 % p      # 2^100 - 1
+    z_200_0 = _fe_sqn(z_100_0, 100) * z_100_0 % p   # 2^200 - 1
+    z_250_0 = _fe_sqn(z_200_0, 50) * z_50_0 % p     # 2^250 - 1
+    return _fe_sqn(z_250_0, 5) * z11 % p            # 2^255 - 21 = p - 2
+
+
+# ===== Edwards Point Operations (extended coordinates) =====
+
+# Neutral element (0, 1)
+IDENTITY = (0, 1, 1, 0)
+
+
+def point_add(p1, p2):
+    """
+    Add two points (add-2008-hwcd-3, a = -1).
+
+    Args:
+        p1, p2: (X, Y, Z, T) extended coordinates
+
+    Returns:
+        tuple: p1 + p2 in extended coordinates
+    """
+    x1, y1, z1, t1 = p1
+    x2, y2, z2, t2 = p2
+    a = (y1 - x1) * (y2 - x2) % P
+    b = (y1 + x1) * (y2 + x2) % P
+    c = t1 * D2 * t2 % P
+    d = 2 * z1 * z2 % P
+    e = b - a
+    f = d - c
+    g = d + c
+    h = b + a
+    return (e * f % P, g * h % P, f * g % P, e * h % P)
+
+
+def point_double(p1):
+    """
+    Double a point (dbl-2008-hwcd, a = -1).
+
+    Args:
+        p1: (X, Y, Z, T) extended coordinates
+
+    Returns:
+        tuple: 2 * p1 in extended coordinates
+    """
+    x1, y1, z1, _ = p1
+    a = x1 * x1 % P
+    b = y1 * y1 % P
+    c = 2 * z1 * z1 % P
+    h = a + b
+    e = h - (x1 + y1) * (x1 + y1) % P
+    g = a - b
+    f = c + g
+    return (e * f % P, g * h % P, f * g % P, e * h % P)
+
+
+def scalar_mul(scalar, point):
+    """
+    Multiply a point by a scalar (double-and-add, high bit first).
+
+    Note: not constant-time; this is a fallback for platforms without
+    a native Ed25519 implementation.
+
+    Args:
+        scalar: non-negative int
+        point: (X, Y, Z, T) extended coordinates
+
+    Returns:
+        tuple: scalar * point in extended coordinates
+    """
+    result = IDENTITY
+    for i in range(scalar.bit_length() - 1, -1, -1):
+        result = point_double(result)
+        if (scalar >> i) & 1:
+            result = point_add(result, point)
+    return result
+
+
+def multi_scalar_mul(scalars, points):
+    """
+    Compute sum(scalars[i] * points[i]) (Straus / interleaved double-and-add).
+
+    All terms share one chain of doublings, so N terms cost roughly one
+    scalar multiplication's doublings plus the additions for each scalar.
+
+    Args:
+        scalars: list of non-negative ints
+        points: list of (X, Y, Z, T) extended coordinates
+
+    Returns:
+        tuple: the sum in extended coordinates
+    """
+    bits = 0
+    for scalar in scalars:
+        if scalar.bit_length() > bits:
+            bits = scalar.bit_length()
+
+    n = len(scalars)
+    result = IDENTITY
+    for i in range(bits - 1, -1, -1):
+        result = point_double(result)
+        for j in range(n):
+            if (scalars[j] >> i) & 1:
+                result = point_add(result, points[j])
+    return result
+
+
+def point_negate(point):
+    """Negate a point: (x, y) -> (-x, y)"""
+    x, y, z, t = point
+    return ((P - x) % P, y, z, (P - t) % P)
+
+
+def point_equal(p1, p2):
+    """Check two extended points for equality (cross-multiplied, no inversion)"""
+    x1, y1, z1, _ = p1
+    x2, y2, z2, _ = p2
+    return (x1 * z2 - x2 * z1) % P == 0 and (y1 * z2 - y2 * z1) % P == 0
+
+
+def point_encode(point):
+    """
+    Encode a point to 32 bytes (y with the sign of x in the top bit).
+
+    Args:
+        point: (X, Y, Z, T) extended coordinates
+
+    Returns:
+        bytes: 32-byte encoding
+    """
+    x, y, z, _ = point
+    z_inv = fe_inv(z)
+    x = x * z_inv % P
+    y = y * z_inv % P
+    return (y | ((x & 1) << 255)).to_bytes(32, 'little')
+
+
+def point_decode(bytes32):
+    """
+    Decode 32 bytes to a point.
+
+    Args:
+        bytes32: 32-byte encoding
+
+    Returns:
+        tuple: (X, Y, Z, T) extended coordinates
+
+    Raises:
+        ValueError: If the encoding is not a valid curve point
+    """
+    if len(bytes32) != 32:
+        raise ValueError("Point encoding must be 32 bytes")
+
+    y = int.from_bytes(bytes32, 'little')
+    sign = y >> 255
+    y &= (1 << 255) - 1
+    if y >= P:
+        raise ValueError("Point y-coordinate out of range")
+
+    # x² = (y² - 1) / (d*y² + 1)
+    y2 = y * y % P
+    x2 = (y2 - 1) * fe_inv(D * y2 + 1) % P
+    if x2 == 0:
+        if sign:
+            raise ValueError("Invalid point encoding")
+        return (0, y, 1, 0)
+
+    # Square root candidate: x = x2^((p+3)/8)
+    x = pow(x2, (P + 3) // 8, P)
+    if (x * x - x2) % P != 0:
+        x = x * SQRT_M1 % P
+    if (x * x - x2) % P != 0:
+        raise ValueError("Point not on curve")
+
+    if (x & 1) != sign:
+        x = P - x
+
+    return (x, y, 1, x * y % P)
+
+
+# ===== Montgomery Ladder (X25519) =====
+
+def montgomery_ladder(k, u):
+    """
+    Compute the u-coordinate of k * (u, ...) with the Montgomery ladder.
+
+    The ladder step (differential add + double) is inlined and the state is
+    kept in four locals, so each of the 255 iterations runs straight-line
+    arithmetic with no call or tuple allocation. The per-bit swap is
+    masked rather than branched on.
+
+    Note: Python bigint arithmetic is not constant-time; the masked swap
+    only removes the secret-dependent branch.
+
+    Args:
+        k: clamped scalar (int)
+        u: u-coordinate (int, < 2^255)
+
+    Returns:
+        int: u-coordinate of the result (mod p)
+    """
+    p = P
+    a24 = A24
+    x_1 = u
+    x_2 = 1
+    z_2 = 0
+    x_3 = u
+    z_3 = 1
+    swap = 0
+
+    for t in range(254, -1, -1):
+        k_t = (k >> t) & 1
+        swap ^= k_t
+        # Conditional swap without a branch (cf. ref10 fe_cswap):
+        # mask is 0 or -1 (all ones), so dummy is 0 or x_2 ^ x_3
+        mask = -swap
+        dummy = mask & (x_2 ^ x_3)
+        x_2 ^= dummy
+        x_3 ^= dummy
+        dummy = mask & (z_2 ^ z_3)
+        z_2 ^= dummy
+        z_3 ^= dummy
+        swap = k_t
+
+        a = x_2 + z_2
+        aa = a * a % p
+        b = x_2 - z_2
+        bb = b * b % p
+        e = aa - bb
+        da = (x_3 - z_3) * a % p
+        cb = (x_3 + z_3) * b % p
+
+        x_3 = (da + cb) * (da + cb) % p
+        z_3 = x_1 * ((da - cb) * (da - cb) % p) % p
+        x_2 = aa * bb % p
+        z_2 = e * (aa + a24 * e) % p
+
+    mask = -swap
+    x_2 ^= mask & (x_2 ^ x_3)
+    z_2 ^= mask & (z_2 ^ z_3)
+
+    return x_2 * fe_inv(z_2) % p
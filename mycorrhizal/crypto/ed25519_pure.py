@@ -1,17 +1,21 @@
 """
 Pure Python Ed25519 Implementation
 
-This is a stub for a pure Python Ed25519 implementation compatible with MicroPython.
+Pure Python Ed25519 (RFC 8032) compatible with MicroPython.
 
-For production use, consider porting one of these:
-- python-ed25519 by Brian Warner: https://github.com/warner/python-ed25519
-- ed25519.py by Daniel J. Bernstein: https://ed25519.cr.yp.to/python/ed25519.py
-- python-pure25519: https://github.com/warner/python-pure25519
+Field and point arithmetic lives in _field.py (extended twisted Edwards
+coordinates). SHA-512 comes from
+uhashlib/hashlib when available, otherwise from sha512_pure.py.
 
 Note: This implementation must NOT depend on C extensions or CPython-specific libraries.
 It should use only pure Python arithmetic and standard library functions available in MicroPython.
 """
 
+import os
+
+from ._field import (P, IDENTITY, point_add, point_double, point_negate, scalar_mul,
+                     multi_scalar_mul, point_equal, point_encode, point_decode)
+
 
 class Ed25519PrivateKey:
     """Ed25519 private key for signing"""
@@ -38,14 +42,14 @@ class Ed25519PrivateKey:
         Returns:
             Ed25519PrivateKey
         """
-        # TODO: Implement Ed25519 key generation from seed
-        # This involves:
-        # 1. Hash seed with SHA-512 to get 64 bytes
-        # 2. Clamp first 32 bytes to form scalar
-        # 3. Compute public key point A = scalar * G (generator point)
-        # 4. Encode public key point to 32 bytes
+        if len(seed) != 32:
+            raise ValueError("Ed25519 seed must be 32 bytes")
+
+        # Public key A = a * G, with a the clamped first half of SHA-512(seed)
+        scalar, _ = _expand_seed(seed)
+        public_bytes = point_encode(scalar_mul(scalar, _G))
 
-        raise NotImplementedError("Ed25519 key generation not yet implemented")
+        return cls(bytes(seed), public_bytes)
 
     @classmethod
     def from_bytes(cls, private_bytes):
@@ -58,8 +62,8 @@ class Ed25519PrivateKey:
         Returns:
             Ed25519PrivateKey
         """
-        # TODO: Re-derive public key from private key
-        raise NotImplementedError("Ed25519 key loading not yet implemented")
+        # The public key is re-derived from the seed
+        return cls.from_seed(private_bytes)
 
     def public_key(self):
         """
@@ -80,15 +84,18 @@ class Ed25519PrivateKey:
         Returns:
             bytes: 64-byte signature
         """
-        # TODO: Implement Ed25519 signing
-        # This involves:
-        # 1. Compute r = H(H(seed)[32:64] || message) mod L
-        # 2. Compute R = r * G
-        # 3. Compute k = H(R || public_key || message) mod L
-        # 4. Compute s = (r + k * private_scalar) mod L
-        # 5. Return R || s (64 bytes)
+        message = bytes(message)
+        scalar, prefix = _expand_seed(self.private_bytes)
+
+        # r = H(prefix || message) mod L, R = r * G
+        r = int.from_bytes(_sha512(prefix + message), 'little') % L
+        r_bytes = point_encode(scalar_mul(r, _G))
+
+        # k = H(R || A || message) mod L, s = (r + k * a) mod L
+        k = int.from_bytes(_sha512(r_bytes + self.public_bytes + message), 'little') % L
+        s = (r + k * scalar) % L
 
-        raise NotImplementedError("Ed25519 signing not yet implemented")
+        return r_bytes + s.to_bytes(32, 'little')
 
     def to_bytes(self):
         """
@@ -136,16 +143,25 @@ class Ed25519PublicKey:
         Raises:
             Exception: If signature is invalid
         """
-        # TODO: Implement Ed25519 verification
-        # This involves:
-        # 1. Parse signature as R || s (32 bytes each)
-        # 2. Compute k = H(R || public_key || message) mod L
-        # 3. Compute S = s * G
-        # 4. Compute K = k * public_key_point
-        # 5. Verify that S == R + K
-        # 6. Raise exception if verification fails
+        if len(signature) != 64:
+            raise ValueError("Invalid signature length")
 
-        raise NotImplementedError("Ed25519 verification not yet implemented")
+        message = bytes(message)
+        r_bytes = bytes(signature[:32])
+        s = int.from_bytes(signature[32:], 'little')
+        if s >= L:
+            raise ValueError("Invalid signature (s out of range)")
+
+        public_point = point_decode(self.public_bytes)
+        r_point = point_decode(r_bytes)
+
+        # Check s * G == R + k * A
+        k = int.from_bytes(_sha512(r_bytes + bytes(self.public_bytes) + message), 'little') % L
+        lhs = scalar_mul(s, _G)
+        rhs = point_add(r_point, scalar_mul(k, public_point))
+
+        if not point_equal(lhs, rhs):
+            raise ValueError("Invalid signature")
 
     def to_bytes(self):
         """
@@ -157,63 +173,109 @@ class Ed25519PublicKey:
         return self.public_bytes
 
 
-# TODO: Implement these helper functions for Ed25519 arithmetic
-# These need to work with the twisted Edwards curve equation: -x² + y² = 1 + dx²y²
-
-def _sha512(data):
-    """SHA-512 hash (need to implement or use hashlib)"""
-    raise NotImplementedError()
-
-
-def _modular_inverse(x, p):
-    """Compute modular inverse using extended Euclidean algorithm"""
-    raise NotImplementedError()
-
-
-def _point_add(p1, p2):
-    """Add two points on the Ed25519 curve"""
-    raise NotImplementedError()
-
-
-def _point_mul(scalar, point):
-    """Multiply a point by a scalar (scalar multiplication)"""
-    raise NotImplementedError()
-
-
-def _point_encode(point):
-    """Encode a curve point to 32 bytes"""
-    raise NotImplementedError()
-
-
-def _point_decode(bytes32):
-    """Decode 32 bytes to a curve point"""
-    raise NotImplementedError()
+def verify_batch(public_keys, messages, signatures):
+    """
+    Verify several signatures at once.
+
+    Checks the random linear combination
+        [8]([sum z_i*s_i]B - sum [z_i]R_i - sum [z_i*k_i]A_i) == 0
+    with random 128-bit z_i, as one multi-scalar multiplication. This is
+    the cofactored equation; it accepts everything single verify() does.
+
+    Args:
+        public_keys: list of 32-byte public keys
+        messages: list of signed messages
+        signatures: list of 64-byte signatures
+
+    Returns:
+        bool: True only if every signature is valid. On False, verify
+              individually to find the bad ones.
+    """
+    scalars = []
+    points = []
+    s_sum = 0
+
+    try:
+        for public_bytes, message, signature in zip(public_keys, messages, signatures):
+            if len(signature) != 64:
+                return False
+
+            r_bytes = bytes(signature[:32])
+            s = int.from_bytes(signature[32:], 'little')
+            if s >= L:
+                return False
+
+            public_point = point_decode(public_bytes)
+            r_point = point_decode(r_bytes)
+
+            k = int.from_bytes(_sha512(r_bytes + bytes(public_bytes) + bytes(message)), 'little') % L
+            z = int.from_bytes(os.urandom(16), 'little')
+
+            s_sum += z * s
+            scalars.append(z)
+            points.append(point_negate(r_point))
+            scalars.append(z * k % L)
+            points.append(point_negate(public_point))
+    except ValueError:
+        # Undecodable point
+        return False
+
+    scalars.append(s_sum % L)
+    points.append(_G)
+
+    result = multi_scalar_mul(scalars, points)
+
+    # Multiply by the cofactor
+    result = point_double(point_double(point_double(result)))
+
+    return point_equal(result, IDENTITY)
+
+
+# SHA-512: prefer the C implementation (uhashlib/hashlib), only fall back to
+# pure Python on ports that don't ship sha512
+try:
+    from uhashlib import sha512 as _sha512_c
+except ImportError:
+    try:
+        from hashlib import sha512 as _sha512_c
+    except ImportError:
+        _sha512_c = None
+
+if _sha512_c is not None:
+    def _sha512(data):
+        """SHA-512 hash (C implementation)"""
+        return _sha512_c(data).digest()
+else:
+    from .sha512_pure import sha512 as _sha512
+
+
+def _expand_seed(seed):
+    """
+    Expand a 32-byte seed into the signing scalar and nonce prefix.
+
+    Returns:
+        tuple: (clamped scalar int, 32-byte prefix)
+    """
+    digest = _sha512(bytes(seed))
+    scalar = int.from_bytes(digest[:32], 'little')
+    scalar &= (1 << 254) - 8
+    scalar |= 1 << 254
+    return scalar, digest[32:]
 
 
 # Ed25519 curve constants
-# p = 2^255 - 19 (field prime)
+# p = 2^255 - 19 (field prime, see _field.py)
 # L = 2^252 + 27742317777372353535851937790883648493 (group order)
-# d = -121665/121666 (curve constant)
+# d = -121665/121666 (curve constant, see _field.py)
 # G = generator point
 
-P = 2**255 - 19
 L = 2**252 + 27742317777372353535851937790883648493
-D = -121665 * pow(121666, P - 2, P) % P
 G = (15112221349535400772501151409588531511454012693041857206046113283949847762202,
      46316835694926478169428394003475163141307993866256225615783033603165251855960)
 
+# Generator in extended coordinates
+_G = (G[0], G[1], 1, G[0] * G[1] % P)
+
 
-# Note to implementer:
-# The full Ed25519 implementation requires:
-# 1. Big integer arithmetic (MicroPython supports this natively)
-# 2. Modular arithmetic (%, pow with 3 args)
-# 3. SHA-512 (may need to implement or find MicroPython-compatible version)
-# 4. Point arithmetic on twisted Edwards curve
-#
-# Estimated code size: ~500-800 lines for complete implementation
-# Performance: ~100-500ms per signature/verification on ESP32-S3 @ 240MHz
-#
-# Recommended approach:
-# - Port python-pure25519 by Brian Warner (already pure Python)
-# - Test on CPython first, then MicroPython
-# - Optimize hot paths (point multiplication) if needed
+# Performance: dominated by scalar_mul (one per sign/keygen, two per verify).
+# verify_batch shares one doubling chain across all signatures.
@@ -6,16 +6,173 @@ Uses X25519 for key exchange and ChaCha20-Poly1305 for encryption.
 
 import os
 from ..platform.crypto_adapter import CryptoBackend
+from ..platform.detection import get_profile
 
+try:
+    from threading import Lock as _Lock
+except ImportError:
+    _Lock = None  # MicroPython builds without threading: single caller
 
-def encrypt_to_identity(plaintext, recipient_public_identity, sender_identity):
+try:
+    from hmac import compare_digest as _compare_digest
+except ImportError:
+    from ._chacha_pure import _constant_time_equal as _compare_digest
+
+try:
+    from uhashlib import sha256 as _sha256
+except ImportError:
+    from hashlib import sha256 as _sha256
+
+
+# Derived keys for recently seen (recipient key, ephemeral key) pairs, so
+# messages from a sender reusing its ephemeral key (see create_session)
+# skip the X25519 exchange and key derivation. Sized by platform (50 on
+# constrained boards), like the other caches
+_session_key_cache = {}
+_SESSION_KEY_CACHE_SIZE = min(256, get_profile().max_cache_entries)
+
+# Key derivation label for E2EE keys: protocol domain separation (no
+# identity binding for now). v2: SHA-256(shared_secret || label), v1 was HKDF
+_INFO_E2EE = b"mycorrhizal_e2ee_v2"
+
+# Nonce marking an unencrypted group message (see encrypt_group_message)
+_ZERO_NONCE = bytes(12)
+
+
+class _NoncePool:
+    """
+    Buffered randomness for AEAD nonces.
+
+    Refills a 4 KiB buffer with one os.urandom() call and hands out slices,
+    instead of one entropy syscall per nonce. Handed-out bytes are zeroed
+    in the buffer. Keys are never drawn from here (see generate_group_key):
+    the buffer would hold future key material in memory.
+    """
+
+    SIZE = 4096
+
+    def __init__(self):
+        self._buf = bytearray(self.SIZE)
+        self._offset = self.SIZE  # Empty: fill on first take
+        self._zeros = memoryview(bytes(64))
+        self._lock = _Lock() if _Lock is not None else None
+
+    def reset(self):
+        """
+        Discard the buffered bytes (the next take() refills).
+
+        Called in a forked child: it inherits the parent's unconsumed
+        buffer and would otherwise hand out the same nonces.
+        """
+        self._offset = self.SIZE
+        self._lock = _Lock() if _Lock is not None else None  # May be held by a parent thread
+
+    def take(self, n):
+        """
+        Take n random bytes.
+
+        Args:
+            n: number of bytes (at most 64)
+
+        Returns:
+            bytes: n random bytes (never handed out twice)
+        """
+        lock = self._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            start = self._offset
+            if start + n > self.SIZE:
+                self._buf[:] = os.urandom(self.SIZE)
+                start = 0
+
+            end = start + n
+            out = bytes(self._buf[start:end])
+            self._buf[start:end] = self._zeros[:n]
+            self._offset = end
+            return out
+        finally:
+            if lock is not None:
+                lock.release()
+
+
+_pool = _NoncePool()
+
+# CPython: never share buffered nonces across fork() (multiprocessing,
+# daemonizing). MicroPython has no fork
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_pool.reset)
+
+
+def _derive_key(shared_secret):
+    """
+    Derive the 32-byte ChaCha20-Poly1305 key from an X25519 shared secret.
+
+    A single SHA-256 over shared_secret || label, as NaCl's box hashes its
+    ECDH output. Identical on CPython and MicroPython.
+
+    Args:
+        shared_secret: 32-byte X25519 output
+
+    Returns:
+        bytes: 32-byte encryption key
+    """
+    return _sha256(bytes(shared_secret) + _INFO_E2EE).digest()
+
+
+def _encrypt_with_prefix(key, prefix, plaintext, out=None):
+    """
+    Encrypt into one buffer laid out as prefix + nonce + ciphertext.
+
+    Args:
+        key: 32-byte ChaCha20-Poly1305 key
+        prefix: bytes placed before the nonce (ephemeral public key or b"")
+        plaintext: bytes to encrypt
+        out: writable buffer to encrypt into (at least the output size),
+             or None to allocate one
+
+    Returns:
+        bytearray: prefix + nonce (12) + ciphertext + tag (16), or a
+                   memoryview of that length into out
+    """
+    header = len(prefix) + 12
+    total = header + len(plaintext) + 16
+    if out is None:
+        out = bytearray(total)
+    else:
+        out = memoryview(out)[:total]
+    out[:len(prefix)] = prefix
+
+    nonce = _pool.take(12)
+    out[len(prefix):header] = nonce
+
+    CryptoBackend.encrypt_chacha20poly1305_into(key, nonce, plaintext, memoryview(out)[header:])
+    return out
+
+
+def encrypted_size(plaintext_len, prefix_len=0):
+    """
+    Size of the output of the encrypt functions for a given plaintext.
+
+    Args:
+        plaintext_len: plaintext length in bytes
+        prefix_len: 32 for encrypt_to_identity, len(prefix) for
+                    encrypt_group_message
+
+    Returns:
+        int: prefix + nonce (12) + ciphertext + tag (16) length
+    """
+    return prefix_len + 12 + plaintext_len + 16
+
+
+def encrypt_to_identity(plaintext, recipient_public_identity, sender_identity, out=None):
     """
     Encrypt a message to a recipient using X25519 ECDH + ChaCha20-Poly1305.
 
     Protocol:
     1. Generate ephemeral X25519 keypair
     2. Perform ECDH with recipient's X25519 public key
-    3. Derive encryption key using HKDF
+    3. Derive encryption key: SHA-256(shared secret || label)
     4. Encrypt with ChaCha20-Poly1305
     5. Return: ephemeral_public_key (32) + nonce (12) + ciphertext
 
@@ -23,9 +180,11 @@ def encrypt_to_identity(plaintext, recipient_public_identity, sender_identity):
         plaintext: bytes to encrypt
         recipient_public_identity: PublicIdentity of recipient
         sender_identity: Identity of sender (for authentication)
+        out: optional writable buffer to encrypt into (see encrypted_size);
+             a memoryview into it is returned
 
     Returns:
-        bytes: ephemeral_public (32) + nonce (12) + ciphertext
+        bytearray: ephemeral_public (32) + nonce (12) + ciphertext
     """
     # Generate ephemeral X25519 keypair
     ephemeral_private, ephemeral_public = CryptoBackend.x25519_generate_keypair()
@@ -36,17 +195,11 @@ def encrypt_to_identity(plaintext, recipient_public_identity, sender_identity):
         recipient_public_identity.encryption_public_key
     )
 
-    # Derive encryption key using HKDF
-    # Use protocol label for domain separation (no identity binding for now)
-    info = b"mycorrhizal_e2ee_v1"
-    encryption_key = CryptoBackend.hkdf_derive(shared_secret, length=32, info=info)
+    # Derive encryption key
+    encryption_key = _derive_key(shared_secret)
 
-    # Encrypt with ChaCha20-Poly1305
-    nonce = os.urandom(12)
-    ciphertext = CryptoBackend.encrypt_chacha20poly1305(encryption_key, nonce, plaintext)
-
-    # Return ephemeral_public + nonce + ciphertext
-    return ephemeral_public + nonce + ciphertext
+    # Encrypt with ChaCha20-Poly1305 straight into the output buffer
+    return _encrypt_with_prefix(encryption_key, ephemeral_public, plaintext, out)
 
 
 def decrypt_from_identity(encrypted, sender_public_identity, recipient_identity):
@@ -65,26 +218,116 @@ def decrypt_from_identity(encrypted, sender_public_identity, recipient_identity)
         raise ValueError("Encrypted data too short")
 
     # Extract components
-    ephemeral_public = encrypted[:32]
+    ephemeral_public = bytes(encrypted[:32])
     nonce = encrypted[32:44]
     ciphertext = encrypted[44:]
 
-    # Perform X25519 key exchange
-    shared_secret = CryptoBackend.x25519_exchange(
-        recipient_identity.encryption_private_key,
-        ephemeral_public
-    )
+    # Reuse the derived key if we've seen this ephemeral key before
+    cache_key = (recipient_identity.encryption_public_key, ephemeral_public)
+    encryption_key = _session_key_cache.get(cache_key)
+    cached = encryption_key is not None
+
+    if not cached:
+        # Perform X25519 key exchange
+        shared_secret = CryptoBackend.x25519_exchange(
+            recipient_identity.encryption_private_key,
+            ephemeral_public
+        )
 
-    # Derive encryption key using HKDF (same as sender)
-    info = b"mycorrhizal_e2ee_v1"
-    encryption_key = CryptoBackend.hkdf_derive(shared_secret, length=32, info=info)
+        # Derive encryption key (same as sender)
+        encryption_key = _derive_key(shared_secret)
 
-    # Decrypt with ChaCha20-Poly1305
+    # Decrypt with ChaCha20-Poly1305 (raises if authentication fails)
     plaintext = CryptoBackend.decrypt_chacha20poly1305(encryption_key, nonce, ciphertext)
 
+    # Cache only keys that authenticated a message, so junk ephemeral keys
+    # can't flush the cache
+    if not cached:
+        if len(_session_key_cache) >= _SESSION_KEY_CACHE_SIZE:
+            # Evict the oldest entry
+            del _session_key_cache[next(iter(_session_key_cache))]
+        _session_key_cache[cache_key] = encryption_key
+
     return plaintext
 
 
+def create_session(recipient_public_identity):
+    """
+    Set up a reusable encryption session to a recipient.
+
+    Does the ephemeral keypair generation, X25519 exchange and key
+    derivation once; encrypt_session() then only runs ChaCha20-Poly1305. The recipient
+    caches the derived key per ephemeral key, so its side is cheap too.
+
+    Args:
+        recipient_public_identity: PublicIdentity of recipient
+
+    Returns:
+        tuple: (ephemeral_public, encryption_key) for encrypt_session()
+    """
+    ephemeral_private, ephemeral_public = CryptoBackend.x25519_generate_keypair()
+
+    shared_secret = CryptoBackend.x25519_exchange(
+        ephemeral_private,
+        recipient_public_identity.encryption_public_key
+    )
+
+    encryption_key = _derive_key(shared_secret)
+
+    return ephemeral_public, encryption_key
+
+
+def encrypt_session(session, plaintext):
+    """
+    Encrypt a message under an existing session (no key exchange).
+
+    Output format is the same as encrypt_to_identity, so the recipient
+    decrypts it with decrypt_from_identity.
+
+    Args:
+        session: (ephemeral_public, encryption_key) from create_session()
+        plaintext: bytes to encrypt
+
+    Returns:
+        bytearray: ephemeral_public (32) + nonce (12) + ciphertext
+    """
+    ephemeral_public, encryption_key = session
+    return _encrypt_with_prefix(encryption_key, ephemeral_public, plaintext)
+
+
+def encrypt_to_identities(plaintext, recipient_public_identities, sender_identity):
+    """
+    Encrypt the same message to several recipients.
+
+    Generates one ephemeral keypair for all recipients instead of one per
+    message, then does one X25519 exchange and key derivation per
+    recipient. Each ciphertext uses its own nonce and has the
+    encrypt_to_identity format, so recipients decrypt it with
+    decrypt_from_identity.
+
+    Args:
+        plaintext: bytes to encrypt
+        recipient_public_identities: iterable of PublicIdentity
+        sender_identity: Identity of sender (for authentication)
+
+    Returns:
+        dict: {recipient address (bytes): ephemeral_public + nonce + ciphertext}
+    """
+    ephemeral_private, ephemeral_public = CryptoBackend.x25519_generate_keypair()
+
+    encrypted = {}
+    for recipient in recipient_public_identities:
+        shared_secret = CryptoBackend.x25519_exchange(
+            ephemeral_private,
+            recipient.encryption_public_key
+        )
+        encryption_key = _derive_key(shared_secret)
+        encrypted[recipient.address] = _encrypt_with_prefix(
+            encryption_key, ephemeral_public, plaintext)
+
+    return encrypted
+
+
 def generate_group_key():
     """
     Generate a symmetric key for group encryption.
@@ -92,10 +335,11 @@ def generate_group_key():
     Returns:
         bytes: 32-byte encryption key
     """
+    # Straight from the OS, not the nonce pool: no buffered key material
     return os.urandom(32)
 
 
-def encrypt_group_message(plaintext, group_key):
+def encrypt_group_message(plaintext, group_key, prefix=b"", out=None):
     """
     Encrypt a message with a shared group key.
 
@@ -104,23 +348,30 @@ def encrypt_group_message(plaintext, group_key):
     Args:
         plaintext: bytes to encrypt
         group_key: 32-byte symmetric key
+        prefix: bytes to place before the nonce in the same buffer (e.g. a
+                colony ID), saving a copy of the ciphertext later
+        out: optional writable buffer to encrypt into (see encrypted_size);
+             a memoryview into it is returned
 
     Returns:
-        bytes: nonce (12 bytes) + ciphertext + tag
+        bytearray: prefix + nonce (12 bytes) + ciphertext + tag
     """
-    # Generate random nonce
-    nonce = os.urandom(12)
-
     try:
-        # Encrypt with ChaCha20-Poly1305
-        ciphertext = CryptoBackend.encrypt_chacha20poly1305(group_key, nonce, plaintext)
-
-        # Return nonce + ciphertext (ciphertext already includes auth tag)
-        return nonce + ciphertext
+        # Nonce + ciphertext (ciphertext already includes auth tag)
+        return _encrypt_with_prefix(group_key, prefix, plaintext, out)
     except NotImplementedError:
         # Fallback if ChaCha20 not implemented yet: return plaintext with marker
         # In production, this would fail
-        return b'\x00' * 12 + plaintext
+        header = len(prefix) + 12
+        total = header + len(plaintext)
+        if out is None:
+            out = bytearray(total)
+        else:
+            out = memoryview(out)[:total]
+        out[:len(prefix)] = prefix
+        out[len(prefix):header] = _ZERO_NONCE
+        out[header:] = plaintext
+        return out
 
 
 def decrypt_group_message(encrypted, group_key):
@@ -142,7 +393,7 @@ def decrypt_group_message(encrypted, group_key):
     ciphertext = encrypted[12:]
 
     # Check for fallback marker (unencrypted)
-    if nonce == b'\x00' * 12:
+    if _compare_digest(nonce, _ZERO_NONCE):
         return ciphertext
 
     try:
@@ -46,8 +46,21 @@ class Identity:
             self.encryption_private_key = encryption_private_key
             self.encryption_public_key = encryption_public_key
 
-        # Generate 128-bit address from public key
-        self.address = self._generate_address()
+        # 128-bit address, derived from the public key on first access
+        self._address = None
+        self._address_hex = None
+
+        # 128-byte serialized form, built on first to_bytes() (keys don't
+        # change after construction)
+        self._serialized = None
+
+    @property
+    def address(self):
+        """16-byte address (computed on first access, then cached)"""
+        address = self._address
+        if address is None:
+            address = self._address = self._generate_address()
+        return address
 
     def _generate_address(self):
         """
@@ -57,7 +70,7 @@ class Identity:
             bytes: 16-byte (128-bit) address
         """
         # Hash the public key
-        hash_digest = CryptoBackend.hash_sha256(self.signing_public_key)
+        hash_digest = CryptoBackend.hash_sha256_32(self.signing_public_key)
 
         # Take first 16 bytes (128 bits)
         address = hash_digest[:16]
@@ -116,10 +129,13 @@ class Identity:
         Returns:
             bytes: Serialized identity
         """
-        return (self.signing_private_key +
-                self.signing_public_key +
-                self.encryption_private_key +
-                self.encryption_public_key)
+        serialized = self._serialized
+        if serialized is None:
+            serialized = self._serialized = b''.join((self.signing_private_key,
+                                                      self.signing_public_key,
+                                                      self.encryption_private_key,
+                                                      self.encryption_public_key))
+        return serialized
 
     @staticmethod
     def from_bytes(data):
@@ -135,21 +151,25 @@ class Identity:
         if len(data) != 128:
             raise ValueError(f"Invalid identity data length: {len(data)} (expected 128)")
 
-        signing_private_key = data[0:32]
-        signing_public_key = data[32:64]
-        encryption_private_key = data[64:96]
-        encryption_public_key = data[96:128]
+        # One copy of the whole record, kept as the serialized form, then
+        # one slice per key
+        serialized = bytes(data)
 
-        return Identity(
-            signing_private_key=signing_private_key,
-            signing_public_key=signing_public_key,
-            encryption_private_key=encryption_private_key,
-            encryption_public_key=encryption_public_key
+        identity = Identity(
+            signing_private_key=serialized[0:32],
+            signing_public_key=serialized[32:64],
+            encryption_private_key=serialized[64:96],
+            encryption_public_key=serialized[96:128]
         )
+        identity._serialized = serialized
+        return identity
 
     def address_hex(self):
-        """Get address as hex string"""
-        return self.address.hex()
+        """Get address as hex string (cached)"""
+        address_hex = self._address_hex
+        if address_hex is None:
+            address_hex = self._address_hex = self.address.hex()
+        return address_hex
 
     def __repr__(self):
         return f"Identity(address={self.address_hex()})"
@@ -171,20 +191,75 @@ class PublicIdentity:
         """
         self.signing_public_key = signing_public_key
         self.encryption_public_key = encryption_public_key
-        self.address = self._generate_address()
+
+        # Address derived on first access
+        self._address = None
+        self._address_hex = None
+
+    @property
+    def address(self):
+        """16-byte address (computed on first access, then cached)"""
+        address = self._address
+        if address is None:
+            address = self._address = self._generate_address()
+        return address
+
+    @classmethod
+    def from_announce_payload(cls, payload):
+        """
+        Create public identity from an announce payload.
+
+        The keys are copied out of the payload exactly once (via memoryview
+        slices, so payload may be any buffer). They are not kept as views:
+        cached identities would otherwise pin the whole receive buffer.
+
+        Args:
+            payload: Announce payload (signing key + encryption key, 64 bytes)
+
+        Returns:
+            PublicIdentity
+
+        Raises:
+            ValueError: If payload is shorter than 64 bytes
+        """
+        if len(payload) < 64:
+            raise ValueError(f"Announce payload too short: {len(payload)} < 64")
+
+        mv = memoryview(payload)
+        return cls(bytes(mv[0:32]), bytes(mv[32:64]))
 
     def _generate_address(self):
         """Generate address from public key"""
-        hash_digest = CryptoBackend.hash_sha256(self.signing_public_key)
+        hash_digest = CryptoBackend.hash_sha256_32(self.signing_public_key)
         return hash_digest[:16]
 
     def verify(self, message, signature):
         """Verify signature from this identity"""
         return CryptoBackend.verify(self.signing_public_key, message, signature)
 
+    @classmethod
+    def verify_many(cls, items):
+        """
+        Verify signatures from several identities in one backend call.
+
+        Args:
+            items: list of (PublicIdentity, message, signature) tuples
+
+        Returns:
+            list: bool per item
+        """
+        return CryptoBackend.verify_batch(
+            [item[0].signing_public_key for item in items],
+            [item[1] for item in items],
+            [item[2] for item in items]
+        )
+
     def address_hex(self):
-        """Get address as hex string"""
-        return self.address.hex()
+        """Get address as hex string (cached)"""
+        address_hex = self._address_hex
+        if address_hex is None:
+            address_hex = self._address_hex = self.address.hex()
+        return address_hex
 
     def __repr__(self):
         return f"PublicIdentity(address={self.address_hex()})"
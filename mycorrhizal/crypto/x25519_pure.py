@@ -1,17 +1,36 @@
 """
 Pure Python X25519 Implementation
 
-This is a stub for a pure Python X25519 ECDH implementation compatible with MicroPython.
+Pure Python X25519 ECDH (RFC 7748) compatible with MicroPython.
 
 X25519 is the Diffie-Hellman key exchange using Curve25519.
 
-For production use, consider porting:
-- python-pure25519 by Brian Warner: https://github.com/warner/python-pure25519
-- Curve25519 by Daniel J. Bernstein: https://cr.yp.to/ecdh.html
+When libsodium is available (PyNaCl on CPython) scalar multiplication is
+delegated to its assembly implementation; otherwise the Montgomery ladder
+below is used.
 
 Note: X25519 uses Montgomery curve arithmetic, which is simpler than Ed25519's twisted Edwards curve.
 """
 
+from ._field import montgomery_ladder
+
+try:
+    from nacl.bindings import crypto_scalarmult as _nacl_scalarmult
+    from nacl.bindings import crypto_scalarmult_base as _nacl_scalarmult_base
+except ImportError:
+    _nacl_scalarmult = None
+    _nacl_scalarmult_base = None
+
+
+# Curve25519 constants
+# Montgomery curve: y² = x³ + 486662x² + x (mod p)
+# p = 2^255 - 19 (field prime)
+# Base point u-coordinate: u = 9
+
+P = 2**255 - 19
+A = 486662
+BASE_U = 9
+
 
 class X25519PrivateKey:
     """X25519 private key for ECDH key exchange"""
@@ -55,10 +74,6 @@ class X25519PrivateKey:
         Returns:
             X25519PublicKey
         """
-        # TODO: Implement X25519 public key generation
-        # public_key = scalar_mult(private_scalar, base_point_u)
-        # base_point_u = 9 (u-coordinate of Curve25519 base point)
-
         public_bytes = _x25519_scalar_mult_base(self.private_bytes)
         return X25519PublicKey(public_bytes)
 
@@ -72,9 +87,6 @@ class X25519PrivateKey:
         Returns:
             bytes: 32-byte shared secret
         """
-        # TODO: Implement X25519 key exchange
-        # shared_secret = scalar_mult(our_private_scalar, their_public_point_u)
-
         return _x25519_scalar_mult(self.private_bytes, peer_public_key.public_bytes)
 
     def to_bytes(self):
@@ -129,75 +141,69 @@ def _x25519_scalar_mult_base(scalar):
     Compute scalar * base_point on Curve25519.
 
     Args:
-        scalar: 32-byte clamped private key
+        scalar: 32-byte private key (clamped per RFC 7748)
 
     Returns:
         bytes: 32-byte u-coordinate of result point
     """
-    # TODO: Implement scalar multiplication with base point (u=9)
-    # This is the core operation for generating public keys
-    # Use Montgomery ladder algorithm for constant-time execution
+    if _nacl_scalarmult_base is not None:
+        return _nacl_scalarmult_base(bytes(scalar))
 
-    base_u = 9
-    return _x25519_scalar_mult(scalar, _u_to_bytes(base_u))
+    return _x25519_ladder(scalar, _u_to_bytes(BASE_U))
 
 
 def _x25519_scalar_mult(scalar, u_coordinate):
     """
-    Compute scalar * point on Curve25519 (Montgomery ladder).
+    Compute scalar * point on Curve25519.
 
     Args:
-        scalar: 32-byte clamped private key
+        scalar: 32-byte private key (clamped per RFC 7748)
         u_coordinate: 32-byte u-coordinate of point
 
     Returns:
         bytes: 32-byte u-coordinate of result point
     """
-    # TODO: Implement Montgomery ladder for X25519
-    # This is the core ECDH operation
-    #
-    # Montgomery ladder algorithm (constant-time):
-    # 1. Initialize: x_1 = u, x_2 = 1, z_2 = 0, x_3 = u, z_3 = 1
-    # 2. For each bit of scalar (from high to low):
-    #    - If bit is 0: (x_2, z_2), (x_3, z_3) = ladder_step((x_2, z_2), (x_3, z_3), u)
-    #    - If bit is 1: (x_3, z_3), (x_2, z_2) = ladder_step((x_2, z_2), (x_3, z_3), u)
-    # 3. Return x_2 / z_2 (mod p)
+    if _nacl_scalarmult is not None:
+        return _nacl_scalarmult(bytes(scalar), bytes(u_coordinate))
 
-    raise NotImplementedError("X25519 scalar multiplication not yet implemented")
+    return _x25519_ladder(scalar, u_coordinate)
 
 
-def _montgomery_ladder_step(x_1, x_2, z_2, x_3, z_3):
+def _x25519_ladder(scalar, u_coordinate):
     """
-    Single step of Montgomery ladder.
+    Montgomery ladder scalar multiplication (RFC 7748 section 5).
+
+    The ladder itself lives in _field.montgomery_ladder.
 
     Args:
-        x_1: u-coordinate of input point (constant)
-        x_2, z_2: Projective coordinates of current point
-        x_3, z_3: Projective coordinates of next point
+        scalar: 32-byte private key (clamped here per RFC 7748)
+        u_coordinate: 32-byte u-coordinate of point
 
     Returns:
-        tuple: New (x_2, z_2, x_3, z_3)
+        bytes: 32-byte u-coordinate of result point
     """
-    # TODO: Implement Montgomery ladder step
-    # Uses only x-coordinates (Montgomery form)
-    # Formulas from Curve25519 paper
+    k = _decode_scalar(scalar)
+    # Mask the unused top bit of the u-coordinate
+    u = _bytes_to_u(u_coordinate) & ((1 << 255) - 1)
 
-    raise NotImplementedError()
+    return _u_to_bytes(montgomery_ladder(k, u))
 
 
-def _modular_inverse(x, p=P):
+def _decode_scalar(scalar):
     """
-    Compute modular inverse using Fermat's little theorem.
+    Clamp a 32-byte scalar and decode it to an integer (RFC 7748).
 
     Args:
-        x: value to invert
-        p: prime modulus (default: Curve25519 p)
+        scalar: 32-byte private key
 
     Returns:
-        int: x^-1 mod p
+        int: clamped scalar
     """
-    # For prime p: x^-1 = x^(p-2) mod p
-    return pow(x, p - 2, p)
+    k = bytearray(scalar)
+    k[0] &= 0xF8
+    k[31] &= 0x7F
+    k[31] |= 0x40
+    return int.from_bytes(k, 'little')
 
 
 def _u_to_bytes(u):
@@ -226,38 +232,9 @@ def _bytes_to_u(bytes32):
     return int.from_bytes(bytes32, 'little')
 
 
-# Curve25519 constants
-# Montgomery curve: y² = x³ + 486662x² + x (mod p)
-# p = 2^255 - 19 (field prime)
-# Base point u-coordinate: u = 9
-
-P = 2**255 - 19
-A = 486662
-BASE_U = 9
-
-
-# Note to implementer:
-# The full X25519 implementation requires:
-# 1. Big integer arithmetic (MicroPython supports this natively)
-# 2. Modular arithmetic (%, pow with 3 args)
-# 3. Montgomery ladder (constant-time scalar multiplication)
-# 4. Projective coordinates (to avoid expensive divisions)
-#
-# Estimated code size: ~300-500 lines for complete implementation
-# Performance: ~50-200ms per key exchange on ESP32-S3 @ 240MHz
-#
-# X25519 is SIMPLER than Ed25519 because:
-# - Only uses x-coordinates (Montgomery form)
-# - No point compression/decompression
-# - Simpler group law formulas
-# - No signature operations, just scalar multiplication
-#
-# Recommended approach:
-# 1. Implement basic modular arithmetic helpers
-# 2. Implement Montgomery ladder (core algorithm)
-# 3. Implement clamping and byte conversion
-# 4. Test against known test vectors
-# 5. Optimize if needed (projective coordinates, reduce allocations)
+# Performance: ~255 ladder steps of 10 bigint multiplications each per
+# key exchange on the pure path (see _field.montgomery_ladder); libsodium
+# is used instead when present.
 #
 # Test vectors available at:
 # https://datatracker.ietf.org/doc/html/rfc7748#section-5.2
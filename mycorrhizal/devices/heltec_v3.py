@@ -20,6 +20,8 @@ This device implementation handles the Heltec V3-specific:
 try:
     # MicroPython imports
     from machine import Pin, SPI
+    import micropython
+    from micropython import const
     import time
     MICROPYTHON = True
 except ImportError:
@@ -27,44 +29,78 @@ except ImportError:
     MICROPYTHON = False
     import time
 
+    def const(x):
+        return x
+
+# Hot-path diagnostics; with const(0) the compiler drops the `if _DEBUG:`
+# blocks entirely
+_DEBUG = const(0)
+
 from ..phycore.lora import LoRaDevice
 
 
 # Heltec V3 Pin Definitions (from Boards.h analysis)
+# Underscore consts are inlined by the MicroPython compiler (no dict lookup,
+# no global); the dicts below are kept for external introspection.
+
+# SX1262 LoRa Radio
+_LORA_SS = const(8)       # SPI Chip Select
+_LORA_SCK = const(9)      # SPI Clock
+_LORA_MOSI = const(10)    # SPI MOSI
+_LORA_MISO = const(11)    # SPI MISO
+_LORA_RST = const(12)     # Reset
+_LORA_BUSY = const(13)    # Busy signal
+_LORA_DIO1 = const(14)    # Interrupt (IRQ)
+_LORA_SPI_BAUDRATE = const(10_000_000)  # Short on-board traces: 10 MHz is safe
+
+# OLED Display (0.96" 128x64)
+_OLED_SDA = const(17)     # I2C SDA
+_OLED_SCL = const(18)     # I2C SCL
+_OLED_RST = const(21)     # Reset (also used as display enable pin)
+_VEXT = const(36)         # Vext power supply for display (CRITICAL!)
+
+_LED = const(35)          # Status LED
+_BUTTON = const(0)        # User button
+_VBAT_ADC = const(1)      # Battery voltage ADC
+
+# SX1262 Configuration
+_HAS_TCXO = const(1)            # Heltec V3 has built-in TCXO
+_DIO2_AS_RF_SWITCH = const(1)   # Use DIO2 for automatic TX/RX switching
+
 HELTEC_V3_PINS = {
-    # SX1262 LoRa Radio
-    'lora_ss': 8,       # SPI Chip Select
-    'lora_sck': 9,      # SPI Clock
-    'lora_mosi': 10,    # SPI MOSI
-    'lora_miso': 11,    # SPI MISO
-    'lora_rst': 12,     # Reset
-    'lora_busy': 13,    # Busy signal
-    'lora_dio1': 14,    # Interrupt (IRQ)
-
-    # OLED Display (0.96" 128x64)
-    'oled_sda': 17,     # I2C SDA
-    'oled_scl': 18,     # I2C SCL
-    'oled_rst': 21,     # Reset (also used as display enable pin)
-    'vext': 36,         # Vext power supply for display (CRITICAL!)
-
-    # LED
-    'led': 35,          # Status LED
-
-    # Button
-    'button': 0,        # User button
-
-    # Battery
-    'vbat_adc': 1,      # Battery voltage ADC
+    'lora_ss': _LORA_SS,
+    'lora_sck': _LORA_SCK,
+    'lora_mosi': _LORA_MOSI,
+    'lora_miso': _LORA_MISO,
+    'lora_rst': _LORA_RST,
+    'lora_busy': _LORA_BUSY,
+    'lora_dio1': _LORA_DIO1,
+    'oled_sda': _OLED_SDA,
+    'oled_scl': _OLED_SCL,
+    'oled_rst': _OLED_RST,
+    'vext': _VEXT,
+    'led': _LED,
+    'button': _BUTTON,
+    'vbat_adc': _VBAT_ADC,
 }
 
-# SX1262 Configuration
 SX1262_CONFIG = {
-    'has_tcxo': True,           # Heltec V3 has built-in TCXO
-    'dio2_as_rf_switch': True,  # Use DIO2 for automatic TX/RX switching
+    'has_tcxo': bool(_HAS_TCXO),
+    'dio2_as_rf_switch': bool(_DIO2_AS_RF_SWITCH),
     'tcxo_voltage': 3.3,        # TCXO voltage
 }
 
 
+def _lora_bitrate(bandwidth, sf, cr):
+    """
+    LoRa bitrate in bps, integer math only.
+
+    sf * (bandwidth / 2^sf) * (4 / cr), rounded down; matches
+    SX1262.calculate_bitrate for every legal bandwidth/SF/CR.
+    """
+    return sf * bandwidth * 4 // (cr << sf)
+
+
 if MICROPYTHON:
     # Import SX1262 low-level driver
     from . import sx1262_driver
@@ -102,12 +138,14 @@ if MICROPYTHON:
             self.device_name = device_name
 
             # Initialize pins
-            self.pin_led = Pin(HELTEC_V3_PINS['led'], Pin.OUT, value=0)
-            self.pin_button = Pin(HELTEC_V3_PINS['button'], Pin.IN, Pin.PULL_UP)
+            self.pin_led = Pin(_LED, Pin.OUT, value=0)
+            self.pin_button = Pin(_BUTTON, Pin.IN, Pin.PULL_UP)
 
             # Button handler for page switching / pairing
             self._last_button_press = 0
             self._button_debounce = 200  # ms
+            self._button_flag = False
+            self.pin_button.irq(trigger=Pin.IRQ_FALLING, handler=self._button_isr, hard=True)
 
             # Initialize display first (so BLE can show pairing)
             self.display = None
@@ -121,27 +159,29 @@ if MICROPYTHON:
 
             # Initialize SX1262 driver with Heltec V3 pinout
             self.radio = sx1262_driver.SX1262(
-                pin_ss=HELTEC_V3_PINS['lora_ss'],
-                pin_sck=HELTEC_V3_PINS['lora_sck'],
-                pin_mosi=HELTEC_V3_PINS['lora_mosi'],
-                pin_miso=HELTEC_V3_PINS['lora_miso'],
-                pin_rst=HELTEC_V3_PINS['lora_rst'],
-                pin_busy=HELTEC_V3_PINS['lora_busy'],
-                pin_dio1=HELTEC_V3_PINS['lora_dio1'],
-                has_tcxo=SX1262_CONFIG['has_tcxo'],
-                dio2_as_rf_switch=SX1262_CONFIG['dio2_as_rf_switch']
+                pin_ss=_LORA_SS,
+                pin_sck=_LORA_SCK,
+                pin_mosi=_LORA_MOSI,
+                pin_miso=_LORA_MISO,
+                pin_rst=_LORA_RST,
+                pin_busy=_LORA_BUSY,
+                pin_dio1=_LORA_DIO1,
+                has_tcxo=_HAS_TCXO,
+                dio2_as_rf_switch=_DIO2_AS_RF_SWITCH,
+                spi_baudrate=_LORA_SPI_BAUDRATE
             )
 
             # Set initial configuration
             self.radio.set_frequency(frequency)
-            self.radio.set_spreading_factor(spreading_factor)
-            self.radio.set_bandwidth(bandwidth)
-            self.radio.set_coding_rate(coding_rate)
+            self.radio.configure_modulation(spreading_factor, bandwidth, coding_rate)
             self.radio.set_tx_power(tx_power)
 
             # Set up receive callback routing
             self.radio.set_receive_callback(self._on_radio_receive)
 
+            # Bitrate only changes through set_config()
+            self._bitrate = _lora_bitrate(bandwidth, spreading_factor, coding_rate)
+
             # Node state for display
             self.node_state = {
                 'name': device_name,
@@ -159,7 +199,7 @@ if MICROPYTHON:
                     'spreading_factor': spreading_factor,
                     'bandwidth': bandwidth,
                     'tx_power': tx_power,
-                    'bitrate': self.radio.calculate_bitrate(bandwidth, spreading_factor, coding_rate)
+                    'bitrate': self._bitrate
                 },
                 'battery': {
                     'voltage': 0.0,
@@ -172,21 +212,34 @@ if MICROPYTHON:
             # Start time for uptime
             self._start_time = time.ticks_ms()
 
-            # RSSI sampling for waterfall
+            # RSSI sampling for waterfall (an SPI transaction per sample)
             self._last_rssi_update = 0
-            self._rssi_update_interval = 1000  # Sample RSSI every 1 second
+            self._rssi_update_interval = 1000  # Sample RSSI every 1 second when idle
+            self._rssi_busy_interval = 5000    # ...every 5 s while transmitting
+            self._rssi_quiet_time = 2000       # ms after the last TX before back to idle rate
+            self._last_tx_time = None
+
+            # OLED repaint rate: update() can run much faster (button/IRQ
+            # latency) without paying for I2C frame pushes
+            self._last_display_update = 0
+            self._display_interval = 100  # ms (10 Hz)
+
+            # Repaint only when something shown changed (see _set)
+            self._dirty = True
+            self._last_activity = None
+            self._activity_repaint = 600  # ms: TX/RX blips last 500 ms
 
         def _init_display(self):
             """Initialize OLED display with proper Heltec V3 power sequencing"""
             try:
                 # CRITICAL: Enable Vext (pin 36) to power the display
                 # This MUST be done before any display initialization!
-                pin_vext = Pin(HELTEC_V3_PINS['vext'], Pin.OUT)
+                pin_vext = Pin(_VEXT, Pin.OUT)
                 pin_vext.value(0)  # LOW enables Vext
                 time.sleep_ms(50)
 
                 # Enable display power (pin 21 also acts as enable)
-                pin_disp_en = Pin(HELTEC_V3_PINS['oled_rst'], Pin.OUT)
+                pin_disp_en = Pin(_OLED_RST, Pin.OUT)
                 pin_disp_en.value(0)
                 time.sleep_ms(50)
                 pin_disp_en.value(1)
@@ -196,9 +249,9 @@ if MICROPYTHON:
                 from ..ui.display import DisplayManager
 
                 self.display = DisplayManager(
-                    scl_pin=HELTEC_V3_PINS['oled_scl'],
-                    sda_pin=HELTEC_V3_PINS['oled_sda'],
-                    rst_pin=HELTEC_V3_PINS['oled_rst']
+                    scl_pin=_OLED_SCL,
+                    sda_pin=_OLED_SDA,
+                    rst_pin=_OLED_RST
                 )
                 print("Display: Initialized")
             except Exception as e:
@@ -219,13 +272,20 @@ if MICROPYTHON:
                 print(f"Warning: Could not initialize BLE: {e}")
                 self.ble = None
 
+        @micropython.native
+        def _button_isr(self, pin):
+            """Button hard IRQ: debounce and flag the press (no allocation)"""
+            now = time.ticks_ms()
+            if time.ticks_diff(now, self._last_button_press) > self._button_debounce:
+                self._last_button_press = now
+                self._button_flag = True
+
+        @micropython.native
         def check_button(self):
             """Check button press for actions"""
-            if self.pin_button.value() == 0:  # Button pressed (active low)
-                now = time.ticks_ms()
-                if time.ticks_diff(now, self._last_button_press) > self._button_debounce:
-                    self._last_button_press = now
-                    self._handle_button_press()
+            if self._button_flag:
+                self._button_flag = False
+                self._handle_button_press()
 
         def _handle_button_press(self):
             """Handle button press"""
@@ -235,7 +295,8 @@ if MICROPYTHON:
             # For now, just cycle pages
             if self.display:
                 self.display.next_page()
-                print("Button: Next page")
+                if _DEBUG:
+                    print("Button: Next page")
 
             # TODO: Add long-press detection for pairing
 
@@ -243,7 +304,7 @@ if MICROPYTHON:
             """Enable BLE pairing mode"""
             if self.ble:
                 self.ble.enable_pairing()
-                self.node_state['pairing_state'] = 'waiting'
+                self._set('pairing_state', 'waiting')
 
         def update(self, node=None):
             """
@@ -252,64 +313,89 @@ if MICROPYTHON:
             Args:
                 node: Node instance (optional, for stats)
             """
+            # Local bindings: each global/attribute lookup is a dict lookup
+            # on MicroPython, and this runs every loop iteration
+            ticks_diff = time.ticks_diff
+            ns = self.node_state
+            radio = self.radio
+            display = self.display
+
             now = time.ticks_ms()
 
-            # Poll radio for received packets (call frequently)
-            if self.radio.poll_receive():
-                print("[Heltec] Packet received!")
-
-            # Update uptime
-            self.node_state['uptime'] = time.ticks_diff(now, self._start_time) // 1000
-
-            # Update from node if provided
-            if node:
-                self.node_state['address_hex'] = node.identity.address_hex()
-                self.node_state['online'] = any(p.online for p in node.phycores)
-                self.node_state['routes'] = node.route_table.size()
-                self.node_state['identities'] = node.identity_cache.size()
-
-                # Get TX/RX stats from phycores (SET, don't add!)
-                tx_packets = 0
-                tx_bytes = 0
-                rx_packets = 0
-                rx_bytes = 0
-                for phycore in node.phycores:
-                    tx_packets += phycore.tx_count
-                    tx_bytes += phycore.tx_bytes
-                    rx_packets += phycore.rx_count
-                    rx_bytes += phycore.rx_bytes
-
-                self.node_state['tx_packets'] = tx_packets
-                self.node_state['tx_bytes'] = tx_bytes
-                self.node_state['rx_packets'] = rx_packets
-                self.node_state['rx_bytes'] = rx_bytes
-
-            # Sample RSSI every second for waterfall display
-            if time.ticks_diff(now, self._last_rssi_update) >= self._rssi_update_interval:
-                rssi = self.radio.get_rssi()
-                if rssi is not None and self.display:
-                    self.display.update_waterfall(rssi)
+            # Service the radio only when the DIO1 IRQ flagged RX_DONE
+            if radio.irq_pending and radio.handle_irq():
+                if _DEBUG:
+                    print("[Heltec] Packet received!")
+
+            # Sample RSSI for the waterfall: every second when idle, backed
+            # off while transmitting, skipped when the waterfall isn't shown
+            rssi_interval = self._rssi_update_interval
+            last_tx = self._last_tx_time
+            if last_tx is not None and ticks_diff(now, last_tx) < self._rssi_quiet_time:
+                rssi_interval = self._rssi_busy_interval
+
+            if ticks_diff(now, self._last_rssi_update) >= rssi_interval:
+                if display and display.current_page == 0:  # Info page (waterfall)
+                    rssi = radio.get_rssi()
+                    if rssi is not None:
+                        display.update_waterfall(rssi)
+                        self._dirty = True
                 self._last_rssi_update = now
 
-            # Update BLE state for display
-            if self.ble:
-                self.node_state['ble_state'] = self.ble.get_state()
-                self.ble.check_pairing_timeout()
-            else:
-                self.node_state['ble_state'] = 'off'
-
-            # Update display
-            if self.display:
-                self.display.update(self.node_state)
+            ble = self.ble
+            if ble:
+                ble.check_pairing_timeout()
+
+            # Update display (waterfall samples accumulate in between). The
+            # stats only surface on the OLED, so gather them at its rate too.
+            if display and ticks_diff(now, self._last_display_update) >= self._display_interval:
+                set_ = self._set
+
+                # Not rendered by any page: doesn't dirty the frame
+                ns['uptime'] = ticks_diff(now, self._start_time) // 1000
+
+                set_('ble_state', ble.get_state() if ble else 'off')
+
+                if node:
+                    set_('address_hex', node.identity.address_hex())
+                    set_('online', any(p.online for p in node.phycores))
+                    set_('routes', node.route_table.size())
+                    set_('identities', node.identity_cache.size())
+                    tx_packets, tx_bytes, rx_packets, rx_bytes = node.tx_rx_totals()
+                    set_('tx_packets', tx_packets)
+                    set_('tx_bytes', tx_bytes)
+                    set_('rx_packets', rx_packets)
+                    set_('rx_bytes', rx_bytes)
+
+                # TX/RX blips switch on and off without a node_state change
+                last_activity = self._last_activity
+                if last_activity is not None and \
+                        ticks_diff(now, last_activity) <= self._activity_repaint:
+                    self._dirty = True
+
+                if self._dirty:
+                    # Rate limiting happens here, so bypass the display's own
+                    display.update(ns, force=True)
+                    self._dirty = False
+                self._last_display_update = now
 
             # Check button
             self.check_button()
 
+        def _set(self, key, value):
+            """Set a node_state field, marking the display dirty if it changed"""
+            ns = self.node_state
+            if ns.get(key) != value:
+                ns[key] = value
+                self._dirty = True
+
+        @micropython.native
         def _on_radio_receive(self, data):
             """Internal callback from radio, routes to phycore"""
             # Mark RX activity on display
             if self.display:
                 self.display.mark_rx()
+                self._last_activity = time.ticks_ms()
 
             if self.receive_callback:
                 self.receive_callback(data)
@@ -328,19 +414,40 @@ if MICROPYTHON:
 
         def send(self, data):
             """Transmit data"""
+            self._last_tx_time = self._last_activity = time.ticks_ms()
+
             # Mark TX activity on display
             if self.display:
                 self.display.mark_tx()
 
-            return self.radio.send(data)
+            # Keep the BLE stack quiet while the SX1262 is on air: the TX-done
+            # wait polls over SPI and shouldn't be interleaved with advertising
+            ble = self.ble
+            paused = ble.pause_adv() if ble else False
+            try:
+                return self.radio.send(data)
+            finally:
+                if paused:
+                    ble.resume_adv(paused)
+
+        def send_batch(self, packets):
+            """Transmit several packets back to back (one RX turnaround)"""
+            self._last_tx_time = self._last_activity = time.ticks_ms()
+
+            if self.display:
+                self.display.mark_tx()
+
+            ble = self.ble
+            paused = ble.pause_adv() if ble else False
+            try:
+                return self.radio.send_batch(packets)
+            finally:
+                if paused:
+                    ble.resume_adv(paused)
 
         def get_bitrate(self):
             """Get current bitrate"""
-            return self.radio.calculate_bitrate(
-                self.bandwidth,
-                self.spreading_factor,
-                self.coding_rate
-            )
+            return self._bitrate
 
         def get_config(self):
             """Get current configuration"""
@@ -364,14 +471,10 @@ if MICROPYTHON:
                 self.radio.set_frequency(self.frequency)
                 updated = True
 
-            if 'spreading_factor' in kwargs:
-                self.spreading_factor = kwargs['spreading_factor']
-                self.radio.set_spreading_factor(self.spreading_factor)
-                updated = True
-
-            if 'bandwidth' in kwargs:
-                self.bandwidth = kwargs['bandwidth']
-                self.radio.set_bandwidth(self.bandwidth)
+            if 'spreading_factor' in kwargs or 'bandwidth' in kwargs:
+                self.spreading_factor = kwargs.get('spreading_factor', self.spreading_factor)
+                self.bandwidth = kwargs.get('bandwidth', self.bandwidth)
+                self.radio.configure_modulation(sf=self.spreading_factor, bw=self.bandwidth)
                 updated = True
 
             if 'tx_power' in kwargs:
@@ -379,6 +482,22 @@ if MICROPYTHON:
                 self.radio.set_tx_power(self.tx_power)
                 updated = True
 
+            if updated:
+                if 'spreading_factor' in kwargs or 'bandwidth' in kwargs:
+                    self._bitrate = _lora_bitrate(
+                        self.bandwidth,
+                        self.spreading_factor,
+                        self.coding_rate
+                    )
+
+                lora = self.node_state['lora']
+                lora['frequency'] = self.frequency
+                lora['spreading_factor'] = self.spreading_factor
+                lora['bandwidth'] = self.bandwidth
+                lora['tx_power'] = self.tx_power
+                lora['bitrate'] = self._bitrate
+                self._dirty = True
+
             return updated
 
         def get_config_string(self):
@@ -401,8 +520,15 @@ else:
         def __init__(self, **kwargs):
             super().__init__()
             self.config = kwargs
+            self._update_bitrate()
             print("Warning: Using CPython stub for Heltec V3 (no actual radio)")
 
+        def _update_bitrate(self):
+            config = self.config
+            self._bitrate = _lora_bitrate(config.get('bandwidth', 125000),
+                                          config.get('spreading_factor', 9),
+                                          config.get('coding_rate', 5))
+
         def start(self):
             print("Heltec V3 stub: start()")
             return True
@@ -415,13 +541,14 @@ else:
             return True
 
         def get_bitrate(self):
-            return self.config.get('bandwidth', 125000) * self.config.get('spreading_factor', 9) / (2 ** 9)
+            return self._bitrate
 
         def get_config(self):
             return self.config
 
         def set_config(self, **kwargs):
             self.config.update(kwargs)
+            self._update_bitrate()
             return True
 
         def get_config_string(self):
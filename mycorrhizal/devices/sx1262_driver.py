@@ -16,63 +16,72 @@ Supports:
 """
 
 from machine import Pin, SPI
+import micropython
+from micropython import const
 import time
 
+# BUSY pin reads before _wait_on_busy() falls back to sleeping
+# (a few hundred microseconds on an ESP32)
+_BUSY_SPINS = const(200)
+
+# Most packets handle_irq() drains per call
+_RX_DRAIN_MAX = const(4)
+
 # SX1262 OpCodes
-OP_RF_FREQ = 0x86
-OP_SLEEP = 0x84
-OP_STANDBY = 0x80
-OP_TX = 0x83
-OP_RX = 0x82
-OP_PA_CONFIG = 0x95
-OP_SET_IRQ_FLAGS = 0x08
-OP_CLEAR_IRQ_STATUS = 0x02
-OP_GET_IRQ_STATUS = 0x12
-OP_RX_BUFFER_STATUS = 0x13
-OP_PACKET_STATUS = 0x14
-OP_CURRENT_RSSI = 0x15
-OP_MODULATION_PARAMS = 0x8B
-OP_PACKET_PARAMS = 0x8C
-OP_STATUS = 0xC0
-OP_TX_PARAMS = 0x8E
-OP_PACKET_TYPE = 0x8A
-OP_BUFFER_BASE_ADDR = 0x8F
-OP_READ_REGISTER = 0x1D
-OP_WRITE_REGISTER = 0x0D
-OP_DIO3_TCXO_CTRL = 0x97
-OP_DIO2_RF_CTRL = 0x9D
-OP_CALIBRATE = 0x89
-OP_REGULATOR_MODE = 0x96
-OP_CALIBRATE_IMAGE = 0x98
-OP_FIFO_WRITE = 0x0E
-OP_FIFO_READ = 0x1E
+OP_RF_FREQ = const(0x86)
+OP_SLEEP = const(0x84)
+OP_STANDBY = const(0x80)
+OP_TX = const(0x83)
+OP_RX = const(0x82)
+OP_PA_CONFIG = const(0x95)
+OP_SET_IRQ_FLAGS = const(0x08)
+OP_CLEAR_IRQ_STATUS = const(0x02)
+OP_GET_IRQ_STATUS = const(0x12)
+OP_RX_BUFFER_STATUS = const(0x13)
+OP_PACKET_STATUS = const(0x14)
+OP_CURRENT_RSSI = const(0x15)
+OP_MODULATION_PARAMS = const(0x8B)
+OP_PACKET_PARAMS = const(0x8C)
+OP_STATUS = const(0xC0)
+OP_TX_PARAMS = const(0x8E)
+OP_PACKET_TYPE = const(0x8A)
+OP_BUFFER_BASE_ADDR = const(0x8F)
+OP_READ_REGISTER = const(0x1D)
+OP_WRITE_REGISTER = const(0x0D)
+OP_DIO3_TCXO_CTRL = const(0x97)
+OP_DIO2_RF_CTRL = const(0x9D)
+OP_CALIBRATE = const(0x89)
+OP_REGULATOR_MODE = const(0x96)
+OP_CALIBRATE_IMAGE = const(0x98)
+OP_FIFO_WRITE = const(0x0E)
+OP_FIFO_READ = const(0x1E)
 
 # IRQ Masks
-IRQ_TX_DONE = 0x01
-IRQ_RX_DONE = 0x02
-IRQ_PREAMBLE_DET = 0x04
-IRQ_HEADER_DET = 0x10
-IRQ_CRC_ERROR = 0x40
+IRQ_TX_DONE = const(0x01)
+IRQ_RX_DONE = const(0x02)
+IRQ_PREAMBLE_DET = const(0x04)
+IRQ_HEADER_DET = const(0x10)
+IRQ_CRC_ERROR = const(0x40)
 
 # Registers
-REG_OCP = 0x08E7
-REG_LNA = 0x08AC
-REG_SYNC_WORD_MSB = 0x0740
-REG_SYNC_WORD_LSB = 0x0741
+REG_OCP = const(0x08E7)
+REG_LNA = const(0x08AC)
+REG_SYNC_WORD_MSB = const(0x0740)
+REG_SYNC_WORD_LSB = const(0x0741)
 
 # Modes
-MODE_LONG_RANGE = 0x01  # LoRa mode
-MODE_STDBY_RC = 0x00
-MODE_TCXO_3_3V = 0x07
-MODE_IMPLICIT_HEADER = 0x01
-MODE_EXPLICIT_HEADER = 0x00
+MODE_LONG_RANGE = const(0x01)  # LoRa mode
+MODE_STDBY_RC = const(0x00)
+MODE_TCXO_3_3V = const(0x07)
+MODE_IMPLICIT_HEADER = const(0x01)
+MODE_EXPLICIT_HEADER = const(0x00)
 
 # Sync word
-SYNC_WORD = 0x1424
+SYNC_WORD = const(0x1424)
+_SYNC_WORD_BYTES = bytes(((SYNC_WORD >> 8) & 0xFF, SYNC_WORD & 0xFF))
 
-# Frequency calculation
-XTAL_FREQ = 32000000
-FREQ_STEP = XTAL_FREQ / (2**25)
+# Frequency calculation: freq_raw = frequency * 2^25 / XTAL_FREQ
+XTAL_FREQ = const(32000000)
 
 # Bandwidth lookup
 BW_TABLE = {
@@ -93,7 +102,7 @@ class SX1262:
     """Low-level SX1262 radio driver"""
 
     def __init__(self, pin_ss, pin_sck, pin_mosi, pin_miso, pin_rst, pin_busy, pin_dio1,
-                 has_tcxo=True, dio2_as_rf_switch=True):
+                 has_tcxo=True, dio2_as_rf_switch=True, spi_baudrate=8_000_000):
         """
         Initialize SX1262 driver.
 
@@ -107,6 +116,7 @@ class SX1262:
             pin_dio1: Interrupt pin number
             has_tcxo: Enable TCXO (default True)
             dio2_as_rf_switch: Use DIO2 for RF switching (default True)
+            spi_baudrate: SPI clock in Hz (default 8 MHz; the SX1262 allows up to 16 MHz)
         """
         self.has_tcxo = has_tcxo
         self.dio2_as_rf_switch = dio2_as_rf_switch
@@ -117,10 +127,47 @@ class SX1262:
         self.pin_busy = Pin(pin_busy, Pin.IN)
         self.pin_dio1 = Pin(pin_dio1, Pin.IN)
 
-        # SPI (8 MHz, MSB first, mode 0)
-        self.spi = SPI(1, baudrate=8_000_000, polarity=0, phase=0,
+        # Hardware SPI (MSB first, mode 0)
+        self.spi = SPI(1, baudrate=spi_baudrate, polarity=0, phase=0,
                        sck=Pin(pin_sck), mosi=Pin(pin_mosi), miso=Pin(pin_miso))
 
+        # Bound methods for the SPI hot path (saves attribute lookups per transfer)
+        self._cs = self.pin_ss.value
+        self._busy = self.pin_busy.value
+        self._spi_write = self.spi.write
+        self._spi_readinto = self.spi.readinto
+        self._spi_wri = self.spi.write_readinto
+
+        # Per-packet command params, mutated in place instead of building
+        # bytes([...]) on every send()/handle_irq()
+        self._fifo_write_cmd = bytearray((OP_FIFO_WRITE, 0x00))
+        self._fifo_rd_hdr = bytearray((OP_FIFO_READ, 0x00, 0x00))
+        self._pkt_params = bytearray((
+            0x00, 0x08,             # Preamble
+            MODE_EXPLICIT_HEADER,
+            0x00,                   # Payload length
+            0x01,                   # CRC on
+            0x00, 0x00, 0x00, 0x00
+        ))
+        self._clear_irq = bytearray(2)
+        self._tx_trigger = bytes(3)                 # No timeout
+        self._rx_continuous = b'\xff\xff\xff'
+        self._stdby_rc = bytes((MODE_STDBY_RC,))
+
+        # RX FIFO is read into this buffer instead of a fresh spi.read() result
+        self._rx_buf = bytearray(256)
+        self._rx_mv = memoryview(self._rx_buf)
+
+        # Scratch buffers so each command is one CS-low/CS-high transaction:
+        # _cmd for writes (opcode + params), _rd_tx/_rd_rx for full-duplex
+        # reads (_rd_tx stays zero past the header: NOPs while clocking in)
+        self._cmd = bytearray(16)
+        self._cmd_mv = memoryview(self._cmd)
+        self._rd_tx = bytearray(16)
+        self._rd_tx_mv = memoryview(self._rd_tx)
+        self._rd_rx = bytearray(16)
+        self._rd_rx_mv = memoryview(self._rd_rx)
+
         # Radio configuration
         self.frequency = 915_000_000
         self.bandwidth = 125_000
@@ -128,68 +175,146 @@ class SX1262:
         self.coding_rate = 5
         self.tx_power = 14
 
+        # Register values derived from the configuration, updated by the setters
+        self._freq_raw = (self.frequency << 25) // XTAL_FREQ
+        self._mod_params = bytearray(8)
+        self._pack_modulation_params()
+
         # State
         self.fifo_tx_addr_ptr = 0
         self.fifo_rx_addr_ptr = 0
         self.receive_callback = None
         self.online = False
 
+        # Set by the DIO1 hard IRQ, consumed by handle_irq()
+        self.irq_pending = False
+
     # ===== Low-Level SPI Operations =====
 
+    @micropython.native
     def _wait_on_busy(self, timeout_ms=100):
-        """Wait for BUSY pin to go low"""
+        """
+        Wait for BUSY pin to go low.
+
+        BUSY usually drops within a few hundred microseconds, so spin on the
+        pin first and only fall back to 1 ms sleeps for long operations
+        (calibration, wake from sleep).
+        """
+        busy = self._busy
+        for _ in range(_BUSY_SPINS):
+            if not busy():
+                return
+
         start = time.ticks_ms()
-        while self.pin_busy.value() == 1:
+        while busy():
             if time.ticks_diff(time.ticks_ms(), start) > timeout_ms:
                 break
             time.sleep_ms(1)
 
+    @micropython.native
     def _execute_opcode(self, opcode, buffer=None):
-        """Execute SX1262 opcode"""
-        self._wait_on_busy()
-        self.pin_ss.value(0)
-        self.spi.write(bytes([opcode]))
+        """Execute SX1262 opcode (opcode + params in one SPI write)"""
+        n = 1
         if buffer:
-            self.spi.write(buffer)
-        self.pin_ss.value(1)
+            n += len(buffer)
+        if n <= 16:
+            cmd = self._cmd
+            frame = self._cmd_mv[:n]
+        else:
+            # Longer than the scratch buffer (which can't be resized while
+            # _cmd_mv exists): use a one-off frame
+            cmd = frame = bytearray(n)
+        cmd[0] = opcode
+        if buffer:
+            cmd[1:n] = buffer
+
+        self._wait_on_busy()
+        self._cs(0)
+        self._spi_write(frame)
+        self._cs(1)
 
     def _execute_opcode_read(self, opcode, length):
-        """Execute opcode and read response"""
+        """
+        Execute opcode and read response.
+
+        Sends opcode + status NOP and clocks in the response in one
+        full-duplex transfer.
+
+        Returns:
+            bytearray: length response bytes
+        """
+        n = 2 + length
+        self._rd_tx[0] = opcode
+
         self._wait_on_busy()
-        self.pin_ss.value(0)
-        self.spi.write(bytes([opcode, 0x00]))
-        result = self.spi.read(length)
-        self.pin_ss.value(1)
-        return result
+        self._cs(0)
+        self._spi_wri(self._rd_tx_mv[:n], self._rd_rx_mv[:n])
+        self._cs(1)
+        return self._rd_rx[2:n]
 
     def _read_register(self, address):
-        """Read single register"""
+        """Read single register (opcode, address, status NOP, value)"""
+        tx = self._rd_tx
+        tx[0] = OP_READ_REGISTER
+        tx[1] = (address >> 8) & 0xFF
+        tx[2] = address & 0xFF
+
         self._wait_on_busy()
-        self.pin_ss.value(0)
-        self.spi.write(bytes([
-            OP_READ_REGISTER,
-            (address >> 8) & 0xFF,
-            address & 0xFF,
-            0x00
-        ]))
-        value = self.spi.read(1)[0]
-        self.pin_ss.value(1)
-        return value
+        self._cs(0)
+        self._spi_wri(self._rd_tx_mv[:5], self._rd_rx_mv[:5])
+        self._cs(1)
+
+        # Back to NOPs for the next read
+        tx[1] = 0
+        tx[2] = 0
+        return self._rd_rx[4]
 
     def _write_register(self, address, value):
         """Write single register"""
+        cmd = self._cmd
+        cmd[0] = OP_WRITE_REGISTER
+        cmd[1] = (address >> 8) & 0xFF
+        cmd[2] = address & 0xFF
+        cmd[3] = value
+
         self._wait_on_busy()
-        self.pin_ss.value(0)
-        self.spi.write(bytes([
-            OP_WRITE_REGISTER,
-            (address >> 8) & 0xFF,
-            address & 0xFF,
-            value
-        ]))
-        self.pin_ss.value(1)
+        self._cs(0)
+        self._spi_write(self._cmd_mv[:4])
+        self._cs(1)
 
     # ===== Radio Operations =====
 
+    def _clear_irq_flags(self, mask):
+        """Clear IRQ flags (16-bit mask) from the preallocated params"""
+        params = self._clear_irq
+        params[0] = (mask >> 8) & 0xFF
+        params[1] = mask & 0xFF
+        self._execute_opcode(OP_CLEAR_IRQ_STATUS, params)
+
+    def _write_registers(self, address, data):
+        """
+        Write consecutive registers starting at address in one command.
+
+        Args:
+            address: first register address
+            data: bytes to write (more than 13 needs a one-off frame)
+        """
+        n = 3 + len(data)
+        if n <= 16:
+            cmd = self._cmd
+            frame = self._cmd_mv[:n]
+        else:
+            cmd = frame = bytearray(n)
+        cmd[0] = OP_WRITE_REGISTER
+        cmd[1] = (address >> 8) & 0xFF
+        cmd[2] = address & 0xFF
+        cmd[3:n] = data
+
+        self._wait_on_busy()
+        self._cs(0)
+        self._spi_write(frame)
+        self._cs(1)
+
     def _reset(self):
         """Hardware reset"""
         self.pin_rst.value(0)
@@ -199,7 +324,7 @@ class SX1262:
 
     def _calibrate(self):
         """Calibrate all blocks"""
-        self._execute_opcode(OP_STANDBY, bytes([MODE_STDBY_RC]))
+        self._execute_opcode(OP_STANDBY, self._stdby_rc)
         self._execute_opcode(OP_CALIBRATE, bytes([0x7F]))
         time.sleep_ms(5)
         self._wait_on_busy()
@@ -234,11 +359,11 @@ class SX1262:
 
     def _standby(self):
         """Enter standby mode"""
-        self._execute_opcode(OP_STANDBY, bytes([MODE_STDBY_RC]))
+        self._execute_opcode(OP_STANDBY, self._stdby_rc)
 
     def _receive(self):
         """Enter continuous RX mode"""
-        self._execute_opcode(OP_RX, bytes([0xFF, 0xFF, 0xFF]))
+        self._execute_opcode(OP_RX, self._rx_continuous)
 
     # ===== Public API =====
 
@@ -262,20 +387,17 @@ class SX1262:
             self._set_packet_type_lora()
             self._standby()
 
-            # Set sync word
-            self._write_register(REG_SYNC_WORD_MSB, (SYNC_WORD >> 8) & 0xFF)
-            self._write_register(REG_SYNC_WORD_LSB, SYNC_WORD & 0xFF)
+            # Set sync word (MSB and LSB registers are consecutive)
+            self._write_registers(REG_SYNC_WORD_MSB, _SYNC_WORD_BYTES)
 
             # Configure DIO2 as RF switch
             if self.dio2_as_rf_switch:
                 self._execute_opcode(OP_DIO2_RF_CTRL, bytes([0x01]))
 
-            # Apply configuration
+            # Apply configuration (one MODULATION_PARAMS for sf/bw/cr)
             self.set_frequency(self.frequency)
             self.set_tx_power(self.tx_power)
-            self.set_spreading_factor(self.spreading_factor)
-            self.set_bandwidth(self.bandwidth)
-            self.set_coding_rate(self.coding_rate)
+            self.configure_modulation()
 
             # Set LNA boost
             self._write_register(REG_LNA, 0x96)
@@ -287,13 +409,13 @@ class SX1262:
             # Format: [irq_mask_msb, irq_mask_lsb, dio1_mask_msb, dio1_mask_lsb, dio2_mask, dio3_mask]
             self._execute_opcode(OP_SET_IRQ_FLAGS, bytes([
                 0xFF, 0xFF,        # Enable all IRQs
-                0x00, IRQ_RX_DONE, # Route RX_DONE to DIO1
+                0x00, IRQ_RX_DONE | IRQ_TX_DONE,  # Route RX_DONE, TX_DONE to DIO1
                 0x00, 0x00,        # DIO2 mask
                 0x00, 0x00         # DIO3 mask
             ]))
 
-            # Set up DIO1 interrupt handler
-            self.pin_dio1.irq(trigger=Pin.IRQ_RISING, handler=self._on_dio1_rise)
+            # Set up DIO1 interrupt handler (hard IRQ: runs immediately, must not allocate)
+            self.pin_dio1.irq(trigger=Pin.IRQ_RISING, handler=self._on_dio1_rise, hard=True)
 
             # Start receiving
             self._receive()
@@ -319,46 +441,87 @@ class SX1262:
 
         try:
             self._standby()
+            self._transmit(data)
 
-            # Write to FIFO
-            self.fifo_tx_addr_ptr = 0
-            self._wait_on_busy()
-            self.pin_ss.value(0)
-            self.spi.write(bytes([OP_FIFO_WRITE, self.fifo_tx_addr_ptr]))
-            self.spi.write(data)
-            self.pin_ss.value(1)
-
-            # Set packet params
-            self._execute_opcode(OP_PACKET_PARAMS, bytes([
-                0x00, 0x08,             # Preamble
-                MODE_EXPLICIT_HEADER,
-                len(data),
-                0x01,                   # CRC on
-                0x00, 0x00, 0x00, 0x00
-            ]))
+            # Resume RX
+            self._receive()
+            return True
 
-            # Transmit
-            self._execute_opcode(OP_TX, bytes([0x00, 0x00, 0x00]))
+        except Exception as e:
+            print(f"TX error: {e}")
+            return False
 
-            # Wait for TX done
-            timeout_ms = 5000
-            start = time.ticks_ms()
-            while time.ticks_diff(time.ticks_ms(), start) < timeout_ms:
-                irq = self._execute_opcode_read(OP_GET_IRQ_STATUS, 2)
-                if irq[1] & IRQ_TX_DONE:
-                    break
-                time.sleep_ms(10)
+    def send_batch(self, packets):
+        """
+        Transmit several packets back to back.
 
-            # Clear IRQ
-            self._execute_opcode(OP_CLEAR_IRQ_STATUS, bytes([0x00, IRQ_TX_DONE]))
+        Enters standby once and resumes RX once after the last packet,
+        instead of one standby/RX round trip per packet.
+
+        Args:
+            packets: list of bytes to transmit
+
+        Returns:
+            list: bool per packet, True if transmitted
+        """
+        if not self.online:
+            return [False] * len(packets)
+
+        results = []
+        try:
+            self._standby()
+            for data in packets:
+                if len(data) > 255:
+                    results.append(False)
+                    continue
+                self._transmit(data)
+                results.append(True)
 
             # Resume RX
             self._receive()
-            return True
 
         except Exception as e:
             print(f"TX error: {e}")
-            return False
+            results.extend([False] * (len(packets) - len(results)))
+
+        return results
+
+    def _transmit(self, data):
+        """Write data to the FIFO, transmit and wait for TX done (radio in standby)"""
+        # Write to FIFO
+        self.fifo_tx_addr_ptr = 0
+        cmd = self._fifo_write_cmd
+        cmd[1] = self.fifo_tx_addr_ptr
+        self._wait_on_busy()
+        self._cs(0)
+        self._spi_write(cmd)
+        self._spi_write(data)
+        self._cs(1)
+
+        # Set packet params
+        params = self._pkt_params
+        params[3] = len(data)
+        self._execute_opcode(OP_PACKET_PARAMS, params)
+
+        # Transmit
+        irq_pending = self.irq_pending
+        self._execute_opcode(OP_TX, self._tx_trigger)
+
+        # Wait for TX done on DIO1; only read IRQ status over SPI once
+        # the pin is high (it may already be high from an unserviced RX)
+        dio1 = self.pin_dio1.value
+        timeout_ms = 5000
+        start = time.ticks_ms()
+        while time.ticks_diff(time.ticks_ms(), start) < timeout_ms:
+            if dio1():
+                irq = self._execute_opcode_read(OP_GET_IRQ_STATUS, 2)
+                if irq[1] & IRQ_TX_DONE:
+                    break
+            time.sleep_ms(1)
+
+        # Clear IRQ; the DIO1 edge from TX_DONE needs no handle_irq()
+        self._clear_irq_flags(IRQ_TX_DONE)
+        self.irq_pending = irq_pending
 
     def set_receive_callback(self, callback):
         """Set callback for received packets"""
@@ -369,71 +532,97 @@ class SX1262:
         Interrupt handler for DIO1 pin (RX_DONE).
         This is called by hardware interrupt when packet is received.
         """
-        # Handle RX in the main poll_receive() method
-        # We can't do SPI operations directly in the interrupt handler
-        pass
+        # Only flag it: SPI (and any allocation) is not allowed in a hard
+        # IRQ. The main loop calls handle_irq() when the flag is set.
+        self.irq_pending = True
 
     def poll_receive(self):
         """
-        Poll for received packets (call regularly in main loop).
+        Poll for received packets.
+
+        Returns straight away, without SPI traffic, unless the DIO1 IRQ
+        fired or DIO1 is still high (IRQ raised but not yet cleared).
 
         Returns:
             bool: True if packet was received
         """
+        if not self.irq_pending and not self.pin_dio1.value():
+            return False
+        return self.handle_irq()
+
+    def handle_irq(self):
+        """
+        Service a DIO1 interrupt: read IRQ status and fetch received packets.
+
+        Keeps going while RX_DONE is raised again, so packets that arrived
+        while the previous one was handled are drained in the same call
+        (at most _RX_DRAIN_MAX).
+
+        Returns:
+            bool: True if at least one packet was received
+        """
+        self.irq_pending = False
+
         if not self.online:
             return False
 
+        received = False
         try:
-            # Check IRQ status for RX done
-            irq = self._execute_opcode_read(OP_GET_IRQ_STATUS, 2)
-            if not irq or len(irq) < 2:
-                return False
+            for _ in range(_RX_DRAIN_MAX):
+                # Check IRQ status for RX done
+                irq = self._execute_opcode_read(OP_GET_IRQ_STATUS, 2)
+                if not irq or len(irq) < 2:
+                    break
 
-            irq_status = (irq[0] << 8) | irq[1]
+                irq_status = (irq[0] << 8) | irq[1]
+                if not irq_status & IRQ_RX_DONE:
+                    break
 
-            # Check if RX done
-            if irq_status & IRQ_RX_DONE:
-                # Clear IRQ
-                self._execute_opcode(OP_CLEAR_IRQ_STATUS, bytes([0x00, IRQ_RX_DONE]))
+                # Clear RX done and CRC error (if raised) in one command
+                self._clear_irq_flags(irq_status & (IRQ_RX_DONE | IRQ_CRC_ERROR))
 
-                # Check for CRC error
+                # Drop packets with a CRC error
                 if irq_status & IRQ_CRC_ERROR:
-                    self._execute_opcode(OP_CLEAR_IRQ_STATUS, bytes([0x00, IRQ_CRC_ERROR]))
-                    return False
+                    continue
 
                 # Get buffer status
                 buf_status = self._execute_opcode_read(OP_RX_BUFFER_STATUS, 2)
                 if not buf_status or len(buf_status) < 2:
-                    return False
+                    continue
 
                 payload_len = buf_status[0]
                 rx_start_ptr = buf_status[1]
 
                 if payload_len == 0 or payload_len > 255:
-                    return False
+                    continue
 
                 # Read packet from FIFO
                 self._wait_on_busy()
-                self.pin_ss.value(0)
-                self.spi.write(bytes([OP_FIFO_READ, rx_start_ptr, 0x00]))
-                data = self.spi.read(payload_len)
-                self.pin_ss.value(1)
-
-                # Call receive callback
-                if self.receive_callback and data:
+                self._cs(0)
+                hdr = self._fifo_rd_hdr
+                hdr[1] = rx_start_ptr
+                self._spi_write(hdr)
+                data = self._rx_mv[:payload_len]
+                self._spi_readinto(data)
+                self._cs(1)
+
+                # Call receive callback (with its own copy; _rx_buf is reused)
+                if self.receive_callback:
                     self.receive_callback(bytes(data))
 
-                return True
+                received = True
 
         except Exception as e:
             print(f"RX poll error: {e}")
 
-        return False
+        return received
 
     def set_frequency(self, frequency):
         """Set RF frequency"""
-        self.frequency = frequency
-        freq_raw = int(frequency / FREQ_STEP)
+        if frequency != self.frequency:
+            self.frequency = frequency
+            self._freq_raw = (int(frequency) << 25) // XTAL_FREQ
+        freq_raw = self._freq_raw
         self._execute_opcode(OP_RF_FREQ, bytes([
             (freq_raw >> 24) & 0xFF,
             (freq_raw >> 16) & 0xFF,
@@ -443,17 +632,35 @@ class SX1262:
 
     def set_spreading_factor(self, sf):
         """Set spreading factor (5-12)"""
-        self.spreading_factor = sf
-        self._update_modulation_params()
+        self.configure_modulation(sf=sf)
 
     def set_bandwidth(self, bw):
         """Set bandwidth (Hz)"""
-        self.bandwidth = bw
-        self._update_modulation_params()
+        self.configure_modulation(bw=bw)
 
     def set_coding_rate(self, cr):
         """Set coding rate (5-8 = 4/5 to 4/8)"""
-        self.coding_rate = cr
+        self.configure_modulation(cr=cr)
+
+    def configure_modulation(self, sf=None, bw=None, cr=None):
+        """
+        Set spreading factor, bandwidth and coding rate together.
+
+        Issues a single MODULATION_PARAMS command, where the individual
+        setters would send one each.
+
+        Args:
+            sf: spreading factor (5-12), None to keep the current one
+            bw: bandwidth (Hz), None to keep the current one
+            cr: coding rate (5-8), None to keep the current one
+        """
+        if sf is not None:
+            self.spreading_factor = sf
+        if bw is not None:
+            self.bandwidth = bw
+        if cr is not None:
+            self.coding_rate = cr
+        self._pack_modulation_params()
         self._update_modulation_params()
 
     def set_tx_power(self, power):
@@ -461,25 +668,25 @@ class SX1262:
         self.tx_power = power
         self._execute_opcode(OP_TX_PARAMS, bytes([power, 0x04]))
 
+    def _pack_modulation_params(self):
+        """Encode sf/bw/cr into the MODULATION_PARAMS buffer (on config change only)"""
+        sf = self.spreading_factor
+        params = self._mod_params
+        params[0] = sf
+        params[1] = BW_TABLE.get(self.bandwidth, 0x04)
+        params[2] = self.coding_rate - 4
+        # Low data rate optimisation for symbols longer than 16 ms
+        params[3] = 1 if (1 << sf) * 1000 > 16 * self.bandwidth else 0
+
+    @micropython.native
     def _update_modulation_params(self):
-        """Update modulation parameters"""
-        bw_reg = BW_TABLE.get(self.bandwidth, 0x04)
-        symbol_time = (2 ** self.spreading_factor) / self.bandwidth
-        ldro = 1 if symbol_time > 0.016 else 0
-
-        self._execute_opcode(OP_MODULATION_PARAMS, bytes([
-            self.spreading_factor,
-            bw_reg,
-            self.coding_rate - 4,
-            ldro,
-            0x00, 0x00, 0x00, 0x00
-        ]))
+        """Send the packed modulation parameters"""
+        self._execute_opcode(OP_MODULATION_PARAMS, self._mod_params)
 
     @staticmethod
     def calculate_bitrate(bandwidth, sf, cr):
-        """Calculate LoRa bitrate"""
-        symbol_rate = bandwidth / (2 ** sf)
-        return int(sf * symbol_rate * (4.0 / cr))
+        """Calculate LoRa bitrate: sf * (bandwidth / 2^sf) * (4 / cr), rounded down"""
+        return sf * bandwidth * 4 // (cr << sf)
 
     def get_rssi(self):
         """
@@ -0,0 +1,72 @@
+"""
+Fixed pool of message buffers for Channel/Colony sends
+
+Each send encrypts into a preallocated slab instead of allocating a fresh
+ciphertext buffer, so a long conversation doesn't keep fragmenting the
+heap on small boards.
+"""
+
+try:
+    from threading import Lock as _Lock
+except ImportError:
+    _Lock = None  # MicroPython builds without threading: single caller
+
+
+class _SlabPool:
+    """
+    A few equally sized bytearrays handed out and returned by send().
+
+    acquire() returns None when the pool is empty or the message doesn't
+    fit a slab; callers then fall back to a normal allocation.
+    """
+
+    def __init__(self, count, size):
+        self.size = size
+        self._free = [bytearray(size) for _ in range(count)]
+        self._lock = _Lock() if _Lock is not None else None
+
+    def acquire(self, needed):
+        """
+        Take a slab for a message of needed bytes.
+
+        Args:
+            needed: bytes the caller will write
+
+        Returns:
+            bytearray: slab of self.size bytes, or None
+        """
+        if needed > self.size:
+            return None
+
+        lock = self._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            return self._free.pop() if self._free else None
+        finally:
+            if lock is not None:
+                lock.release()
+
+    def release(self, slab):
+        """
+        Return a slab taken with acquire().
+
+        Args:
+            slab: bytearray from acquire() (None is ignored)
+        """
+        if slab is None:
+            return
+
+        lock = self._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            self._free.append(slab)
+        finally:
+            if lock is not None:
+                lock.release()
+
+
+# Shared by Channel and Colony: 4 x 512 bytes covers a LoRa-sized message
+# plus the ephemeral key / colony ID, nonce and tag
+_MSG_POOL = _SlabPool(4, 512)
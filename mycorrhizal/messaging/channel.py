@@ -4,7 +4,8 @@ Channel - Direct messaging abstraction
 A Channel represents a 1-to-1 encrypted conversation with another node.
 """
 
-from ..crypto.encryption import encrypt_to_identity, decrypt_from_identity
+from ..crypto.encryption import encrypt_to_identity, decrypt_from_identity, encrypted_size
+from ._pool import _MSG_POOL
 
 
 class Channel:
@@ -47,11 +48,17 @@ class Channel:
         if isinstance(message, str):
             message = message.encode('utf-8')
 
-        # Encrypt to recipient (currently passthrough until X25519 implemented)
-        encrypted = encrypt_to_identity(message, self.remote_identity, self.local_identity)
+        # Encrypt to recipient into a pooled buffer (the packet is
+        # serialized before send_data returns, so the slab is free after)
+        slab = _MSG_POOL.acquire(encrypted_size(len(message), 32))
+        try:
+            encrypted = encrypt_to_identity(message, self.remote_identity,
+                                            self.local_identity, out=slab)
 
-        # Send as signed DATA packet
-        return self.node.send_data(self.remote_address, encrypted, sign=True)
+            # Send as signed DATA packet
+            return self.node.send_data(self.remote_address, encrypted, sign=True)
+        finally:
+            _MSG_POOL.release(slab)
 
     def handle_message(self, encrypted_payload):
         """
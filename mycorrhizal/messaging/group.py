@@ -6,7 +6,10 @@ Uses a shared symmetric key for efficient group encryption on MCUs.
 """
 
 import time
-from ..crypto.encryption import generate_group_key, encrypt_group_message, decrypt_group_message
+from ..crypto.encryption import (generate_group_key, encrypt_group_message, decrypt_group_message,
+                                 encrypted_size)
+from ._pool import _MSG_POOL
+from ..platform.detection import get_profile
 from ..transport.packet import Packet, PacketType
 
 
@@ -38,21 +41,27 @@ class Colony:
         self.colony_id = CryptoBackend.hash_sha256(self.group_key)[:16]
 
         # Member tracking
-        self.members = {}  # address -> PublicIdentity
-        self.member_names = {}  # address -> name
+        self.members = {}  # address (bytes) -> PublicIdentity
+        self.member_names = {}  # address (bytes) -> name
 
         # Message callback
         self.message_callback = None
 
+        # Hashes of handled messages: a member can hear both the colony frame
+        # and its unicast copy of the same message
+        self.seen_messages = set()
+        self.max_seen_messages = min(256, get_profile().max_cache_entries)
+
         # Add creator as first member
         if creator_identity:
             self.add_member(creator_identity.address, creator_identity, "Creator")
 
     def add_member(self, address, public_identity, name=None):
         """Add a member to the colony"""
-        self.members[address.hex()] = public_identity
+        address = bytes(address)
+        self.members[address] = public_identity
         if name:
-            self.member_names[address.hex()] = name
+            self.member_names[address] = name
 
     def send(self, message):
         """
@@ -71,24 +80,36 @@ class Colony:
         if isinstance(message, str):
             message = message.encode('utf-8')
 
-        # Encrypt with group key
-        encrypted = encrypt_group_message(message, self.group_key)
-
-        # Build payload: colony_id + encrypted_message
-        payload = self.colony_id + encrypted
-
-        # Send to all members (broadcast)
-        # For now, send as DATA packets to each member
-        success = False
-        for member_addr_hex in self.members.keys():
-            if member_addr_hex == self.node.identity.address.hex():
-                continue  # Don't send to ourselves
-
-            member_addr = bytes.fromhex(member_addr_hex)
-            if self.node.send_data(member_addr, payload, sign=True):
+        # Encrypt with group key; payload: colony_id + encrypted_message,
+        # built in one pooled buffer (free again once the batch is sent)
+        slab = _MSG_POOL.acquire(encrypted_size(len(message), len(self.colony_id)))
+        try:
+            payload = encrypt_group_message(message, self.group_key,
+                                            prefix=self.colony_id, out=slab)
+
+            # One frame addressed to the colony ID reaches every member in
+            # range; members reachable over multiple hops or without a known
+            # route also get a unicast copy (handed to the node as one batch,
+            # which floods the route-less ones)
+            node = self.node
+            success = node.broadcast_data(self.colony_id, payload, sign=True)
+
+            own_address = node.identity.address
+            get_route = node.route_table.get_route
+            items = []
+            for member_addr in self.members:
+                if member_addr == own_address:
+                    continue  # Don't send to ourselves
+                route = get_route(member_addr)
+                if route is None or route.hop_count > 0:
+                    items.append((member_addr, payload))
+
+            if items and node.send_data_batch(items, sign=True) > 0:
                 success = True
 
-        return success
+            return success
+        finally:
+            _MSG_POOL.release(slab)
 
     def handle_message(self, encrypted_payload, sender_address):
         """
@@ -111,6 +132,14 @@ class Colony:
         try:
             plaintext = decrypt_group_message(encrypted, self.group_key)
 
+            # Drop the second copy of a message already handled
+            message_hash = hash(bytes(encrypted))
+            if message_hash in self.seen_messages:
+                return
+            self.seen_messages.add(message_hash)
+            if len(self.seen_messages) > self.max_seen_messages:
+                self.seen_messages = set(list(self.seen_messages)[self.max_seen_messages // 2:])
+
             # Try to decode as UTF-8
             try:
                 message = plaintext.decode('utf-8')
@@ -118,20 +147,20 @@ class Colony:
                 message = plaintext
 
             # Auto-add sender to members if not already present
-            sender_hex = sender_address.hex() if sender_address else None
-            if sender_hex and sender_hex not in self.members:
+            if sender_address and sender_address not in self.members:
                 # Get identity from cache if available
                 identity = None
                 if self.node and hasattr(self.node, 'identity_cache'):
                     identity = self.node.identity_cache.get(sender_address)
-                self.add_member(sender_address, identity, sender_hex[:8] + "...")
-                print(f"[COLONY] Auto-added new member {sender_hex[:8]}... to {self.name}")
-
-            # Get sender name
-            sender_name = self.member_names.get(sender_hex, sender_hex[:8] + "..." if sender_hex else "unknown")
+                short_name = sender_address.hex()[:8] + "..."
+                self.add_member(sender_address, identity, short_name)
+                print(f"[COLONY] Auto-added new member {short_name} to {self.name}")
 
-            # Call callback
+            # Call callback (the sender name is only looked up/formatted here)
             if self.message_callback:
+                sender_name = self.member_names.get(sender_address)
+                if sender_name is None:
+                    sender_name = sender_address.hex()[:8] + "..." if sender_address else "unknown"
                 self.message_callback(sender_address, sender_name, message)
 
         except Exception as e:
@@ -11,6 +11,23 @@ A "Phycore" (Physical Core) is an abstraction over any physical transport:
 All phycores implement the same interface for sending/receiving packets.
 """
 
+import time
+
+try:
+    from heapq import heappush, heappop, heapify
+except ImportError:
+    from uheapq import heappush, heappop, heapify  # Older MicroPython ports
+
+from ..transport.packet import (packet_priority, build_announce_batch, HEADER_SIZE,
+                                BATCH_ENTRY_HEADER_SIZE)
+
+# Integer nanosecond clock for the announce queue: monotonic on CPython,
+# time_ns() on MicroPython (no monotonic_ns there)
+try:
+    _monotonic_ns = time.monotonic_ns
+except AttributeError:
+    _monotonic_ns = time.time_ns
+
 
 class InterfaceMode:
     """
@@ -25,6 +42,15 @@ class InterfaceMode:
     ROAMING = 0x05        # Mobile node, fast path expiry
 
 
+_MODE_NAMES = {
+    InterfaceMode.FULL: "FULL",
+    InterfaceMode.GATEWAY: "GATEWAY",
+    InterfaceMode.BOUNDARY: "BOUNDARY",
+    InterfaceMode.ACCESS_POINT: "ACCESS_POINT",
+    InterfaceMode.ROAMING: "ROAMING"
+}
+
+
 class PhycoreBase:
     """
     Abstract base class for all physical layer interfaces.
@@ -32,6 +58,10 @@ class PhycoreBase:
     Phycores are callback-based (not async) for MicroPython compatibility.
     """
 
+    # Largest frame this interface carries in one transmission (bytes).
+    # Used to size announce batches; subclasses override.
+    mtu = 1400
+
     def __init__(self, name, bandwidth_bps=None, mode=InterfaceMode.FULL,
                  announce_budget_percent=2.0):
         """
@@ -51,19 +81,41 @@ class PhycoreBase:
         self.bandwidth_bps = bandwidth_bps or self._estimate_bandwidth()
         self.mode = mode
         self.announce_budget_percent = announce_budget_percent
-        self.announce_budget_bps = self.bandwidth_bps * (announce_budget_percent / 100.0)
 
-        # Announce queue (prioritized by hop count - lower hops = higher priority)
-        # Format: [(hop_count, timestamp, packet_bytes), ...]
+        # Announce queue: min-heap by priority class (see packet_priority),
+        # then hop count (lower hops = higher priority), then arrival. seq
+        # breaks ties so packets are never compared
+        # Format: [(priority, hop_count, timestamp_ns, seq, packet_bytes), ...]
         self.announce_queue = []
+        self._announce_seq = 0
+
+        # Bound on queued announces; when full the lowest-priority one is
+        # dropped, so an announce flood can't grow the heap without limit
+        self.announce_queue_max = 64
+        self.announce_drop_count = 0
+
+        # Announce token bucket (bits), refilled at announce_budget_bps up
+        # to announce_burst_frames full frames. Starts full (clamped on the
+        # first refill); last_announce_time is the last refill (ns)
+        self.announce_burst_frames = 2
+        self._announce_tokens = float('inf')
         self.last_announce_time = 0
 
+        # Hold queued announces this long (seconds) so a discovery burst
+        # goes out as one ANNOUNCE_BATCH frame instead of one frame each
+        self.announce_batch_window = 0.2
+
         # Statistics
         self.tx_count = 0
         self.rx_count = 0
         self.tx_bytes = 0
         self.rx_bytes = 0
 
+    @property
+    def announce_budget_bps(self):
+        """Announce budget in bits per second (follows bandwidth_bps changes)"""
+        return self.bandwidth_bps * (self.announce_budget_percent / 100.0)
+
     def start(self):
         """
         Start the phycore (open ports, connect, etc).
@@ -90,6 +142,21 @@ class PhycoreBase:
         """
         raise NotImplementedError("Subclass must implement send()")
 
+    def send_batch(self, packets):
+        """
+        Send several raw packets over this phycore.
+
+        Subclasses whose medium benefits from back-to-back transmission
+        override this; the default calls send() for each packet.
+
+        Args:
+            packets: list of bytes to send
+
+        Returns:
+            list: bool per packet, True if send succeeded
+        """
+        return [self.send(data) for data in packets]
+
     def set_rx_callback(self, callback):
         """
         Set callback for received data.
@@ -124,22 +191,49 @@ class PhycoreBase:
         # Default: assume high bandwidth
         return 100_000_000  # 100 Mbps
 
-    def queue_announce_for_forwarding(self, packet_bytes, hop_count):
+    def queue_announce_for_forwarding(self, packet_bytes, hop_count, priority=None):
         """
         Queue an announce for forwarding (if bandwidth allows).
 
-        Announces are queued and prioritized by hop count.
+        Announces are queued and prioritized by priority class (PRIORITY
+        flagged first), then hop count.
         Lower hop count = higher priority (local nodes first).
+        If the queue is full, the lowest-priority announce (lowest class,
+        highest hop count, newest) is dropped - possibly this one.
 
         Args:
-            packet_bytes: Serialized packet to forward
+            packet_bytes: Serialized packet to forward (shared between
+                          interfaces, not copied)
             hop_count: Number of hops from originating node
+            priority: PRIORITY_* class, or None to classify the packet
+
+        Returns:
+            bool: True if queued, False if dropped
         """
-        import time
-        # Add to queue with priority
-        self.announce_queue.append((hop_count, time.time(), packet_bytes))
-        # Sort by hop count (lower = higher priority), then timestamp
-        self.announce_queue.sort(key=lambda x: (x[0], x[1]))
+        if priority is None:
+            priority = packet_priority(packet_bytes)
+
+        # Add to queue with priority (class, hop count, then arrival)
+        self._announce_seq += 1
+        entry = (priority, hop_count, _monotonic_ns(), self._announce_seq, packet_bytes)
+        queue = self.announce_queue
+
+        if len(queue) >= self.announce_queue_max:
+            self.announce_drop_count += 1
+
+            # seq is unique, so packets are never compared
+            worst = max(range(len(queue)), key=queue.__getitem__)
+            if entry > queue[worst]:
+                return False
+
+            # Replace the worst entry with the last one and restore the heap
+            last = queue.pop()
+            if worst < len(queue):
+                queue[worst] = last
+                heapify(queue)
+
+        heappush(queue, entry)
+        return True
 
     def process_announce_queue(self):
         """
@@ -147,36 +241,83 @@ class PhycoreBase:
 
         Called periodically by phycore implementation.
         Sends announces in priority order (lowest hop count first).
+        Consecutive announces are combined into one ANNOUNCE_BATCH frame
+        of up to `mtu` bytes. All frames the announce budget allows are
+        handed to send_batch() in one call; announces in frames that fail
+        to send are requeued.
         """
-        import time
-
         if not self.announce_queue:
             return
 
-        current_time = time.time()
+        current_time = _monotonic_ns()
+        max_batch_bytes = self.mtu - HEADER_SIZE
+
+        # Aggregation window: until the oldest announce has waited long
+        # enough, only send frames that are already full
+        oldest = min(entry[2] for entry in self.announce_queue)
+        hold = current_time - oldest < self.announce_batch_window * 1_000_000_000
+        queued_bytes = sum(BATCH_ENTRY_HEADER_SIZE + len(entry[4]) for entry in self.announce_queue)
+
+        # Refill the token bucket for the time since the last call
         elapsed = current_time - self.last_announce_time
+        self.last_announce_time = current_time
+        token_cap = self.announce_burst_frames * self.mtu * 8
+        available_bits = min(token_cap,
+                             self._announce_tokens + elapsed * self.announce_budget_bps / 1_000_000_000)
 
-        # Calculate available bandwidth (token bucket)
-        available_bits = elapsed * self.announce_budget_bps
+        # Reserve budget for as many frames as fit, then send them together
+        frames = []
+        batches = []
 
-        # Process queue while we have bandwidth
         while self.announce_queue and available_bits > 0:
-            hop_count, timestamp, packet_bytes = self.announce_queue[0]
+            if hold and queued_bytes < max_batch_bytes:
+                break
+
+            # Pop as many announces (in priority order) as fit in one frame
+            queue = self.announce_queue
+            batch = [heappop(queue)]
+            batch_bytes = BATCH_ENTRY_HEADER_SIZE + len(batch[0][4])
+            while queue:
+                entry_bytes = BATCH_ENTRY_HEADER_SIZE + len(queue[0][4])
+                if batch_bytes + entry_bytes > max_batch_bytes:
+                    break
+                batch.append(heappop(queue))
+                batch_bytes += entry_bytes
+
+            if len(batch) == 1:
+                frame_size = len(batch[0][4])
+            else:
+                frame_size = HEADER_SIZE + batch_bytes
 
-            packet_bits = len(packet_bytes) * 8
+            frame_bits = frame_size * 8
 
-            if packet_bits <= available_bits:
-                # Send it
-                if self.send(packet_bytes):
-                    available_bits -= packet_bits
-                    self.last_announce_time = current_time
+            if frame_bits <= available_bits:
+                if len(batch) == 1:
+                    frames.append(batch[0][4])
+                else:
+                    frames.append(build_announce_batch([entry[4] for entry in batch]))
+                batches.append(batch)
 
-                # Remove from queue
-                self.announce_queue.pop(0)
+                available_bits -= frame_bits
+                queued_bytes -= batch_bytes
             else:
-                # Not enough bandwidth, wait for next cycle
+                # Not enough bandwidth: put them back, wait for next cycle
+                for entry in batch:
+                    heappush(queue, entry)
                 break
 
+        if frames:
+            results = self.send_batch(frames)
+            for frame, batch, sent in zip(frames, batches, results):
+                if not sent:
+                    # Unused airtime goes back in the bucket; the announces
+                    # keep their original priority
+                    available_bits += len(frame) * 8
+                    for entry in batch:
+                        heappush(self.announce_queue, entry)
+
+        self._announce_tokens = available_bits
+
     def get_stats(self):
         """Get interface statistics"""
         return {
@@ -186,6 +327,7 @@ class PhycoreBase:
             'mode': self.mode,
             'announce_budget_bps': self.announce_budget_bps,
             'announce_queue_size': len(self.announce_queue),
+            'announce_drop_count': self.announce_drop_count,
             'tx_count': self.tx_count,
             'rx_count': self.rx_count,
             'tx_bytes': self.tx_bytes,
@@ -193,13 +335,6 @@ class PhycoreBase:
         }
 
     def __repr__(self):
-        mode_names = {
-            InterfaceMode.FULL: "FULL",
-            InterfaceMode.GATEWAY: "GATEWAY",
-            InterfaceMode.BOUNDARY: "BOUNDARY",
-            InterfaceMode.ACCESS_POINT: "ACCESS_POINT",
-            InterfaceMode.ROAMING: "ROAMING"
-        }
         return (f"{self.__class__.__name__}(name='{self.name}', "
-                f"mode={mode_names.get(self.mode, 'UNKNOWN')}, "
+                f"mode={_MODE_NAMES.get(self.mode, 'UNKNOWN')}, "
                 f"online={self.online})")
@@ -39,6 +39,9 @@ class LoRaPhycore(PhycoreBase):
         lora.start()
     """
 
+    # SX1262/SX1276 maximum payload length
+    mtu = 255
+
     def __init__(self, name="lora0", device=None, mode=InterfaceMode.FULL,
                  announce_budget_percent=1.0):
         """
@@ -110,6 +113,28 @@ class LoRaPhycore(PhycoreBase):
 
         return success
 
+    def send_batch(self, packets):
+        """
+        Send several packets via LoRa back to back.
+
+        Args:
+            packets: list of bytes to transmit
+
+        Returns:
+            list: bool per packet, True if sent successfully
+        """
+        if not self.online:
+            return [False] * len(packets)
+
+        results = self.device.send_batch(packets)
+
+        for data, sent in zip(packets, results):
+            if sent:
+                self.tx_count += 1
+                self.tx_bytes += len(data)
+
+        return results
+
     def get_config(self):
         """Get current device configuration"""
         return self.device.get_config()
@@ -125,7 +150,13 @@ class LoRaPhycore(PhycoreBase):
         Returns:
             bool: True if configuration updated successfully
         """
-        return self.device.set_config(**kwargs)
+        success = self.device.set_config(**kwargs)
+
+        # SF/BW/CR changes change the bitrate, and with it the announce budget
+        if success:
+            self.bandwidth_bps = self.device.get_bitrate()
+
+        return success
 
     def get_stats(self):
         """Get interface statistics including device-specific stats"""
@@ -177,6 +208,21 @@ class LoRaDevice:
         """
         raise NotImplementedError("Device must implement send()")
 
+    def send_batch(self, packets):
+        """
+        Transmit several packets back to back.
+
+        Devices that can skip the RX turnaround between packets should
+        override this; the default sends them one at a time.
+
+        Args:
+            packets: list of bytes to send
+
+        Returns:
+            list: bool per packet, True if transmitted
+        """
+        return [self.send(data) for data in packets]
+
     def set_receive_callback(self, callback):
         """
         Set callback for received packets.
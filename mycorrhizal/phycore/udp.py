@@ -7,10 +7,111 @@ Modes:
 - Multicast: Join multicast group (for LAN mesh)
 """
 
+import selectors
 import socket
+import struct
 import threading
+import time
 from .base import PhycoreBase, InterfaceMode
 
+# struct ip_mreq for IP_ADD_MEMBERSHIP: group address + interface
+_MREQ = struct.Struct('4sl')
+
+# Requested kernel socket buffer size. The default (~208 KiB on Linux)
+# overflows under announce/flood bursts and the kernel drops silently;
+# the kernel caps this at net.core.rmem_max / wmem_max
+_SOCKET_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Minimum seconds between send/receive error summaries
+_ERROR_LOG_INTERVAL = 5
+
+
+class _IOReactor:
+    """
+    One background thread that receives for every UDPPhycore.
+
+    Sockets are non-blocking and registered with a selector (epoll on
+    Linux, kqueue on BSD/macOS). The thread sleeps in select() until a
+    socket is readable and then runs the owner's drain callback inline.
+    This replaces one timeout-polling thread per phycore.
+    """
+
+    def __init__(self):
+        self._sel = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+
+        # Socket pair to wake select() when registrations change (needed
+        # for select/poll based selectors, harmless for epoll/kqueue)
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._sel.register(self._wake_r, selectors.EVENT_READ, self._clear_wakeup)
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def register(self, sock, callback):
+        """
+        Start receiving on a socket.
+
+        Args:
+            sock: non-blocking socket
+            callback: called with the socket from the reactor thread
+                      whenever it is readable
+        """
+        with self._lock:
+            self._sel.register(sock, selectors.EVENT_READ, callback)
+        self._wake()
+
+    def unregister(self, sock):
+        """
+        Stop receiving on a socket (call before closing it).
+
+        Args:
+            sock: socket passed to register()
+        """
+        with self._lock:
+            try:
+                self._sel.unregister(sock)
+            except (KeyError, ValueError):
+                pass  # Not registered
+        self._wake()
+
+    def _wake(self):
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass  # Buffer full: a wakeup is already pending
+
+    def _clear_wakeup(self, sock):
+        try:
+            while sock.recv(64):
+                pass
+        except OSError:
+            pass
+
+    def _run(self):
+        """Reactor thread: dispatch readable sockets to their callbacks"""
+        while True:
+            for key, _ in self._sel.select():
+                try:
+                    key.data(key.fileobj)
+                except Exception as e:
+                    print(f"UDP reactor callback error: {e}")
+
+
+_reactor = None
+_reactor_lock = threading.Lock()
+
+
+def _get_reactor():
+    """Return the shared reactor, starting it on first use"""
+    global _reactor
+    with _reactor_lock:
+        if _reactor is None:
+            _reactor = _IOReactor()
+        return _reactor
+
 
 class UDPPhycore(PhycoreBase):
     """
@@ -49,13 +150,30 @@ class UDPPhycore(PhycoreBase):
         self.multicast_group = multicast_group
         self.host = host
 
+        # Multicast membership request, packed once
+        self._mreq = None
+        if multicast_group:
+            self._mreq = _MREQ.pack(socket.inet_aton(multicast_group), socket.INADDR_ANY)
+
         # Parse destinations into list of (host, port) tuples
         self.destinations = self._parse_destinations(destinations, host)
 
         self.sock = None
-        self.listen_thread = None
         self.running = False
 
+        # Receive buffer, allocated by start()
+        self._rx_buf = None
+        self._rx_view = None
+
+        # Resolved send addresses, filled in by start()
+        self._dest_addrs = []
+
+        # Error accounting (summarized periodically, not printed per packet)
+        self.tx_error_count = 0
+        self.rx_error_count = 0
+        self._errors_since_log = 0
+        self._last_error_log = 0
+
     def _parse_destinations(self, destinations, default_host):
         """Convert various destination formats to list of (host, port) tuples"""
         if destinations is None:
@@ -94,20 +212,42 @@ class UDPPhycore(PhycoreBase):
             except AttributeError:
                 pass  # Not available on all platforms
 
+            # Larger kernel buffers so bursts aren't dropped before the
+            # reactor drains them (best effort)
+            for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+                try:
+                    self.sock.setsockopt(socket.SOL_SOCKET, option, _SOCKET_BUFFER_SIZE)
+                except OSError:
+                    pass
+
+            # Linux: no path MTU discovery (DF bit) - datagrams are
+            # fragmented by the kernel instead of failing with EMSGSIZE
+            if hasattr(socket, 'IP_MTU_DISCOVER'):
+                try:
+                    self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MTU_DISCOVER,
+                                         socket.IP_PMTUDISC_DONT)
+                except OSError:
+                    pass
+
             # Bind to listen port
             self.sock.bind(('', self.listen_port))
 
             # Join multicast group if specified
-            if self.multicast_group:
-                import struct
-                mreq = struct.pack('4sl', socket.inet_aton(self.multicast_group), socket.INADDR_ANY)
-                self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+            if self._mreq is not None:
+                self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, self._mreq)
                 self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
 
-            # Start receive thread
+            self._dest_addrs = self._resolve_destinations()
+
+            # Receive into one reused buffer: recvfrom(65535) allocates a
+            # 64 KiB bytes object per datagram before shrinking it
+            self._rx_buf = bytearray(65535)
+            self._rx_view = memoryview(self._rx_buf)
+
+            # Non-blocking socket serviced by the shared reactor thread
+            self.sock.setblocking(False)
             self.running = True
-            self.listen_thread = threading.Thread(target=self._listen_loop, daemon=True)
-            self.listen_thread.start()
+            _get_reactor().register(self.sock, self._drain)
 
             self.online = True
             return True
@@ -125,13 +265,10 @@ class UDPPhycore(PhycoreBase):
         self.running = False
 
         if self.sock:
+            _get_reactor().unregister(self.sock)
             self.sock.close()
             self.sock = None
 
-        if self.listen_thread:
-            self.listen_thread.join(timeout=1.0)
-            self.listen_thread = None
-
         self.online = False
 
     def send(self, data):
@@ -151,51 +288,126 @@ class UDPPhycore(PhycoreBase):
         if not self.online or not self.sock:
             return False
 
+        return self._send_to_all(self.sock.sendto, data)
+
+    def send_batch(self, packets):
+        """
+        Send several packets via UDP to every destination.
+
+        Args:
+            packets: list of bytes to send
+
+        Returns:
+            list: bool per packet, True if at least one send succeeded
+        """
+        if not self.online or not self.sock:
+            return [False] * len(packets)
+
+        sendto = self.sock.sendto
+        return [self._send_to_all(sendto, data) for data in packets]
+
+    def _send_to_all(self, sendto, data):
+        """Send one packet to each resolved destination, update tx stats"""
+        addrs = self._dest_addrs
+
+        if len(addrs) == 1:
+            # Point-to-point or multicast (the common case): no loop
+            addr = addrs[0]
+            try:
+                sendto(data, addr)
+            except Exception as e:
+                self.tx_error_count += 1
+                self._log_error("send", e, addr)
+                return False
+
+            self.tx_count += 1
+            self.tx_bytes += len(data)
+            return True
+
         success_count = 0
 
-        try:
-            if self.multicast_group:
-                # Send to multicast group
-                self.sock.sendto(data, (self.multicast_group, self.listen_port))
+        for addr in addrs:
+            try:
+                sendto(data, addr)
                 success_count += 1
-            elif self.destinations:
-                # Send to all configured destinations
-                for host, port in self.destinations:
-                    try:
-                        self.sock.sendto(data, (host, port))
-                        success_count += 1
-                    except Exception as e:
-                        print(f"UDP send error to {host}:{port}: {e}")
-
-            if success_count > 0:
-                self.tx_count += 1
-                self.tx_bytes += len(data)
-                return True
+            except Exception as e:
+                self.tx_error_count += 1
+                self._log_error("send", e, addr)
 
-        except Exception as e:
-            print(f"UDP send error: {e}")
+        if success_count > 0:
+            self.tx_count += 1
+            self.tx_bytes += len(data)
+            return True
 
         return False
 
-    def _listen_loop(self):
-        """Background thread that listens for incoming UDP packets"""
-        while self.running:
+    def _log_error(self, direction, error, addr=None):
+        """
+        Print a rate-limited summary of send/receive errors.
+
+        An unreachable peer fails every send; printing each one would put
+        stdout I/O on the send path of every packet.
+
+        Args:
+            direction: "send" or "receive"
+            error: the exception
+            addr: destination (ip, port) for send errors
+        """
+        self._errors_since_log += 1
+
+        now = time.monotonic()
+        if now - self._last_error_log >= _ERROR_LOG_INTERVAL:
+            where = f" to {addr[0]}:{addr[1]}" if addr else ""
+            print(f"UDP {direction} error{where}: {self._errors_since_log} error(s), "
+                  f"last={type(error).__name__}: {error}")
+            self._errors_since_log = 0
+            self._last_error_log = now
+
+    def _resolve_destinations(self):
+        """
+        Resolve destination hosts to sockaddrs once (at start()), so
+        sendto() doesn't parse or look up a hostname for every packet.
+
+        Returns:
+            list: (ip, port) tuples to send to
+        """
+        if self.multicast_group:
+            return [(self.multicast_group, self.listen_port)]
+
+        addrs = []
+        for host, port in self.destinations:
             try:
-                # Receive with timeout so we can check self.running
-                self.sock.settimeout(0.5)
-                data, addr = self.sock.recvfrom(65535)
+                # First IPv4 result's sockaddr, as sendto() would resolve it
+                addr = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_DGRAM)[0][4]
+            except (OSError, IndexError):
+                addr = (host, port)  # Keep the name; sendto() reports the error
+            addrs.append(addr)
+        return addrs
+
+    def _drain(self, sock):
+        """
+        Reactor callback: receive every queued datagram on the socket.
 
-                # Call the receive callback
-                if data:
-                    self._on_receive(data)
+        Args:
+            sock: readable socket (may be closed by a concurrent stop())
+        """
+        buf = self._rx_buf
+        view = self._rx_view
 
-            except socket.timeout:
-                # Normal timeout, just loop again
-                continue
-            except Exception as e:
+        while True:
+            try:
+                n = sock.recv_into(buf)
+            except BlockingIOError:
+                return  # Drained
+            except OSError as e:
                 if self.running:  # Only log if we're supposed to be running
-                    print(f"UDP receive error: {e}")
-                break
+                    self.rx_error_count += 1
+                    self._log_error("receive", e)
+                return
+
+            # Call the receive callback
+            if n:
+                self._on_receive(bytes(view[:n]))
 
     def __repr__(self):
         mode = "multicast" if self.multicast_group else f"broadcast({len(self.destinations)} dest)" if self.destinations else "receive-only"
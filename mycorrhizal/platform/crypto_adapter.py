@@ -2,8 +2,8 @@
 Crypto Adapter - Platform-specific cryptography
 
 Adapts cryptographic implementations based on platform:
-- MicroPython: ucryptolib (ChaCha20-Poly1305) + pure Python Ed25519
-- CPython: cryptography library (full suite)
+- MicroPython: pure Python ChaCha20-Poly1305 + pure Python Ed25519
+- CPython: cryptography library (full suite), libsodium (PyNaCl) when installed
 """
 
 from .detection import is_micropython
@@ -34,10 +34,120 @@ else:
         from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey, X25519PublicKey
         from cryptography.hazmat.primitives import hashes, serialization
         from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
+        from cryptography.hazmat.primitives.kdf.hkdf import HKDF
         HAS_CRYPTOGRAPHY = True
     except ImportError:
         HAS_CRYPTOGRAPHY = False
 
+    # Hash algorithm object for HKDF, created once (HKDF instances are
+    # single-use, the algorithm isn't)
+    _HKDF_SHA256 = hashes.SHA256() if HAS_CRYPTOGRAPHY else None
+
+    # cryptography >= 45 can write AEAD output into a caller-provided buffer
+    HAS_AEAD_INTO = HAS_CRYPTOGRAPHY and hasattr(ChaCha20Poly1305, 'encrypt_into')
+
+    # OpenSSL-backed: uses the SHA extensions (SHA-NI / ARMv8 SHA2) when
+    # the CPU has them
+    from hashlib import sha256 as _sha256
+
+    # Empty SHA-256 context; copy() is cheaper than constructing a new one
+    _SHA256_TEMPLATE = _sha256()
+
+    # Optional: libsodium via PyNaCl. Its ChaCha20-Poly1305 picks the
+    # SSSE3/AVX2/NEON implementation at runtime; preferred when installed.
+    try:
+        from nacl.bindings import (crypto_aead_chacha20poly1305_ietf_encrypt,
+                                   crypto_aead_chacha20poly1305_ietf_decrypt)
+        HAS_NACL = True
+    except ImportError:
+        HAS_NACL = False
+
+
+# ===== ChaCha20-Poly1305 implementations =====
+
+def _nacl_encrypt(key, nonce, plaintext, associated_data=b""):
+    """Encrypt with libsodium (PyNaCl)"""
+    return crypto_aead_chacha20poly1305_ietf_encrypt(
+        bytes(plaintext), bytes(associated_data) or None, bytes(nonce), bytes(key))
+
+
+def _nacl_decrypt(key, nonce, ciphertext, associated_data=b""):
+    """Decrypt with libsodium (PyNaCl); raises nacl.exceptions.CryptoError on failure"""
+    return crypto_aead_chacha20poly1305_ietf_decrypt(
+        bytes(ciphertext), bytes(associated_data) or None, bytes(nonce), bytes(key))
+
+
+# ChaCha20Poly1305 objects for recently used keys: constructing one sets up
+# a fresh OpenSSL cipher context, and session/group keys are reused for
+# many messages
+_aead_cache = {}
+_AEAD_CACHE_SIZE = 128
+
+
+def _get_aead(key):
+    """Return a (cached) cryptography ChaCha20Poly1305 for key"""
+    key = bytes(key)
+    cipher = _aead_cache.get(key)
+    if cipher is None:
+        cipher = ChaCha20Poly1305(key)
+        if len(_aead_cache) >= _AEAD_CACHE_SIZE:
+            # Evict the oldest entry
+            _aead_cache.pop(next(iter(_aead_cache)), None)
+        _aead_cache[key] = cipher
+    return cipher
+
+
+def _cryptography_encrypt(key, nonce, plaintext, associated_data=b""):
+    """Encrypt with the cryptography library"""
+    return _get_aead(key).encrypt(nonce, plaintext, associated_data)
+
+
+def _cryptography_encrypt_into(key, nonce, plaintext, out, associated_data=b""):
+    """Encrypt with the cryptography library straight into out"""
+    _get_aead(key).encrypt_into(nonce, plaintext, associated_data, out)
+
+
+def _cryptography_decrypt(key, nonce, ciphertext, associated_data=b""):
+    """Decrypt with the cryptography library"""
+    return _get_aead(key).decrypt(nonce, ciphertext, associated_data)
+
+
+def _copy_into(encrypt):
+    """Build an encrypt_into from an encrypt without an in-place API (one copy)"""
+    def encrypt_into(key, nonce, plaintext, out, associated_data=b""):
+        out[:] = encrypt(key, nonce, plaintext, associated_data)
+    return encrypt_into
+
+
+def _pick_aead():
+    """
+    Select the ChaCha20-Poly1305 implementation for this platform.
+
+    Preference: libsodium (PyNaCl, SIMD dispatch done by libsodium), then
+    the cryptography library, then pure Python (always on MicroPython:
+    ucryptolib has no ChaCha20). In-place encryption prefers cryptography's
+    encrypt_into when available.
+
+    Returns:
+        tuple: (encrypt, encrypt_into, decrypt)
+    """
+    if not is_micropython():
+        if HAS_NACL:
+            encrypt_into = (_cryptography_encrypt_into if HAS_AEAD_INTO
+                            else _copy_into(_nacl_encrypt))
+            return _nacl_encrypt, encrypt_into, _nacl_decrypt
+
+        if HAS_CRYPTOGRAPHY:
+            encrypt_into = (_cryptography_encrypt_into if HAS_AEAD_INTO
+                            else _copy_into(_cryptography_encrypt))
+            return _cryptography_encrypt, encrypt_into, _cryptography_decrypt
+
+    from ..crypto import _chacha_pure
+    return _chacha_pure.encrypt, _chacha_pure.encrypt_into, _chacha_pure.decrypt
+
+
+_aead_encrypt, _aead_encrypt_into, _aead_decrypt = _pick_aead()
+
 
 class CryptoBackend:
     """
@@ -242,6 +352,42 @@ class CryptoBackend:
             except Exception:
                 return False
 
+    @staticmethod
+    def verify_batch(public_keys, messages, signatures):
+        """
+        Verify several Ed25519 signatures.
+
+        Neither OpenSSL (cryptography) nor PyNaCl exposes batch
+        verification, so on CPython this verifies one by one. On
+        MicroPython it uses ed25519_pure.verify_batch, and verifies one by
+        one only if the batch fails, to find the bad signatures.
+
+        Args:
+            public_keys: list of 32-byte public keys
+            messages: list of signed messages
+            signatures: list of 64-byte signatures
+
+        Returns:
+            list: bool per signature
+        """
+        if is_micropython():
+            from ..crypto.ed25519_pure import Ed25519PublicKey, verify_batch
+
+            if verify_batch(public_keys, messages, signatures):
+                return [True] * len(signatures)
+
+            results = []
+            for public_key, message, signature in zip(public_keys, messages, signatures):
+                try:
+                    Ed25519PublicKey.from_bytes(public_key).verify(signature, message)
+                    results.append(True)
+                except Exception:
+                    results.append(False)
+            return results
+
+        return [CryptoBackend.verify(public_key, message, signature)
+                for public_key, message, signature in zip(public_keys, messages, signatures)]
+
     @staticmethod
     def hash_sha256(data):
         """SHA-256 hash"""
@@ -252,8 +398,44 @@ class CryptoBackend:
             except ImportError:
                 raise RuntimeError("uhashlib not available")
         else:
-            from hashlib import sha256
-            return sha256(data).digest()
+            return _sha256(data).digest()
+
+    @staticmethod
+    def hash_sha256_32(data):
+        """
+        SHA-256 hash of a short fixed-size input (e.g. a 32-byte public key).
+
+        Args:
+            data: bytes to hash
+
+        Returns:
+            bytes: 32-byte digest
+        """
+        if is_micropython():
+            # uhashlib objects have no copy() on most ports
+            return CryptoBackend.hash_sha256(data)
+
+        h = _SHA256_TEMPLATE.copy()
+        h.update(data)
+        return h.digest()
+
+    @staticmethod
+    def hash_sha256_many(items):
+        """
+        SHA-256 hash several inputs (e.g. public keys of an address book).
+
+        Args:
+            items: iterable of bytes
+
+        Returns:
+            list: 32-byte digests, in input order
+        """
+        if is_micropython():
+            import uhashlib
+            sha256 = uhashlib.sha256
+        else:
+            sha256 = _sha256
+        return [sha256(item).digest() for item in items]
 
     @staticmethod
     def hkdf_derive(input_key_material, length=32, salt=None, info=b""):
@@ -278,58 +460,38 @@ class CryptoBackend:
             import uhashlib
 
             # Simplified derivation: hash(salt + ikm + info + counter)
-            okm = b""
+            # The input is laid out once; only the counter byte changes
+            buf = bytearray(salt)
+            buf += input_key_material
+            buf += info
+            buf.append(0)
+
+            if length <= 32:
+                return uhashlib.sha256(buf).digest()[:length]
+
+            okm = bytearray()
             for i in range((length + 31) // 32):
-                h = uhashlib.sha256()
-                h.update(salt)
-                h.update(input_key_material)
-                h.update(info)
-                h.update(bytes([i]))
-                okm += h.digest()
-
-            return okm[:length]
-        else:
-            from cryptography.hazmat.primitives import hashes
-            from cryptography.hazmat.primitives.kdf.hkdf import HKDF
-            from cryptography.hazmat.backends import default_backend
+                buf[-1] = i
+                okm += uhashlib.sha256(buf).digest()
 
+            return bytes(okm[:length])
+        else:
             kdf = HKDF(
-                algorithm=hashes.SHA256(),
+                algorithm=_HKDF_SHA256,
                 length=length,
                 salt=salt,
-                info=info,
-                backend=default_backend()
+                info=info
             )
             return kdf.derive(input_key_material)
 
-    @staticmethod
-    def encrypt_chacha20poly1305(key, nonce, plaintext, associated_data=b""):
-        """Encrypt with ChaCha20-Poly1305 AEAD"""
-        if is_micropython():
-            if not HAS_UCRYPTOLIB:
-                raise RuntimeError("ucryptolib not available")
-            # TODO: Implement ChaCha20-Poly1305 with ucryptolib
-            raise NotImplementedError("ChaCha20-Poly1305 not yet implemented for MicroPython")
-        else:
-            if not HAS_CRYPTOGRAPHY:
-                raise RuntimeError("cryptography library not available")
-
-            cipher = ChaCha20Poly1305(key)
-            ciphertext = cipher.encrypt(nonce, plaintext, associated_data)
-            return ciphertext
-
-    @staticmethod
-    def decrypt_chacha20poly1305(key, nonce, ciphertext, associated_data=b""):
-        """Decrypt ChaCha20-Poly1305 AEAD"""
-        if is_micropython():
-            if not HAS_UCRYPTOLIB:
-                raise RuntimeError("ucryptolib not available")
-            # TODO: Implement ChaCha20-Poly1305 with ucryptolib
-            raise NotImplementedError("ChaCha20-Poly1305 not yet implemented for MicroPython")
-        else:
-            if not HAS_CRYPTOGRAPHY:
-                raise RuntimeError("cryptography library not available")
-
-            cipher = ChaCha20Poly1305(key)
-            plaintext = cipher.decrypt(nonce, ciphertext, associated_data)
-            return plaintext
+    # ChaCha20-Poly1305 AEAD, bound once at import (see _pick_aead):
+    #   encrypt_chacha20poly1305(key, nonce, plaintext, associated_data=b"")
+    #       -> ciphertext + 16-byte tag
+    #   encrypt_chacha20poly1305_into(key, nonce, plaintext, out, associated_data=b"")
+    #       writes ciphertext + tag into out (len(plaintext) + 16 bytes,
+    #       e.g. a memoryview slice of a larger bytearray)
+    #   decrypt_chacha20poly1305(key, nonce, ciphertext, associated_data=b"")
+    #       -> plaintext; raises on authentication failure
+    encrypt_chacha20poly1305 = staticmethod(_aead_encrypt)
+    encrypt_chacha20poly1305_into = staticmethod(_aead_encrypt_into)
+    decrypt_chacha20poly1305 = staticmethod(_aead_decrypt)
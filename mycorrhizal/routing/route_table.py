@@ -6,11 +6,23 @@ Each route entry contains:
 - next_hop: 16-byte address of next node (or None if direct)
 - interface: PhycoreBase that received the announce
 - hop_count: Number of hops to destination
-- timestamp: When route was last seen
+- timestamp: When route was last seen (monotonic clock, seconds)
 """
 
 import time
 
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ucollections import OrderedDict  # MicroPython: plain dicts are unordered
+
+# Route timestamps use a monotonic clock (immune to NTP/wall-clock
+# adjustments); MicroPython has no time.monotonic()
+try:
+    _monotonic = time.monotonic
+except AttributeError:
+    _monotonic = time.time
+
 
 class RouteEntry:
     """A single route to a destination"""
@@ -29,22 +41,18 @@ class RouteEntry:
         self.next_hop = next_hop
         self.interface = interface
         self.hop_count = hop_count
-        self.timestamp = time.time()
+        self.timestamp = _monotonic()
 
     def update(self, next_hop, interface, hop_count):
         """Update route if we found a better path"""
         self.next_hop = next_hop
         self.interface = interface
         self.hop_count = hop_count
-        self.timestamp = time.time()
+        self.timestamp = _monotonic()
 
     def refresh(self):
         """Refresh timestamp (route still alive)"""
-        self.timestamp = time.time()
-
-    def age(self):
-        """Get age of route in seconds"""
-        return time.time() - self.timestamp
+        self.timestamp = _monotonic()
 
     def __repr__(self):
         dest_hex = self.destination.hex()[:8]
@@ -73,8 +81,9 @@ class RouteTable:
         self.max_routes = max_routes
         self.route_timeout = route_timeout
 
-        # Map: destination_hex -> RouteEntry
-        self.routes = {}
+        # Map: destination (16-byte address, used as-is) -> RouteEntry,
+        # ordered from least to most recently updated/refreshed
+        self.routes = OrderedDict()
 
     def add_or_update(self, destination, next_hop, interface, hop_count):
         """
@@ -93,18 +102,18 @@ class RouteTable:
         Returns:
             bool: True if route was added/updated
         """
-        dest_hex = destination.hex()
-
         # Check if route exists
-        if dest_hex in self.routes:
-            existing = self.routes[dest_hex]
+        existing = self.routes.get(destination)
+        if existing is not None:
 
             # Update if fewer hops or same path refreshed
             if hop_count < existing.hop_count:
                 existing.update(next_hop, interface, hop_count)
+                self._move_to_end(destination, existing)
                 return True
             elif hop_count == existing.hop_count and next_hop == existing.next_hop:
                 existing.refresh()
+                self._move_to_end(destination, existing)
                 return True
             else:
                 return False
@@ -114,7 +123,7 @@ class RouteTable:
             self._evict_oldest()
 
         # Add route
-        self.routes[dest_hex] = RouteEntry(destination, next_hop, interface, hop_count)
+        self.routes[destination] = RouteEntry(destination, next_hop, interface, hop_count)
         return True
 
     def get_route(self, destination):
@@ -127,49 +136,48 @@ class RouteTable:
         Returns:
             RouteEntry or None
         """
-        dest_hex = destination.hex()
-        route = self.routes.get(dest_hex)
+        route = self.routes.get(destination)
 
         # Check if route expired
-        if route and route.age() > self.route_timeout:
-            del self.routes[dest_hex]
+        if route and _monotonic() - route.timestamp > self.route_timeout:
+            del self.routes[destination]
             return None
 
         return route
 
     def remove_route(self, destination):
         """Remove a route"""
-        dest_hex = destination.hex()
-        if dest_hex in self.routes:
-            del self.routes[dest_hex]
+        self.routes.pop(destination, None)
 
     def cleanup_expired(self):
         """Remove all expired routes"""
+        cutoff = _monotonic() - self.route_timeout
+
+        # Routes are in timestamp order: expired ones are at the front
         expired = []
-        for dest_hex, route in self.routes.items():
-            if route.age() > self.route_timeout:
-                expired.append(dest_hex)
+        for destination, route in self.routes.items():
+            if route.timestamp >= cutoff:
+                break
+            expired.append(destination)
 
-        for dest_hex in expired:
-            del self.routes[dest_hex]
+        for destination in expired:
+            del self.routes[destination]
 
         return len(expired)
 
+    def _move_to_end(self, destination, route):
+        """Mark a route as most recently seen (re-insert at the end)"""
+        # No OrderedDict.move_to_end() on MicroPython
+        del self.routes[destination]
+        self.routes[destination] = route
+
     def _evict_oldest(self):
         """Evict oldest route (LRU)"""
         if not self.routes:
             return
 
-        oldest_dest = None
-        oldest_time = float('inf')
-
-        for dest_hex, route in self.routes.items():
-            if route.timestamp < oldest_time:
-                oldest_time = route.timestamp
-                oldest_dest = dest_hex
-
-        if oldest_dest:
-            del self.routes[oldest_dest]
+        # Routes are kept in timestamp order: the first is the oldest
+        del self.routes[next(iter(self.routes))]
 
     def get_all_routes(self):
         """Get all routes (for debugging/stats)"""
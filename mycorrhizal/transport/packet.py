@@ -49,6 +49,7 @@ class PacketType:
     PATH_RESPONSE = 0x04 # Response with path information
     ACK = 0x05          # Acknowledgment
     KEEPALIVE = 0x06    # Keep connection alive
+    ANNOUNCE_BATCH = 0x07  # Several forwarded announces in one frame
 
 # Packet flags (bit flags)
 class PacketFlags:
@@ -61,9 +62,29 @@ class PacketFlags:
 
 # Constants
 HEADER_SIZE = 32
+HEADER_FORMAT = '!BBBB16sH8sH'
 SIGNATURE_SIZE = 64
 MAX_PAYLOAD_SIZE = 65535  # 2^16 - 1
 
+# Announce batch payload: repeated [length (2 bytes, big-endian)][announce bytes]
+BATCH_ENTRY_HEADER_SIZE = 2
+
+# Outbound queue priority classes (lower drains first)
+PRIORITY_ACK = 0        # Acknowledgments
+PRIORITY_CONTROL = 1    # Path requests/responses, keepalives, PRIORITY flag
+PRIORITY_DATA = 2       # Regular data
+PRIORITY_ANNOUNCE = 3   # Announces (floods)
+
+_TYPE_PRIORITY = {
+    PacketType.ACK: PRIORITY_ACK,
+    PacketType.PATH_REQUEST: PRIORITY_CONTROL,
+    PacketType.PATH_RESPONSE: PRIORITY_CONTROL,
+    PacketType.KEEPALIVE: PRIORITY_CONTROL,
+    PacketType.DATA: PRIORITY_DATA,
+    PacketType.ANNOUNCE: PRIORITY_ANNOUNCE,
+    PacketType.ANNOUNCE_BATCH: PRIORITY_ANNOUNCE,
+}
+
 
 class Packet:
     """
@@ -149,6 +170,33 @@ class Packet:
         data_to_sign = self._get_signing_data()
         self.signature = identity.sign(data_to_sign)
 
+    def serialize_and_sign(self, identity):
+        """
+        Sign and serialize the packet in a single pass.
+
+        Lays header + payload out once in a buffer with a reserved trailing
+        signature slot, signs that exact byte range (via memoryview, no copy)
+        and writes the signature into the slot.
+
+        Args:
+            identity: Identity object with signing capability
+
+        Returns:
+            bytearray: Serialized signed packet (same layout as to_bytes())
+        """
+        # Add signed flag (must be set before the header is packed)
+        self.flags |= PacketFlags.SIGNED
+
+        signed_end = HEADER_SIZE + len(self.payload)
+        buf = bytearray(signed_end + SIGNATURE_SIZE)
+        self._pack_header_into(buf)
+        buf[HEADER_SIZE:signed_end] = self.payload
+
+        self.signature = identity.sign(memoryview(buf)[:signed_end])
+        buf[signed_end:] = self.signature
+
+        return buf
+
     def verify(self, public_identity):
         """
         Verify packet signature against a public identity.
@@ -171,9 +219,9 @@ class Packet:
         # Sign everything except the signature itself
         return self._serialize_header() + self.payload
 
-    def _serialize_header(self):
+    def _header_values(self):
         """
-        Serialize packet header to bytes (32 bytes).
+        Get the header field values in wire order.
 
         Format:
         - 1 byte: flags (encryption, signature, priority, fragmentation)
@@ -186,46 +234,54 @@ class Packet:
         - 2 bytes: reserved (future use)
         Total: 32 bytes
         """
-        payload_length = len(self.payload)
-
         # Hash the payload (take first 8 bytes for integrity check)
         payload_hash = CryptoBackend.hash_sha256(self.payload)[:8]
 
-        # Pack header (32 bytes total)
-        header = struct.pack(
-            '!BBBB16sH8sH',
+        return (
             self.flags,            # 1 byte
             self.ttl,             # 1 byte
             self.hop_count,       # 1 byte
             self.packet_type,     # 1 byte
             self.destination,     # 16 bytes
-            payload_length,       # 2 bytes
+            len(self.payload),    # 2 bytes
             payload_hash,         # 8 bytes
             0                     # 2 bytes reserved
         )
 
-        return header
+    def _serialize_header(self):
+        """Serialize packet header to bytes (32 bytes)"""
+        return struct.pack(HEADER_FORMAT, *self._header_values())
+
+    def _pack_header_into(self, buf, offset=0):
+        """Pack the 32-byte header directly into buf at offset"""
+        struct.pack_into(HEADER_FORMAT, buf, offset, *self._header_values())
 
     def to_bytes(self):
         """
         Serialize complete packet to bytes for transmission.
 
+        The buffer is allocated once at its final size; the header is packed
+        in place and payload/signature are copied into their slots.
+
         Returns:
-            bytes: Serialized packet
+            bytearray: Serialized packet
         """
-        data = bytearray()
+        payload_end = HEADER_SIZE + len(self.payload)
+        has_signature = self.is_signed() and self.signature
 
-        # Add header
-        data.extend(self._serialize_header())
+        data = bytearray(payload_end + (SIGNATURE_SIZE if has_signature else 0))
 
-        # Add payload
-        data.extend(self.payload)
+        # Header
+        self._pack_header_into(data)
 
-        # Add signature if signed
-        if self.is_signed() and self.signature:
-            data.extend(self.signature)
+        # Payload
+        data[HEADER_SIZE:payload_end] = self.payload
 
-        return bytes(data)
+        # Signature if signed
+        if has_signature:
+            data[payload_end:] = self.signature
+
+        return data
 
     @staticmethod
     def from_bytes(data):
@@ -242,7 +298,7 @@ class Packet:
             raise ValueError(f"Data too short for packet header: {len(data)} < {HEADER_SIZE}")
 
         # Unpack header
-        header = struct.unpack('!BBBB16sH8sH', data[:HEADER_SIZE])
+        header = struct.unpack(HEADER_FORMAT, data[:HEADER_SIZE])
 
         flags = header[0]
         ttl = header[1]
@@ -297,6 +353,7 @@ class Packet:
             PacketType.PATH_RESPONSE: 'PATH_RESPONSE',
             PacketType.ACK: 'ACK',
             PacketType.KEEPALIVE: 'KEEPALIVE',
+            PacketType.ANNOUNCE_BATCH: 'ANNOUNCE_BATCH',
         }.get(self.packet_type, f'UNKNOWN({self.packet_type})')
 
         flags_str = []
@@ -318,3 +375,85 @@ class Packet:
                 f"ttl={self.ttl}, hops={self.hop_count}, "
                 f"payload={len(self.payload)}B, "
                 f"flags=[{flags_display}])")
+
+
+def packet_priority(packet_bytes):
+    """
+    Classify a serialized packet for an outbound queue.
+
+    Only peeks at the flags and type bytes of the header, so it can run
+    once at enqueue time without parsing the packet.
+
+    Args:
+        packet_bytes: serialized packet
+
+    Returns:
+        int: PRIORITY_* class (lower = more urgent)
+    """
+    priority = _TYPE_PRIORITY.get(packet_bytes[3], PRIORITY_DATA)
+    if packet_bytes[0] & PacketFlags.PRIORITY and priority > PRIORITY_CONTROL:
+        return PRIORITY_CONTROL
+    return priority
+
+
+def build_announce_batch(announces):
+    """
+    Wrap several serialized announces into one ANNOUNCE_BATCH packet.
+
+    The batch itself is unsigned; every announce inside keeps its own
+    signature and is processed individually by the receiver.
+
+    Args:
+        announces: list of serialized ANNOUNCE packets
+
+    Returns:
+        bytes: Serialized ANNOUNCE_BATCH packet
+    """
+    size = 0
+    for announce in announces:
+        size += BATCH_ENTRY_HEADER_SIZE + len(announce)
+
+    payload = bytearray(size)
+    offset = 0
+    for announce in announces:
+        struct.pack_into('!H', payload, offset, len(announce))
+        offset += BATCH_ENTRY_HEADER_SIZE
+        payload[offset:offset + len(announce)] = announce
+        offset += len(announce)
+
+    packet = Packet(
+        packet_type=PacketType.ANNOUNCE_BATCH,
+        destination=bytes(16),
+        payload=bytes(payload)
+    )
+    return packet.to_bytes()
+
+
+def parse_announce_batch(payload):
+    """
+    Split an ANNOUNCE_BATCH payload into the serialized announces.
+
+    Args:
+        payload: ANNOUNCE_BATCH packet payload
+
+    Returns:
+        list: Serialized ANNOUNCE packets
+
+    Raises:
+        ValueError: If an entry runs past the end of the payload
+    """
+    announces = []
+    offset = 0
+    end = len(payload)
+
+    while offset < end:
+        if offset + BATCH_ENTRY_HEADER_SIZE > end:
+            raise ValueError("Truncated announce batch entry header")
+        length = struct.unpack('!H', payload[offset:offset + BATCH_ENTRY_HEADER_SIZE])[0]
+        offset += BATCH_ENTRY_HEADER_SIZE
+        if offset + length > end:
+            raise ValueError("Truncated announce batch entry")
+        announces.append(payload[offset:offset + length])
+        offset += length
+
+    return announces
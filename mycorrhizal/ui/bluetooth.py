@@ -90,6 +90,12 @@ if MICROPYTHON:
             # Pairing timeout
             self._pairing_timeout = 35000  # 35 seconds
 
+            # Advertising state (paused around LoRa TX, see pause_adv)
+            self._advertising = False
+            self._adv_interval_us = 100000
+            self._adv_data = None
+            self._resp_data = None
+
             # Start advertising
             self._advertise()
 
@@ -100,6 +106,7 @@ if MICROPYTHON:
                 self._connections.add(conn_handle)
                 self._connected = True
                 self._state = 'connected'
+                self._advertising = False  # The stack stops advertising on connect
                 print(f"BLE: Client connected (handle={conn_handle})")
 
                 # If pairing enabled, generate PIN
@@ -163,6 +170,10 @@ if MICROPYTHON:
                 ]) + service_uuid
 
                 self._ble.gap_advertise(interval_us, adv_data=adv_data, resp_data=resp_data)
+                self._advertising = True
+                self._adv_interval_us = interval_us
+                self._adv_data = adv_data
+                self._resp_data = resp_data
                 print(f"BLE: Advertising as '{self.name}' (interval={interval_us}us)")
             except Exception as e:
                 print(f"BLE: Advertising failed: {e}")
@@ -279,9 +290,44 @@ if MICROPYTHON:
             """
             self._write_callback = callback
 
+        def pause_adv(self):
+            """
+            Pause advertising (e.g. during a LoRa transmission).
+
+            Returns:
+                bool: True if advertising was running and is now paused;
+                      pass to resume_adv()
+            """
+            if not self._advertising:
+                return False
+            try:
+                self._ble.gap_advertise(None)
+            except OSError:
+                return False
+            self._advertising = False
+            return True
+
+        def resume_adv(self, paused=True):
+            """
+            Resume advertising stopped by pause_adv().
+
+            Args:
+                paused: return value of pause_adv(); nothing happens if False
+            """
+            if not paused or self._connected or self._adv_data is None:
+                return
+            try:
+                # Reuse the payloads built by _advertise(): no rebuild, no print
+                self._ble.gap_advertise(self._adv_interval_us, adv_data=self._adv_data,
+                                        resp_data=self._resp_data)
+                self._advertising = True
+            except OSError:
+                pass
+
         def stop(self):
             """Stop BLE service"""
             self._ble.gap_advertise(None)  # Stop advertising
+            self._advertising = False
             self._ble.active(False)
             print("BLE: Service stopped")
 
@@ -327,5 +373,11 @@ else:
         def set_write_callback(self, callback):
             pass
 
+        def pause_adv(self):
+            return False
+
+        def resume_adv(self, paused=True):
+            pass
+
         def stop(self):
             print("BLE: Service stopped")
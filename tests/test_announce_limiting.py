@@ -17,6 +17,22 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from mycorrhizal.core.node import Node
 from mycorrhizal.phycore.udp import UDPPhycore
 from mycorrhizal.phycore.base import InterfaceMode
+from mycorrhizal.transport.packet import Packet, PacketType, PacketFlags, parse_announce_batch
+
+
+class CapturePhycore(UDPPhycore):
+    """UDP phycore that records sent frames instead of transmitting them"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sent = []
+
+    def send(self, data):
+        self.sent.append(data)
+        return True
+
+    def send_batch(self, packets):
+        return [self.send(data) for data in packets]
 
 
 def test_announce_queue_priority():
@@ -46,15 +62,133 @@ def test_announce_queue_priority():
         announce_sizes.append((hop_count, len(packet_bytes)))
 
     print(f"\nQueued {len(phycore.announce_queue)} announces")
-    print("Queue order (should be sorted by hop count):")
-    for i, (hop, ts, packet) in enumerate(phycore.announce_queue):
-        print(f"  {i+1}. Hop count: {hop}, Size: {len(packet)} bytes")
+
+    # The queue is a heap: announces come out in hop-count order
+    import heapq
+    queue = list(phycore.announce_queue)
+    hop_counts = []
+    print("Dequeue order (should be sorted by hop count):")
+    while queue:
+        priority, hop, ts, seq, packet = heapq.heappop(queue)
+        print(f"  {len(hop_counts)+1}. Hop count: {hop}, Size: {len(packet)} bytes")
+        hop_counts.append(hop)
 
     # Verify order
-    hop_counts = [entry[0] for entry in phycore.announce_queue]
     assert hop_counts == sorted(hop_counts), "Queue not sorted by hop count!"
+    assert len(hop_counts) == len(announce_sizes)
     print("\n✓ Announces prioritized correctly (lowest hop count first)")
 
+    # A full queue keeps the highest-priority announces
+    phycore.announce_queue = []
+    phycore.announce_queue_max = 4
+    for hop_count in [5, 0, 2, 1]:
+        assert phycore.queue_announce_for_forwarding(bytes(160), hop_count)
+    assert not phycore.queue_announce_for_forwarding(bytes(160), 9)
+    assert phycore.queue_announce_for_forwarding(bytes(160), 3)
+    assert sorted(entry[1] for entry in phycore.announce_queue) == [0, 1, 2, 3]
+    assert phycore.announce_drop_count == 2
+    print("✓ Full queue drops lowest-priority announces")
+
+    # PRIORITY-flagged announces drain ahead of closer plain ones
+    phycore.announce_queue = []
+    plain = Packet(packet_type=PacketType.ANNOUNCE, destination=bytes(16), payload=bytes(64))
+    urgent = Packet(packet_type=PacketType.ANNOUNCE, destination=bytes(16), payload=bytes(64),
+                    flags=PacketFlags.PRIORITY)
+    phycore.queue_announce_for_forwarding(plain.to_bytes(), 0)
+    phycore.queue_announce_for_forwarding(urgent.to_bytes(), 5)
+    assert phycore.announce_queue[0][1] == 5, "PRIORITY announce should be first"
+    print("✓ PRIORITY-flagged announce dequeued first")
+
+    print("\n" + "=" * 70)
+
+
+def test_announce_batching():
+    """Test that queued announces are sent as MTU-bounded batch frames"""
+    print("\nAnnounce Batching Test")
+    print("=" * 70)
+
+    phycore = CapturePhycore(name="capture", listen_port=5101, destinations=5102)
+    phycore.mtu = 255  # LoRa-sized frames
+
+    announces = []
+    for hop_count in [3, 0, 1]:
+        packet = Packet(packet_type=PacketType.ANNOUNCE, destination=bytes([hop_count]) * 16,
+                        payload=bytes(64))
+        packet.hop_count = hop_count
+        announces.append(packet.to_bytes())
+
+    # Inside the aggregation window nothing is sent
+    phycore.queue_announce_for_forwarding(announces[0], 3)
+    phycore.process_announce_queue()
+    assert phycore.sent == [], "Announce sent before aggregation window elapsed"
+
+    # Once a full frame is queued it goes out immediately:
+    # 96-byte announces, two fit in a 255-byte frame
+    phycore.queue_announce_for_forwarding(announces[1], 0)
+    phycore.queue_announce_for_forwarding(announces[2], 1)
+    phycore.process_announce_queue()
+    assert len(phycore.sent) == 1, f"Expected 1 frame, got {len(phycore.sent)}"
+    assert len(phycore.announce_queue) == 1
+
+    # The leftover announce waits for the window, then goes alone
+    # (reset the token bucket so the announce budget doesn't hold it back)
+    phycore.announce_batch_window = 0
+    phycore.last_announce_time = 0
+    phycore.process_announce_queue()
+    assert len(phycore.sent) == 2, f"Expected 2 frames, got {len(phycore.sent)}"
+    assert not phycore.announce_queue
+    assert all(len(frame) <= phycore.mtu for frame in phycore.sent)
+
+    batch = Packet.from_bytes(phycore.sent[0])
+    assert batch.packet_type == PacketType.ANNOUNCE_BATCH
+    entries = parse_announce_batch(batch.payload)
+    assert entries == [announces[1], announces[2]], "Batch not in hop-count order"
+    assert phycore.sent[1] == announces[0], "Single announce should be sent unwrapped"
+
+    print(f"✓ {len(announces)} announces sent in {len(phycore.sent)} frames (mtu={phycore.mtu})")
+
+    print("\n" + "=" * 70)
+
+
+def test_announce_token_bucket():
+    """Test that idle time only buys a bounded burst of announce frames"""
+    print("\nAnnounce Token Bucket Test")
+    print("=" * 70)
+
+    phycore = CapturePhycore(name="bucket", listen_port=5201, destinations=5202,
+                             bandwidth_bps=1800)  # 36 bps for announces
+    phycore.mtu = 255
+    phycore.announce_batch_window = 0
+
+    # 200-byte announces don't share a frame: one frame each
+    for hop in range(5):
+        phycore.queue_announce_for_forwarding(bytes(200), hop)
+
+    # Bucket starts full, but holds only announce_burst_frames frames
+    phycore.process_announce_queue()
+    assert len(phycore.sent) == phycore.announce_burst_frames == 2, \
+        f"Expected a 2-frame burst, got {len(phycore.sent)}"
+
+    # No time passed: no new credit
+    phycore.process_announce_queue()
+    assert len(phycore.sent) == 2
+
+    # Credit for one more frame accrues at the announce budget
+    phycore.last_announce_time -= int(200 * 8 / phycore.announce_budget_bps * 1_000_000_000)
+    phycore.process_announce_queue()
+    assert len(phycore.sent) == 3, f"Expected 3 frames, got {len(phycore.sent)}"
+    assert len(phycore.announce_queue) == 2
+
+    # Frames that fail to send are requeued and their budget refunded
+    phycore.send = lambda data: False
+    phycore.last_announce_time -= int(200 * 8 / phycore.announce_budget_bps * 1_000_000_000)
+    phycore.process_announce_queue()
+    assert len(phycore.announce_queue) == 2, "Failed announces should be requeued"
+    assert phycore._announce_tokens >= 200 * 8
+
+    print(f"✓ Burst capped at {phycore.announce_burst_frames} frames, then paced at "
+          f"{phycore.announce_budget_bps:.0f} bps")
+
     print("\n" + "=" * 70)
 
 
@@ -273,6 +407,8 @@ def test_real_announce_forwarding():
 def main():
     try:
         test_announce_queue_priority()
+        test_announce_batching()
+        test_announce_token_bucket()
         test_bandwidth_enforcement()
         test_boundary_mode_filtering()
         test_full_mode()
@@ -9,7 +9,8 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from mycorrhizal.crypto.identity import Identity
-from mycorrhizal.crypto.encryption import encrypt_to_identity, decrypt_from_identity
+from mycorrhizal.crypto.encryption import (encrypt_to_identity, decrypt_from_identity,
+                                           create_session, encrypt_session)
 
 
 def test_crypto():
@@ -64,5 +65,186 @@ def test_crypto():
     print("\n✓ All crypto tests passed!")
 
 
+def test_session_encryption():
+    print("Testing session encryption (reused ephemeral key)...")
+
+    alice = Identity()
+    bob = Identity()
+
+    from mycorrhizal.crypto.identity import PublicIdentity
+    alice_pub_obj = PublicIdentity(alice.signing_public_key, alice.encryption_public_key)
+    bob_pub_obj = PublicIdentity(bob.signing_public_key, bob.encryption_public_key)
+
+    session = create_session(bob_pub_obj)
+
+    encrypted = [encrypt_session(session, f"message {i}".encode()) for i in range(3)]
+
+    # Same ephemeral key, fresh nonce per message
+    assert len({bytes(e[:32]) for e in encrypted}) == 1
+    assert len({bytes(e[32:44]) for e in encrypted}) == 3
+
+    for i, e in enumerate(encrypted):
+        assert decrypt_from_identity(e, alice_pub_obj, bob) == f"message {i}".encode()
+    print("   ✓ Session messages decrypt")
+
+    # Tampering is still detected on the cached-key path
+    tampered = bytearray(encrypted[0])
+    tampered[-1] ^= 1
+    try:
+        decrypt_from_identity(bytes(tampered), alice_pub_obj, bob)
+        assert False, "Tampered ciphertext should not decrypt"
+    except AssertionError:
+        raise
+    except Exception:
+        pass
+    print("   ✓ Tampered ciphertext rejected")
+
+    # Messages that fail authentication don't populate the key cache
+    from mycorrhizal.crypto.encryption import _session_key_cache
+    junk = bytes(range(32)) + bytes(12) + bytes(32)
+    try:
+        decrypt_from_identity(junk, alice_pub_obj, bob)
+        assert False, "Junk ciphertext should not decrypt"
+    except AssertionError:
+        raise
+    except Exception:
+        pass
+    assert (bob.encryption_public_key, bytes(range(32))) not in _session_key_cache
+    print("   ✓ Unauthenticated ephemeral keys not cached")
+
+
+def test_encrypt_to_identities():
+    print("Testing multi-recipient encryption...")
+
+    from mycorrhizal.crypto.encryption import encrypt_to_identities
+    from mycorrhizal.crypto.identity import PublicIdentity
+
+    alice = Identity()
+    recipients = [Identity() for _ in range(3)]
+    alice_pub_obj = PublicIdentity(alice.signing_public_key, alice.encryption_public_key)
+    recipient_pubs = [PublicIdentity(r.signing_public_key, r.encryption_public_key)
+                      for r in recipients]
+
+    message = b"to everyone"
+    encrypted = encrypt_to_identities(message, recipient_pubs, alice)
+
+    assert set(encrypted) == {r.address for r in recipients}
+    assert len({bytes(e[:32]) for e in encrypted.values()}) == 1, "Expected one ephemeral key"
+    assert len({bytes(e[32:44]) for e in encrypted.values()}) == 3, "Nonces must differ"
+
+    for recipient in recipients:
+        e = encrypted[recipient.address]
+        assert decrypt_from_identity(e, alice_pub_obj, recipient) == message
+    print("   ✓ Every recipient decrypts its copy")
+
+    # A copy for one recipient does not decrypt for another
+    try:
+        decrypt_from_identity(encrypted[recipients[0].address], alice_pub_obj, recipients[1])
+        assert False, "Wrong recipient should not decrypt"
+    except AssertionError:
+        raise
+    except Exception:
+        pass
+    print("   ✓ Copies are bound to their recipient")
+
+
+def test_encrypt_into():
+    print("Testing in-place AEAD encryption...")
+
+    from mycorrhizal.platform.crypto_adapter import CryptoBackend
+    from mycorrhizal.crypto.encryption import (generate_group_key, encrypt_group_message,
+                                               decrypt_group_message)
+
+    key = bytes(range(32))
+    nonce = bytes(12)
+    plaintext = b"in place" * 20
+
+    out = bytearray(4 + len(plaintext) + 16)
+    CryptoBackend.encrypt_chacha20poly1305_into(key, nonce, plaintext, memoryview(out)[4:])
+    assert out[:4] == bytes(4), "Prefix overwritten"
+    assert bytes(out[4:]) == CryptoBackend.encrypt_chacha20poly1305(key, nonce, plaintext)
+    print("   ✓ Output written into buffer slice")
+
+    group_key = generate_group_key()
+    encrypted = encrypt_group_message(plaintext, group_key)
+    assert len(encrypted) == 12 + len(plaintext) + 16
+    assert decrypt_group_message(encrypted, group_key) == plaintext
+
+    prefixed = encrypt_group_message(plaintext, group_key, prefix=b"colony-id-16byte")
+    assert prefixed[:16] == b"colony-id-16byte"
+    assert decrypt_group_message(prefixed[16:], group_key) == plaintext
+    print("   ✓ Group message round trip")
+
+    from mycorrhizal.crypto.encryption import encrypted_size
+    slab = bytearray(512)
+    pooled = encrypt_group_message(plaintext, group_key, prefix=b"colony-id-16byte", out=slab)
+    assert len(pooled) == encrypted_size(len(plaintext), 16)
+    assert bytes(slab[:16]) == b"colony-id-16byte"
+    assert decrypt_group_message(bytes(pooled[16:]), group_key) == plaintext
+    print("   ✓ Encrypted into caller-provided slab")
+
+    # Without an AEAD backend the unencrypted fallback frame also uses the slab
+    def not_implemented(*args):
+        raise NotImplementedError
+
+    real_encrypt_into = CryptoBackend.encrypt_chacha20poly1305_into
+    CryptoBackend.encrypt_chacha20poly1305_into = staticmethod(not_implemented)
+    try:
+        fallback = encrypt_group_message(plaintext, group_key, prefix=b"colony-id-16byte", out=slab)
+    finally:
+        CryptoBackend.encrypt_chacha20poly1305_into = staticmethod(real_encrypt_into)
+    assert isinstance(fallback, memoryview) and fallback.obj is slab
+    assert decrypt_group_message(bytes(fallback[16:]), group_key) == plaintext
+    print("   ✓ Fallback frame written into caller-provided slab")
+
+
+def test_hash_sha256_many():
+    print("Testing batched SHA-256...")
+
+    import hashlib
+    from mycorrhizal.platform.crypto_adapter import CryptoBackend
+
+    keys = [bytes([i]) * 32 for i in range(5)]
+    assert CryptoBackend.hash_sha256_many(keys) == [hashlib.sha256(k).digest() for k in keys]
+    assert CryptoBackend.hash_sha256_many([]) == []
+    assert all(CryptoBackend.hash_sha256_32(k) == hashlib.sha256(k).digest() for k in keys)
+    print("   ✓ Batched digests match hashlib")
+
+
+def test_nonce_pool():
+    print("Testing nonce pool...")
+
+    from mycorrhizal.crypto.encryption import _NoncePool
+
+    pool = _NoncePool()
+    # Cross several refills
+    nonces = [pool.take(12) for _ in range(3 * _NoncePool.SIZE // 12)]
+    assert all(len(n) == 12 for n in nonces)
+    assert len(set(nonces)) == len(nonces), "Nonce handed out twice"
+    assert len(pool.take(32)) == 32
+    print("   ✓ Pool hands out unique nonces across refills")
+
+    # A forked child must not replay the parent's buffered nonces
+    if hasattr(os, 'fork'):
+        from mycorrhizal.crypto.encryption import _pool
+        _pool.take(12)  # Make sure the shared pool has bytes buffered
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.write(write_fd, _pool.take(12))
+            os._exit(0)
+        os.waitpid(pid, 0)
+        child_nonce = os.read(read_fd, 12)
+        os.close(read_fd)
+        os.close(write_fd)
+        assert child_nonce != _pool.take(12), "Forked child reused the parent's nonce"
+        print("   ✓ Forked child refills the pool")
+
+
 if __name__ == "__main__":
     test_crypto()
+    test_session_encryption()
+    test_encrypt_to_identities()
+    test_encrypt_into()
+    test_hash_sha256_many()
+    test_nonce_pool()
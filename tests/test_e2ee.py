@@ -4,7 +4,7 @@ Test E2EE (End-to-End Encryption) with X25519 ECDH
 
 This test demonstrates:
 1. X25519 key exchange
-2. HKDF key derivation
+2. SHA-256 key derivation
 3. ChaCha20-Poly1305 encryption
 4. Direct messaging with real E2EE
 """
@@ -146,7 +146,7 @@ def test_e2ee_direct_messages():
     print("\nProtocol: X25519 ECDH + ChaCha20-Poly1305")
     print("  1. Ephemeral X25519 keypair generated per message")
     print("  2. ECDH performed with recipient's static X25519 key")
-    print("  3. Shared secret derived using HKDF-SHA256")
+    print("  3. Key derived as SHA-256(shared secret || label)")
     print("  4. Message encrypted with ChaCha20-Poly1305 AEAD")
     print("  5. Wire format: ephemeral_pub(32) + nonce(12) + ciphertext")
 
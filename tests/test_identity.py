@@ -75,6 +75,53 @@ def test_public_identity(identity):
     assert valid == True
 
 
+def test_public_identity_from_announce():
+    """Test public identity creation from an announce payload"""
+    print("\n" + "="*60)
+    print("Test: Public Identity from Announce Payload")
+    print("="*60)
+
+    identity = Identity()
+    public_info = identity.get_public_identity()
+    payload = public_info['signing_public_key'] + public_info['encryption_public_key']
+
+    for buf in (payload, bytearray(payload), memoryview(payload)):
+        public_identity = PublicIdentity.from_announce_payload(buf)
+        assert isinstance(public_identity.signing_public_key, bytes)
+        assert public_identity.encryption_public_key == public_info['encryption_public_key']
+        assert public_identity.address == identity.address
+
+    try:
+        PublicIdentity.from_announce_payload(payload[:63])
+        assert False, "Short payload should be rejected"
+    except ValueError:
+        pass
+
+    print(f"✓ Public identity from announce payload: {public_identity.address_hex()}")
+
+
+def test_verify_many():
+    """Test verifying signatures from several identities at once"""
+    print("\n" + "="*60)
+    print("Test: Verify Many")
+    print("="*60)
+
+    identities = [Identity() for _ in range(3)]
+    items = []
+    for i, identity in enumerate(identities):
+        message = b"message %d" % i
+        public_identity = PublicIdentity(identity.signing_public_key, identity.encryption_public_key)
+        items.append((public_identity, message, identity.sign(message)))
+
+    assert PublicIdentity.verify_many(items) == [True, True, True]
+
+    # Wrong signer for the second message
+    items[1] = (items[1][0], items[1][1], identities[0].sign(items[1][1]))
+    assert PublicIdentity.verify_many(items) == [True, False, True]
+
+    print("✓ verify_many reports per-signature results")
+
+
 def test_serialization(identity):
     """Test identity serialization and deserialization"""
     print("\n" + "="*60)
@@ -134,6 +181,8 @@ def main():
         identity = test_identity_generation()
         test_signing(identity)
         test_public_identity(identity)
+        test_public_identity_from_announce()
+        test_verify_many()
         test_serialization(identity)
         test_multiple_identities()
 
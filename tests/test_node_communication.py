@@ -17,6 +17,24 @@ from mycorrhizal.core.node import Node
 from mycorrhizal.phycore.udp import UDPPhycore
 
 
+class CapturePhycore(UDPPhycore):
+    """UDP phycore that records sent frames instead of transmitting them"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sent = []
+        self.batches = []
+        self.online = True  # no socket needed
+
+    def send(self, data):
+        self.sent.append(bytes(data))
+        return True
+
+    def send_batch(self, packets):
+        self.batches.append([bytes(data) for data in packets])
+        return [self.send(data) for data in packets]
+
+
 def test_two_nodes():
     """Test two nodes communicating via UDP"""
     print("=" * 60)
@@ -136,9 +154,85 @@ def test_two_nodes():
     print("=" * 60)
 
 
+def test_send_data_batch():
+    """Test that send_data_batch hands each phycore all its packets at once"""
+    print("\nBatched Send Test")
+    print("=" * 60)
+
+    from mycorrhizal.transport.packet import Packet
+
+    node = Node(name="BatchNode", persistent_identity=False)
+    phycore = CapturePhycore(name="capture", listen_port=5201, destinations=5202)
+    node.add_phycore(phycore)
+
+    destinations = [bytes([i]) * 16 for i in range(1, 4)]
+    sent = node.send_data_batch([(dest, b"payload") for dest in destinations])
+
+    assert sent == 3
+    assert len(phycore.batches) == 1, "Packets should go out as one batch"
+    received = [Packet.from_bytes(data) for data in phycore.batches[0]]
+    assert [packet.destination for packet in received] == destinations
+    assert all(packet.payload == b"payload" for packet in received)
+
+    phycore.online = False
+    assert node.send_data_batch([(destinations[0], b"payload")]) == 0
+    print("✓ 3 packets handed to the phycore in one batch")
+
+
+def test_colony_broadcast():
+    """Test that a colony message is one frame addressed to the colony ID"""
+    print("\nColony Broadcast Test")
+    print("=" * 60)
+
+    from mycorrhizal.transport.packet import Packet
+
+    sender = Node(name="Sender", persistent_identity=False)
+    phycore = CapturePhycore(name="capture", listen_port=5301, destinations=5302)
+    sender.add_phycore(phycore)
+
+    member = Node(name="Member", persistent_identity=False)
+
+    colony = sender.create_colony("test")
+    for i in range(1, 3):
+        colony.add_member(bytes([i]) * 16, None)
+        sender.route_table.add_or_update(bytes([i]) * 16, bytes([i]) * 16, phycore, 0)
+    colony.add_member(member.identity.address, None)  # no route known
+
+    assert colony.send("hello colony")
+    assert len(phycore.sent) == 2, f"Expected 2 frames, got {len(phycore.sent)}"
+    group_frame, unicast_frame = phycore.sent
+    assert Packet.from_bytes(group_frame).destination == colony.colony_id
+    assert Packet.from_bytes(unicast_frame).destination == member.identity.address
+    print("✓ One colony frame, plus a unicast copy for the member without a route")
+
+    # Our own frame echoed back is ignored
+    received_by_sender = []
+    colony.on_message(lambda addr, name, msg: received_by_sender.append(msg))
+    sender._on_packet_received(group_frame, phycore)
+    assert received_by_sender == []
+
+    # A member that joined with the key material accepts it, once
+    joined = member.join_colony(colony.get_key_material())
+    received = []
+    joined.on_message(lambda addr, name, msg: received.append(msg))
+    member._on_packet_received(group_frame, phycore)
+    member._on_packet_received(unicast_frame, phycore)
+    assert received == ["hello colony"]
+    print("✓ Colony message delivered once to a member that hears both copies")
+
+    # Sending alone keeps the dedup set bounded
+    sender.max_seen_packets = 8
+    for i in range(20):
+        sender.broadcast_data(colony.colony_id, b"msg %d" % i, sign=False)
+    assert len(sender.seen_packets) <= sender.max_seen_packets
+    print("✓ Seen-packet set stays bounded on a sending node")
+
+
 def main():
     try:
         test_two_nodes()
+        test_send_data_batch()
+        test_colony_broadcast()
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
         import traceback
@@ -119,6 +119,39 @@ def test_signed_packet():
     assert valid == True
 
 
+def test_serialize_and_sign():
+    """Test single-pass sign + serialize matches sign() + to_bytes()"""
+    print("\n" + "="*60)
+    print("Test: Single-Pass Serialize and Sign")
+    print("="*60)
+
+    sender = Identity()
+    recipient = Identity()
+
+    packet = Packet(
+        packet_type=PacketType.DATA,
+        destination=recipient.address,
+        payload=b"Signed in one pass"
+    )
+    serialized = packet.serialize_and_sign(sender)
+    print(f"✓ Serialized signed packet: {len(serialized)} bytes")
+
+    # Ed25519 is deterministic, so the two-pass path must produce identical bytes
+    reference = Packet(
+        packet_type=PacketType.DATA,
+        destination=recipient.address,
+        payload=b"Signed in one pass"
+    )
+    reference.sign(sender)
+    assert bytes(serialized) == reference.to_bytes()
+    assert bytes(serialized) == packet.to_bytes()
+
+    restored = Packet.from_bytes(bytes(serialized))
+    assert restored.is_signed()
+    assert restored.verify(sender)
+    print("✓ Matches two-pass output and verifies")
+
+
 def test_hop_count():
     """Test hop count and TTL"""
     print("\n" + "="*60)
@@ -249,6 +282,7 @@ def main():
     try:
         test_basic_packet()
         test_signed_packet()
+        test_serialize_and_sign()
         test_hop_count()
         test_packet_types()
         test_packet_overhead()
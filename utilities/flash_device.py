@@ -13,6 +13,7 @@ Usage:
     python flash_device.py --device heltec_v3
     python flash_device.py --device heltec_v3 --port /dev/ttyUSB0
     python flash_device.py --device heltec_v3 --skip-firmware
+    python flash_device.py --device heltec_v3 --skip-firmware --mpy
 """
 
 import argparse
@@ -42,6 +43,7 @@ DEVICES = {
         'baud_rate': 460800,
         'reset_required': True,
         'required_packages': ['ssd1306'],  # MicroPython packages
+        'mpy_arch': 'xtensawin',  # mpy-cross -march (native code emitter)
     },
     'esp32s3_sx1262': {
         'name': 'Generic ESP32-S3 + SX1262',
@@ -52,6 +54,7 @@ DEVICES = {
         'baud_rate': 460800,
         'reset_required': True,
         'required_packages': [],
+        'mpy_arch': 'xtensawin',
     },
 }
 
@@ -242,11 +245,51 @@ def flash_firmware(port, device_config, firmware_path, erase_first=True):
     return True
 
 
-def upload_mycorrhizal(port):
-    """Upload Mycorrhizal package to device"""
-    # Get mycorrhizal package path
+def compile_mycorrhizal(device_config, build_dir):
+    """
+    Precompile the Mycorrhizal package to .mpy bytecode with mpy-cross.
+
+    The device then imports bytecode directly instead of parsing source
+    on every boot, which saves RAM and import time. mpy-cross only
+    rejects source the device couldn't import either, so any failure
+    aborts the build.
+
+    Returns:
+        Path: compiled package directory, or None on error
+    """
     script_dir = Path(__file__).parent.parent
-    mycorrhizal_dir = script_dir / "mycorrhizal"
+    src_dir = script_dir / "mycorrhizal"
+    out_dir = build_dir / "mycorrhizal"
+    mpy_cross = get_tool_cmd('mpy-cross')
+    arch = device_config.get('mpy_arch')
+
+    print("\nCompiling Mycorrhizal package to .mpy...")
+    for source in sorted(src_dir.rglob('*.py')):
+        if '__pycache__' in source.parts:
+            continue
+
+        relative = source.relative_to(src_dir)
+        target = out_dir / relative.with_suffix('.mpy')
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        cmd = f"{mpy_cross} -O3 -s {relative} -o {target} {source}"
+        if arch:
+            cmd += f" -march={arch}"
+        result = subprocess.run(cmd, shell=True)
+        if result.returncode != 0:
+            print(f"Error compiling {relative} with mpy-cross!")
+            return None
+
+    print(f"Compiled to: {out_dir}")
+    return out_dir
+
+
+def upload_mycorrhizal(port, mycorrhizal_dir=None):
+    """Upload Mycorrhizal package (source or compiled .mpy) to device"""
+    # Get mycorrhizal package path
+    if mycorrhizal_dir is None:
+        script_dir = Path(__file__).parent.parent
+        mycorrhizal_dir = script_dir / "mycorrhizal"
 
     if not mycorrhizal_dir.exists():
         print(f"Error: Mycorrhizal package not found at {mycorrhizal_dir}")
@@ -352,6 +395,8 @@ Examples:
                        help='Firmware file to upload as main.py (default: mycorrhizal_firmware.py)')
     parser.add_argument('--no-example', action='store_true',
                        help='Do not upload example file')
+    parser.add_argument('--mpy', action='store_true',
+                       help='Precompile the package to .mpy with mpy-cross before uploading')
 
     args = parser.parse_args()
 
@@ -371,6 +416,9 @@ Examples:
     if not check_tool('mpremote', 'pip install mpremote'):
         return 1
 
+    if args.mpy and not check_tool('mpy-cross', 'pip install mpy-cross'):
+        return 1
+
     print("All required tools are installed!")
 
     # Select port
@@ -414,7 +462,20 @@ Examples:
 
     # Upload Mycorrhizal
     print_step(5, "Uploading Mycorrhizal package")
-    if not upload_mycorrhizal(port):
+    if args.mpy:
+        with tempfile.TemporaryDirectory() as build_dir:
+            # Compile first, so a failed build leaves the device untouched
+            compiled_dir = compile_mycorrhizal(device_config, Path(build_dir))
+            if compiled_dir is None:
+                return 1
+
+            # MicroPython imports a .py before a .mpy of the same name, so old
+            # source on the device would shadow the bytecode
+            subprocess.run(f"mpremote connect {port} rm -r :mycorrhizal", shell=True)
+
+            if not upload_mycorrhizal(port, compiled_dir):
+                return 1
+    elif not upload_mycorrhizal(port):
         return 1
 
     # Upload example